@@ -0,0 +1,544 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Persistent cache of per-file check results so that warm runs only process changed files.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from i18n_check.utils import CWD_PATH, YAML_CONFIG_FILE_PATH
+
+try:
+    import fcntl
+
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import msvcrt
+
+except ImportError:
+    msvcrt = None  # type: ignore[assignment]
+
+CACHE_DIRECTORY_NAME = ".i18n-check-cache"
+# Note: Increment when the format of cached entries changes.
+CACHE_FORMAT_VERSION = 2
+PACKAGE_DIRECTORY = Path(__file__).parent
+
+# MARK: Versioning
+
+
+def hash_text(text: str | bytes | mmap.mmap) -> str:
+    """
+    Hash text for comparing file contents or other cache inputs.
+
+    Parameters
+    ----------
+    text : str | bytes | mmap.mmap
+        The text to hash, or its UTF-8 encoded bytes which have the same digest.
+
+    Returns
+    -------
+    str
+        The hexadecimal SHA-256 digest of the text.
+    """
+    if isinstance(text, str):
+        text = text.encode("utf-8")
+
+    return hashlib.sha256(text).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_package_source_hash() -> str:
+    """
+    Hash the source files of i18n-check so that the cache is reset by any change to them.
+
+    Notes
+    -----
+    The version of the package isn't used as it doesn't change for editable installs.
+
+    Returns
+    -------
+    str
+        The hexadecimal SHA-256 digest of the paths and contents of the Python files of the package.
+    """
+    source_hash = hashlib.sha256()
+    for file_path in sorted(PACKAGE_DIRECTORY.rglob("*.py")):
+        relative_path = file_path.relative_to(PACKAGE_DIRECTORY)
+        if relative_path.parts[0] == "test_frontends":
+            continue
+
+        source_hash.update(relative_path.as_posix().encode("utf-8") + b"\0")
+        source_hash.update(file_path.read_bytes() + b"\0")
+
+    return source_hash.hexdigest()
+
+
+def get_cache_version(config_file_path: str | Path = YAML_CONFIG_FILE_PATH) -> str:
+    """
+    Get the version of the cache given the configuration and the source of i18n-check.
+
+    Parameters
+    ----------
+    config_file_path : str | Path, default=YAML_CONFIG_FILE_PATH
+        The path to the i18n-check configuration file.
+
+    Returns
+    -------
+    str
+        A hash that changes whenever the cached results could be stale.
+    """
+    try:
+        config_contents = Path(config_file_path).read_text(encoding="utf-8")
+
+    except OSError:
+        config_contents = ""
+
+    return hash_text(
+        "\n".join(
+            [str(CACHE_FORMAT_VERSION), get_package_source_hash(), config_contents]
+        )
+    )
+
+
+# MARK: Result Cache
+
+
+class ResultCache:
+    """
+    Cache of results that are derived from the contents of single files.
+
+    Results are stored in a JSON file per namespace and are keyed by file path.
+    A result is reused if the mtime and size of the file are unchanged, or if its contents have the same hash.
+    Saving merges the changed entries into the cache files under a file lock so that processes running checks in parallel keep each other's results.
+
+    Parameters
+    ----------
+    directory : str | Path, default=.i18n-check-cache
+        The directory in which the cache files are stored.
+
+    version : str, optional
+        The version of the cache, with cache files of other versions being ignored.
+        Defaults to a hash of the configuration file and the i18n-check source files.
+
+    enabled : bool, default=True
+        Whether results are cached, with results always being computed if False.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = CWD_PATH / CACHE_DIRECTORY_NAME,
+        version: str | None = None,
+        enabled: bool = True,
+    ) -> None:
+        self.directory = Path(directory)
+        self.enabled = enabled
+        self._version = version
+
+        self._namespaces: dict[str, dict[str, Any]] = {}
+        # Note: The paths of the files whose entries changed in each namespace that needs to be written.
+        self._changed_files: dict[str, set[str]] = {}
+        # Note: Intermediates are computed in threads that share the cache, with results being computed outside of the lock.
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Get the state of the cache for pickling it to worker processes without its lock.
+
+        Returns
+        -------
+        dict[str, Any]
+            The attributes of the cache other than its lock.
+        """
+        return {k: v for k, v in self.__dict__.items() if k != "_lock"}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """
+        Restore the state of a pickled cache with a new lock.
+
+        Parameters
+        ----------
+        state : dict[str, Any]
+            The attributes of the cache other than its lock.
+        """
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> str:
+        """
+        The version of the cache, which is derived on first use.
+        """
+        if self._version is None:
+            self._version = get_cache_version()
+
+        return self._version
+
+    def _load_namespace(self, namespace: str, fingerprint: str) -> dict[str, Any]:
+        """
+        Load the entries of a namespace, discarding them if their version or fingerprint differs.
+
+        This is called with the lock of the cache held.
+
+        Parameters
+        ----------
+        namespace : str
+            The name of the group of results.
+
+        fingerprint : str
+            A hash of any inputs other than the file contents that the results depend on.
+
+        Returns
+        -------
+        dict[str, Any]
+            The cached entries of the namespace keyed by file path.
+        """
+        cached = self._namespaces.get(namespace)
+        if cached is None:
+            try:
+                cached = json.loads(
+                    (self.directory / f"{namespace}.json").read_text(encoding="utf-8")
+                )
+
+            except (OSError, ValueError):
+                cached = None
+
+            if not isinstance(cached, dict) or cached.get("version") != self.version:
+                cached = {"version": self.version, "fingerprint": fingerprint}
+
+            cached.setdefault("entries", {})
+            self._namespaces[namespace] = cached
+
+        if cached.get("fingerprint") != fingerprint:
+            cached["fingerprint"] = fingerprint
+            cached["entries"] = {}
+            self._changed_files[namespace] = set()
+
+        return cached["entries"]
+
+    def get(
+        self,
+        namespace: str,
+        file_path: str | Path,
+        compute: Callable[[Any], Any],
+        read: Callable[[str], str | bytes | mmap.mmap] | None = None,
+        fingerprint: str = "",
+    ) -> Any:
+        """
+        Get the result for a file, computing it from the file contents if it isn't cached.
+
+        Parameters
+        ----------
+        namespace : str
+            The name of the group of results, such as the check that computes them.
+
+        file_path : str | Path
+            The path to the file that the result is derived from.
+
+        compute : Callable[[Any], Any]
+            A function that derives a JSON serializable result from the contents of the file as they are returned by read.
+
+        read : Callable[[str], str | bytes | mmap.mmap], optional
+            A function that returns the contents of the file, with the file being read as text if not passed.
+
+        fingerprint : str, default=""
+            A hash of any inputs other than the file contents that the result depends on.
+
+        Returns
+        -------
+        Any
+            The result for the file as it would be returned by compute.
+        """
+        file_path = str(file_path)
+        if read is None:
+            read = _read_file
+
+        if not self.enabled:
+            return compute(read(file_path))
+
+        file_stat = os.stat(file_path)
+        stat_key = [file_stat.st_mtime_ns, file_stat.st_size]
+
+        with self._lock:
+            entries = self._load_namespace(namespace=namespace, fingerprint=fingerprint)
+            entry = entries.get(file_path)
+
+        if entry is not None and entry["stat"] == stat_key:
+            return entry["result"]
+
+        contents = read(file_path)
+        contents_hash = hash_text(contents)
+        if entry is None or entry["hash"] != contents_hash:
+            entry = {"hash": contents_hash, "result": compute(contents)}
+
+        # Note: The stat is updated when only the mtime changed so later runs skip hashing.
+        with self._lock:
+            entry["stat"] = stat_key
+            entries[file_path] = entry
+            self._changed_files.setdefault(namespace, set()).add(file_path)
+
+        return entry["result"]
+
+    def get_many(
+        self,
+        namespace: str,
+        file_paths: list[str],
+        compute_missing: Callable[
+            [list[tuple[str, str | None]]], dict[str, tuple[str, Any]]
+        ],
+        fingerprint: str = "",
+    ) -> dict[str, Any]:
+        """
+        Get the results for many files, computing those that aren't cached with one call so that they can be computed in parallel.
+
+        Parameters
+        ----------
+        namespace : str
+            The name of the group of results, such as the check that computes them.
+
+        file_paths : list[str]
+            The paths to the files that the results are derived from.
+
+        compute_missing : Callable[[list[tuple[str, str | None]]], dict[str, tuple[str, Any]]]
+            A function that's passed the paths of the files whose stats have changed with the hashes of their cached contents.
+            It returns the hash of the contents of each file and its result, which is ignored if the hash hasn't changed.
+
+        fingerprint : str, default=""
+            A hash of any inputs other than the file contents that the results depend on.
+
+        Returns
+        -------
+        dict[str, Any]
+            A dictionary where keys are file paths and values are their results.
+        """
+        if not self.enabled:
+            computed = compute_missing([(f, None) for f in file_paths])
+            return {f: computed[f][1] for f in file_paths}
+
+        stat_keys: dict[str, list[int]] = {}
+        for file_path in file_paths:
+            file_stat = os.stat(file_path)
+            stat_keys[file_path] = [file_stat.st_mtime_ns, file_stat.st_size]
+
+        results: dict[str, Any] = {}
+        missing: list[tuple[str, str | None]] = []
+        with self._lock:
+            entries = self._load_namespace(namespace=namespace, fingerprint=fingerprint)
+            for file_path in file_paths:
+                entry = entries.get(file_path)
+                if entry is not None and entry["stat"] == stat_keys[file_path]:
+                    results[file_path] = entry["result"]
+
+                else:
+                    missing.append((file_path, entry["hash"] if entry else None))
+
+        computed = compute_missing(missing) if missing else {}
+        with self._lock:
+            for file_path, cached_hash in missing:
+                contents_hash, result = computed[file_path]
+                entry = entries.get(file_path)
+                if entry is None or contents_hash != cached_hash:
+                    entry = {"hash": contents_hash, "result": result}
+
+                # Note: The stat is updated when only the mtime changed so later runs skip hashing.
+                entry["stat"] = stat_keys[file_path]
+                entries[file_path] = entry
+                results[file_path] = entry["result"]
+
+            if missing:
+                self._changed_files.setdefault(namespace, set()).update(
+                    f for f, _ in missing
+                )
+
+        return {f: results[f] for f in file_paths}
+
+    def save(self) -> None:
+        """
+        Write the namespaces that have changed to the cache directory.
+
+        The changed entries are merged into the entries that other processes have written since the namespace was loaded.
+        Entries of files that no longer exist are removed, and errors writing are ignored as the cache is an optimization.
+        """
+        with self._lock:
+            self._save_changed_namespaces()
+
+    def _save_changed_namespaces(self) -> None:
+        """
+        Write the namespaces that have changed to the cache directory with the lock of the cache held.
+        """
+        if not self.enabled or not self._changed_files:
+            return
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            gitignore_path = self.directory / ".gitignore"
+            if not gitignore_path.is_file():
+                gitignore_path.write_text(
+                    "# Created by i18n-check automatically.\n*\n", encoding="utf-8"
+                )
+
+            for namespace, changed_files in sorted(self._changed_files.items()):
+                with _lock_file(self.directory / f"{namespace}.lock"):
+                    self._merge_and_write_namespace(
+                        namespace=namespace, changed_files=changed_files
+                    )
+
+        except OSError:
+            pass
+
+        self._changed_files.clear()
+
+    def _merge_and_write_namespace(
+        self, namespace: str, changed_files: set[str]
+    ) -> None:
+        """
+        Merge the changed entries of a namespace into its cache file and write it with the file lock of the namespace held.
+
+        Parameters
+        ----------
+        namespace : str
+            The name of the group of results.
+
+        changed_files : set[str]
+            The paths of the files whose entries were computed since the namespace was loaded.
+        """
+        cached = self._namespaces[namespace]
+        namespace_path = self.directory / f"{namespace}.json"
+        try:
+            saved = json.loads(namespace_path.read_text(encoding="utf-8"))
+
+        except (OSError, ValueError):
+            saved = None
+
+        entries = {}
+        # Note: Entries written by other processes are only kept if they were computed for the same inputs.
+        if (
+            isinstance(saved, dict)
+            and saved.get("version") == cached["version"]
+            and saved.get("fingerprint") == cached["fingerprint"]
+            and isinstance(saved.get("entries"), dict)
+        ):
+            entries.update(saved["entries"])
+            entries.update({f: cached["entries"][f] for f in changed_files})
+
+        else:
+            entries.update(cached["entries"])
+
+        cached["entries"] = {f: e for f, e in entries.items() if os.path.isfile(f)}
+
+        # Note: Written to a temporary file first so parallel checks never read partial files.
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=self.directory,
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            json.dump(cached, f)
+
+        os.replace(f.name, namespace_path)
+
+
+@contextmanager
+def _lock_file(lock_path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a file so that only one process writes a cache file at a time.
+
+    Parameters
+    ----------
+    lock_path : Path
+        The path to the file to lock, which is created if it doesn't exist.
+
+    Returns
+    -------
+    Iterator[None]
+        A context in which the lock is held.
+
+    Notes
+    -----
+    The cache files are written without a lock on platforms that support neither fcntl nor msvcrt.
+    """
+    with open(lock_path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+        elif msvcrt is not None:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+        else:
+            yield
+
+
+def _read_file(file_path: str) -> str:
+    """
+    Read the contents of a file.
+
+    Parameters
+    ----------
+    file_path : str
+        The path to the file to read.
+
+    Returns
+    -------
+    str
+        The contents of the file.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+# MARK: Shared Cache
+
+_result_cache: ResultCache | None = None
+
+
+def get_result_cache() -> ResultCache:
+    """
+    Get the result cache that is shared by all checks in the current process.
+
+    Returns
+    -------
+    ResultCache
+        The shared result cache, which is created on first use.
+    """
+    global _result_cache
+
+    if _result_cache is None:
+        _result_cache = ResultCache()
+
+    return _result_cache
+
+
+def set_result_cache(cache: ResultCache | None) -> None:
+    """
+    Set the result cache that is shared by all checks in the current process.
+
+    Parameters
+    ----------
+    cache : ResultCache | None
+        The cache to share, or None to have a new cache created on next use.
+    """
+    global _result_cache
+
+    _result_cache = cache
@@ -0,0 +1,180 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Functions to derive the files that have changed in a git repository and the checks they affect.
+"""
+
+import subprocess
+from pathlib import Path
+
+from i18n_check.check.registry import CHECK_REGISTRY
+from i18n_check.utils import (
+    CWD_PATH,
+    YAML_CONFIG_FILE_PATH,
+    config_file_types_to_check,
+    config_i18n_directory,
+    config_i18n_src_file,
+    config_nonexistent_keys_search_dirs,
+    config_src_directory,
+)
+
+# MARK: Git
+
+
+def _run_git(git_args: list[str], cwd: str | Path) -> str:
+    """
+    Run a git command and return its output.
+
+    Parameters
+    ----------
+    git_args : list[str]
+        The arguments to pass to git.
+
+    cwd : str | Path
+        The directory to run git in.
+
+    Returns
+    -------
+    str
+        The standard output of the git command.
+
+    Raises
+    ------
+    ValueError
+        If git isn't installed or the command fails.
+    """
+    try:
+        result = subprocess.run(
+            ["git", *git_args],
+            cwd=cwd,
+            capture_output=True,
+            check=True,
+            encoding="utf-8",
+        )
+
+    except FileNotFoundError:
+        raise ValueError("git is not installed or is not on the PATH.")
+
+    except subprocess.CalledProcessError as e:
+        raise ValueError(
+            f"'git {' '.join(git_args)}' failed with error: {e.stderr.strip()}"
+        )
+
+    return result.stdout
+
+
+def get_changed_files(
+    ref: str | None = None, staged: bool = False, cwd: str | Path = CWD_PATH
+) -> list[Path]:
+    """
+    Get the files that have changed in the git repository of a directory.
+
+    Parameters
+    ----------
+    ref : str, optional
+        A git reference to compare the working tree to, with untracked files also being included.
+
+    staged : bool, optional, default=False
+        Whether to get the files that are staged for the next commit.
+
+    cwd : str | Path, default=CWD_PATH
+        A directory within the git repository.
+
+    Returns
+    -------
+    list[Path]
+        The resolved paths of the changed files, including those that have been deleted.
+
+    Raises
+    ------
+    ValueError
+        If neither a reference or staged are passed, or if git fails.
+    """
+    if not staged and ref is None:
+        raise ValueError("Either a git reference or staged must be passed.")
+
+    repo_root = Path(_run_git(["rev-parse", "--show-toplevel"], cwd=cwd).strip())
+
+    # Note: Renames are listed as a deletion and an addition so both paths are included.
+    diff_args = ["diff", "--name-only", "--no-renames", "-z"]
+    if staged:
+        changed_paths = _run_git([*diff_args, "--cached"], cwd=repo_root).split("\0")
+
+    else:
+        changed_paths = _run_git([*diff_args, ref, "--"], cwd=repo_root).split("\0")
+        changed_paths += _run_git(
+            ["ls-files", "--others", "--exclude-standard", "-z"], cwd=repo_root
+        ).split("\0")
+
+    return [(repo_root / p).resolve() for p in dict.fromkeys(changed_paths) if p]
+
+
+# MARK: Affected Checks
+
+
+def _is_within(path: Path, directory: Path) -> bool:
+    """
+    Derive whether a path is within a directory.
+
+    Parameters
+    ----------
+    path : Path
+        The path that might be within the directory.
+
+    directory : Path
+        The directory to check.
+
+    Returns
+    -------
+    bool
+        Whether the path is within the directory.
+    """
+    return path.is_relative_to(directory.resolve())
+
+
+def get_affected_check_names(
+    changed_files: list[Path], check_names: list[str]
+) -> list[str]:
+    """
+    Get the checks whose results could be changed by the changed files.
+
+    Parameters
+    ----------
+    changed_files : list[Path]
+        The resolved paths of the changed files.
+
+    check_names : list[str]
+        The names of the checks that could be ran.
+
+    Returns
+    -------
+    list[str]
+        The names of the checks that need to be ran in the order they were passed.
+
+    Notes
+    -----
+    All checks read the i18n-src file, so all checks are affected if it or the configuration file changes.
+    Otherwise source files only affect checks that read them and other JSON files in the i18n-dir only affect checks of locale files.
+    """
+    config_file = Path(YAML_CONFIG_FILE_PATH).resolve()
+    source_dirs = [config_src_directory, *config_nonexistent_keys_search_dirs]
+
+    source_changed = False
+    locale_changed = False
+    for f in changed_files:
+        if f in {config_file, config_i18n_src_file}:
+            return list(check_names)
+
+        if f.suffix == ".json" and _is_within(f, config_i18n_directory):
+            locale_changed = True
+
+        elif f.name.endswith(tuple(config_file_types_to_check)) and any(
+            _is_within(f, d) for d in source_dirs
+        ):
+            source_changed = True
+
+    return [
+        name
+        for name in check_names
+        if (source_changed and CHECK_REGISTRY[name].uses_source_corpus)
+        or (locale_changed and CHECK_REGISTRY[name].uses_locale_files)
+    ]
@@ -10,52 +10,210 @@ Run the following script in terminal:
 """
 
 import argparse
+import pickle
 import sys
+import time
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from functools import partial
+from dataclasses import dataclass
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.context import BaseContext
 from pathlib import Path
+from typing import Any
 
 from rich import print as rprint
 
-from i18n_check.check.alt_texts import alt_texts_check_and_fix
-from i18n_check.check.aria_labels import aria_labels_check_and_fix
-from i18n_check.check.key_formatting import (
-    invalid_key_formats_check_and_fix,
-    invalid_keys_by_format,
-)
-from i18n_check.check.key_naming import (
-    invalid_key_names_check_and_fix,
-    invalid_keys_by_name,
-)
-from i18n_check.check.missing_keys import missing_keys_check_and_fix
-from i18n_check.check.nested_files import nested_files_check
-from i18n_check.check.non_source_keys import non_source_keys_check, non_source_keys_dict
-from i18n_check.check.nonexistent_keys import (
-    all_used_i18n_keys,
-    nonexistent_keys_check_and_fix,
-)
-from i18n_check.check.repeat_keys import repeat_keys_check
-from i18n_check.check.repeat_values import (
-    json_repeat_value_counts,
-    repeat_value_error_report,
-    repeat_values_check,
-)
-from i18n_check.check.sorted_keys import sorted_keys_check_and_fix
-from i18n_check.check.unused_keys import unused_keys, unused_keys_check
-from i18n_check.utils import (
-    config_alt_texts_active,
-    config_aria_labels_active,
-    config_key_formatting_active,
-    config_key_naming_active,
-    config_missing_keys_active,
-    config_nested_files_active,
-    config_non_source_keys_active,
-    config_nonexistent_keys_active,
-    config_repeat_keys_active,
-    config_repeat_values_active,
-    config_sorted_keys_active,
-    config_unused_keys_active,
+from i18n_check.cache import ResultCache, get_result_cache, set_result_cache
+from i18n_check.changed_files import get_affected_check_names, get_changed_files
+from i18n_check.check.registry import CHECK_REGISTRY, run_check
+from i18n_check.corpus import SourceCorpus, set_source_corpus
+from i18n_check.extraction import set_jobs
+from i18n_check.file_writer import set_dry_run
+from i18n_check.intermediates import (
+    compute_intermediates,
+    get_intermediates,
+    set_intermediates,
 )
+from i18n_check.locale_store import LocaleStore, set_locale_store, set_stream_json
+from i18n_check.similarity import get_similarity_threshold, set_similarity_threshold
+
+# MARK: Workers
+
+
+@dataclass(frozen=True)
+class CheckRun:
+    """
+    The result of running a check in a worker process.
+
+    Parameters
+    ----------
+    name : str
+        The name of the check.
+
+    passed : bool
+        Whether the check was successful.
+
+    started_at : float
+        The time at which the worker started the check in seconds since the epoch.
+
+    duration : float
+        The number of seconds that the check took.
+    """
+
+    name: str
+    passed: bool
+    started_at: float
+    duration: float
+
+
+def _initialize_worker(
+    source_corpus: SourceCorpus | None,
+    locale_store: LocaleStore | None,
+    result_cache: ResultCache,
+    intermediates: dict[str, Any],
+) -> None:
+    """
+    Share the data of the main process with a worker process that runs checks.
+
+    Parameters
+    ----------
+    source_corpus : SourceCorpus | None
+        The source corpus that was read by the main process if any check uses it.
+
+    locale_store : LocaleStore | None
+        The locale store that was parsed by the main process if any check uses it.
+
+    result_cache : ResultCache
+        The result cache of the main process so that its settings apply to the workers.
+
+    intermediates : dict[str, Any]
+        The intermediate results that were computed by the main process.
+    """
+    set_source_corpus(source_corpus)
+    set_locale_store(locale_store)
+    set_result_cache(result_cache)
+    set_intermediates(intermediates)
+
+
+def _run_check_in_worker(
+    name: str,
+    fix: bool,
+    dry_run: bool = False,
+    stream_json: bool = False,
+    similarity_threshold: float | None = None,
+) -> CheckRun:
+    """
+    Run a check as one of all checks and time it.
+
+    Parameters
+    ----------
+    name : str
+        The name of the check to run.
+
+    fix : bool
+        Whether to automatically fix issues if the check allows it when all checks are ran.
+
+    dry_run : bool, default=False
+        Whether changes to files are printed as diffs rather than written.
+
+    stream_json : bool, default=False
+        Whether the key-value pairs of JSON files are streamed rather than loaded.
+
+    similarity_threshold : float, optional
+        The similarity from which values are reported as near-duplicates by the repeat-values check.
+
+    Returns
+    -------
+    CheckRun
+        Whether the check passed and when and for how long it ran.
+    """
+    set_dry_run(dry_run)
+    set_stream_json(stream_json)
+    # Note: Checks run in a pool of their own, so files are only searched in worker processes when the main process computes intermediates.
+    set_jobs(1)
+    set_similarity_threshold(similarity_threshold)
+
+    started_at = time.time()
+    start_time = time.perf_counter()
+
+    try:
+        passed = run_check(name, all_checks_enabled=True, fix=fix)
+
+    except ValueError:
+        passed = False
+
+    return CheckRun(
+        name=name,
+        passed=passed,
+        started_at=started_at,
+        duration=time.perf_counter() - start_time,
+    )
+
+
+def _get_pool_context() -> BaseContext:
+    """
+    Get the multiprocessing context for the process pool that runs the checks.
+
+    Returns
+    -------
+    BaseContext
+        The fork context where it's available and safe, and the default context otherwise.
+    """
+    # Note: Forked workers inherit the data of the main process without it being pickled.
+    # macOS is excluded as forking there is unsafe with system frameworks.
+    if sys.platform != "darwin" and "fork" in get_all_start_methods():
+        return get_context("fork")
+
+    return get_context()
+
+
+# MARK: Timings
+
+
+def _print_timings(
+    check_runs: list[CheckRun],
+    prepare_duration: float,
+    pool_started_at: float,
+    pickled_bytes: int | None,
+    pickling_duration: float,
+) -> None:
+    """
+    Print how long preparing shared data, starting the process pool and each check took.
+
+    Parameters
+    ----------
+    check_runs : list[CheckRun]
+        The results of the checks that were ran.
+
+    prepare_duration : float
+        The number of seconds taken to prepare the data shared with workers.
+
+    pool_started_at : float
+        The time at which the process pool was created in seconds since the epoch.
+
+    pickled_bytes : int | None
+        The size of the shared data pickled for each worker, or None if it was inherited via fork.
+
+    pickling_duration : float
+        The number of seconds taken to pickle the shared data once.
+    """
+    pool_startup = (
+        min(r.started_at for r in check_runs) - pool_started_at if check_runs else 0
+    )
+
+    timings_message = "\n[bold]⏱️  Timings:[/bold]"
+    timings_message += f"\n  Shared data preparation: {prepare_duration * 1000:.0f} ms"
+    timings_message += f"\n  Process pool startup: {pool_startup * 1000:.0f} ms"
+    if pickled_bytes is None:
+        timings_message += "\n  Pickling: none, shared data inherited via fork"
+
+    else:
+        timings_message += f"\n  Pickling: {pickling_duration * 1000:.0f} ms for {pickled_bytes / 1024:.0f} KiB per worker"
+
+    for r in sorted(check_runs, key=lambda r: r.duration, reverse=True):
+        timings_message += f"\n  {r.name}: {r.duration * 1000:.0f} ms"
+
+    rprint(timings_message)
+
 
 # MARK: Run All
 
@@ -94,139 +252,108 @@ def run_all_checks(args: argparse.Namespace) -> None:
     - Aria label punctuation validation
     - Alt text punctuation validation
     """
-    checks: list[partial[bool]] = []
-    check_names: list[str] = []
-
-    if config_key_formatting_active:
-        checks.append(
-            partial(
-                invalid_key_formats_check_and_fix,
-                invalid_keys_by_format=invalid_keys_by_format,
-                all_checks_enabled=True,
-            )
-        )
-        check_names.append("key-formatting")
-
-    if config_key_naming_active:
-        checks.append(
-            partial(
-                invalid_key_names_check_and_fix,
-                invalid_keys_by_name=invalid_keys_by_name,
-                all_checks_enabled=True,
-                fix=args.fix,
-            )
-        )
-        check_names.append("key-naming")
-
-    if config_nonexistent_keys_active:
-        # We don't allow fix in all checks mode.
-        checks.append(
-            partial(
-                nonexistent_keys_check_and_fix,
-                all_used_i18n_keys=all_used_i18n_keys,
-                all_checks_enabled=True,
-            )
-        )
-        check_names.append("nonexistent-keys")
+    # Note: Checks are passed to workers by name so that each derives only the data it needs.
+    check_names = [name for name, check in CHECK_REGISTRY.items() if check.active]
 
-    if config_unused_keys_active:
-        checks.append(
-            partial(unused_keys_check, unused_keys=unused_keys, all_checks_enabled=True)
-        )
-        check_names.append("unused-keys")
-
-    if config_non_source_keys_active:
-        checks.append(
-            partial(
-                non_source_keys_check,
-                non_source_keys_dict=non_source_keys_dict,
-                all_checks_enabled=True,
-            )
-        )
-        check_names.append("non-source-keys")
-
-    if config_repeat_keys_active:
-        checks.append(partial(repeat_keys_check, all_checks_enabled=True))
-        check_names.append("repeat-keys")
-
-    if config_repeat_values_active:
-        checks.append(
-            partial(
-                repeat_values_check,
-                json_repeat_value_counts=json_repeat_value_counts,
-                repeat_value_error_report=repeat_value_error_report,
-                all_checks_enabled=True,
-            )
-        )
-        check_names.append("repeat-values")
+    if Path(".i18n-check.yaml").is_file():
+        config_file_name = ".i18n-check.yaml"
+
+    else:
+        config_file_name = ".i18n-check.yml"
 
-    if config_sorted_keys_active:
-        checks.append(
-            partial(sorted_keys_check_and_fix, all_checks_enabled=True, fix=args.fix)
+    if len(check_names) < len(CHECK_REGISTRY):
+        rprint(
+            f"[yellow]⚠️  Note: Some checks are not enabled in the {config_file_name} configuration file and will be skipped.[/yellow]"
         )
-        check_names.append("sorted-keys")
 
-    if config_nested_files_active:
-        # Note: This check warns the user and doesn't raise an error, so no need for all_checks_enabled.
-        checks.append(partial(nested_files_check))
-        check_names.append("nested-files")
+    if args.changed_since or args.staged:
+        try:
+            changed_files = get_changed_files(
+                ref=args.changed_since, staged=args.staged
+            )
 
-    if config_missing_keys_active:
-        # We don't allow fix in all checks mode.
-        checks.append(partial(missing_keys_check_and_fix, all_checks_enabled=True))
-        check_names.append("missing-keys")
+        except ValueError as e:
+            rprint(f"[red]❌ i18n-check error: {e}[/red]")
+            sys.exit(1)
 
-    if config_aria_labels_active:
-        checks.append(
-            partial(aria_labels_check_and_fix, all_checks_enabled=True, fix=args.fix)
+        # Note: Unchanged files are still read, but their results come from the result cache.
+        check_names = get_affected_check_names(
+            changed_files=changed_files, check_names=check_names
         )
-        check_names.append("aria-labels")
+        if not check_names:
+            rprint(
+                "\n[green]✅ Success: No files that the i18n checks depend on have changed.[/green]"
+            )
+            return
 
-    if config_alt_texts_active:
-        checks.append(
-            partial(alt_texts_check_and_fix, all_checks_enabled=True, fix=args.fix)
+        rprint(
+            f"[yellow]⚠️  Note: Only running the {len(check_names)} i18n checks that could be affected by the {len(changed_files)} changed files.[/yellow]"
         )
-        check_names.append("alt-texts")
 
-    if Path(".i18n-check.yaml").is_file():
-        config_file_name = ".i18n-check.yaml"
-
-    else:
-        config_file_name = ".i18n-check.yml"
-
-    if not (
-        config_key_formatting_active
-        and config_key_naming_active
-        and config_nonexistent_keys_active
-        and config_unused_keys_active
-        and config_non_source_keys_active
-        and config_repeat_keys_active
-        and config_repeat_values_active
-        and config_sorted_keys_active
-        and config_nested_files_active
-        and config_missing_keys_active
-        and config_aria_labels_active
-        and config_alt_texts_active
-    ):
-        rprint(
-            f"[yellow]⚠️  Note: Some checks are not enabled in the {config_file_name} configuration file and will be skipped.[/yellow]"
+    # Compute the intermediates that checks share once here rather than in each worker process.
+    prepare_start_time = time.perf_counter()
+    compute_intermediates(
+        names=[i for name in check_names for i in CHECK_REGISTRY[name].intermediates]
+    )
+    # Note: Saved so workers don't each write the results cached while computing intermediates.
+    get_result_cache().save()
+
+    prepare_duration = time.perf_counter() - prepare_start_time
+
+    pool_context = _get_pool_context()
+    initializer = None
+    initargs: (
+        tuple[SourceCorpus | None, LocaleStore | None, ResultCache, dict[str, Any]]
+        | tuple[()]
+    ) = ()
+    pickled_bytes = None
+    pickling_duration = 0.0
+    if pool_context.get_start_method() != "fork":
+        initializer = _initialize_worker
+        intermediates = get_intermediates()
+        initargs = (
+            intermediates.get("source-files"),
+            intermediates.get("locale-files"),
+            get_result_cache(),
+            intermediates,
         )
 
-    check_results: list[bool] = []
-    with ProcessPoolExecutor() as executor:
+        if args.timings:
+            pickling_start_time = time.perf_counter()
+            pickled_bytes = len(pickle.dumps(initargs))
+            pickling_duration = time.perf_counter() - pickling_start_time
+
+    check_runs: list[CheckRun] = []
+    pool_started_at = time.time()
+    with ProcessPoolExecutor(
+        mp_context=pool_context, initializer=initializer, initargs=initargs
+    ) as executor:
         # Create a future for each check.
         futures = {
-            executor.submit(checks[i]): check_names[i] for i in range(len(checks))
+            executor.submit(
+                _run_check_in_worker,
+                name,
+                fix=args.fix,
+                dry_run=args.dry_run,
+                stream_json=args.stream_json,
+                similarity_threshold=get_similarity_threshold(),
+            ): name
+            for name in check_names
         }
 
         for future in as_completed(futures):
-            try:
-                result = future.result()
-                check_results.append(result)
-
-            except ValueError:
-                check_results.append(False)
+            check_runs.append(future.result())
+
+    if args.timings:
+        _print_timings(
+            check_runs=check_runs,
+            prepare_duration=prepare_duration,
+            pool_started_at=pool_started_at,
+            pickled_bytes=pickled_bytes,
+            pickling_duration=pickling_duration,
+        )
 
+    check_results = [r.passed for r in check_runs]
     if not all(check_results):
         failed_checks_count = check_results.count(False)
         check_or_checks = "check" if failed_checks_count == 1 else "checks"
@@ -18,12 +18,12 @@ from pathlib import Path
 
 from rich import print as rprint
 
+from i18n_check.locale_store import iter_locale_pairs
 from i18n_check.utils import (
     ALL_TERMINAL_PUNCTUATION,
     PATH_SEPARATOR,
     config_i18n_directory,
     get_all_json_files,
-    read_json_file,
     replace_text_in_file,
 )
 
@@ -50,10 +50,15 @@ def find_aria_label_punctuation_issues(
 
     aria_label_issues: dict[str, dict[str, dict[str, str]]] = {}
     for json_file in json_files:
-        json_file_dict = read_json_file(file_path=json_file)
+        # Note: Only matching keys are kept, with the last value of duplicate keys as when loading the file.
+        json_file_dict = {
+            key: value
+            for key, value in iter_locale_pairs(file_path=json_file)
+            if key.endswith("_aria_label")
+        }
 
         for key, value in json_file_dict.items():
-            if isinstance(value, str) and key.endswith("_aria_label"):
+            if isinstance(value, str):
                 stripped_value = value.rstrip()
 
                 # Aria labels should not have punctuation at either end.
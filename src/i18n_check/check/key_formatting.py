@@ -10,22 +10,21 @@ Run the following script in terminal:
 >>> i18n-check -kf -f  # to fix issues automatically
 """
 
-import json
 import re
 import sys
 
 from rich import print as rprint
 
-from i18n_check.check.key_naming import invalid_keys_key_file_dict
 from i18n_check.check.repeat_keys import check_file_keys_repeated
 from i18n_check.check.sorted_keys import check_file_keys_sorted
+from i18n_check.file_writer import write_json_file
+from i18n_check.intermediates import get_intermediate
 from i18n_check.utils import (
     collect_source_and_search_dir_files_to_fix,
     config_file_types_to_check,
     config_global_directories_to_skip,
     config_global_files_to_skip,
     config_i18n_directory,
-    config_i18n_src_file,
     config_key_formatting_regexes_to_ignore,
     config_nonexistent_keys_search_dirs,
     config_repeat_keys_active,
@@ -34,14 +33,9 @@ from i18n_check.utils import (
     get_all_json_files,
     is_valid_key,
     read_json_file,
-    replace_text_in_file,
+    replace_texts_in_files,
 )
 
-# MARK: Paths / Files
-
-i18n_src_dict = read_json_file(file_path=config_i18n_src_file)
-
-
 # MARK: Reduce Keys
 
 
@@ -196,9 +190,9 @@ Please reformat the following {key_or_keys} [current_key -> suggested_correction
         all_files_to_fix = json_files + files_to_fix
 
         # Replace each incorrect key with the corrected format.
-        for current, correct in invalid_keys_by_format.items():
-            for f in all_files_to_fix:
-                replace_text_in_file(path=f, old=current, new=correct)
+        replace_texts_in_files(
+            paths=all_files_to_fix, replacements=invalid_keys_by_format
+        )
 
         # Sort all locale files if the sorted-keys and repeat-keys checks are activated.
         if config_sorted_keys_active:
@@ -213,11 +207,7 @@ Please reformat the following {key_or_keys} [current_key -> suggested_correction
                     ):
                         sorted_locale_dict = dict(sorted(locale_dict.items()))
 
-                        with open(json_file, "w", encoding="utf-8") as lf:
-                            json.dump(
-                                sorted_locale_dict, lf, indent=2, ensure_ascii=False
-                            )
-                            lf.write("\n")
+                        write_json_file(file_path=json_file, data=sorted_locale_dict)
 
                     else:
                         rprint(
@@ -233,9 +223,19 @@ Please reformat the following {key_or_keys} [current_key -> suggested_correction
     return True
 
 
-# MARK: Variables
+# MARK: Check Data
 
-invalid_keys_by_format = audit_invalid_i18n_key_formats(
-    key_file_dict=invalid_keys_key_file_dict,
-    keys_to_ignore_regex=config_key_formatting_regexes_to_ignore,
-)
+
+def get_invalid_keys_by_format() -> dict[str, str]:
+    """
+    Derive the invalid key formats for the configured project.
+
+    Returns
+    -------
+    dict[str, str]
+        A dictionary mapping keys that are not formatted correctly to their suggested corrections.
+    """
+    return audit_invalid_i18n_key_formats(
+        key_file_dict=get_intermediate("key-files"),
+        keys_to_ignore_regex=config_key_formatting_regexes_to_ignore,
+    )
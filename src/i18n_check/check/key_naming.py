@@ -12,7 +12,6 @@ Run the following script in terminal:
 >>> i18n-check -kn -f  # to fix issues automatically
 """
 
-import json
 import re
 import sys
 from collections import defaultdict
@@ -22,14 +21,15 @@ from rich import print as rprint
 
 from i18n_check.check.repeat_keys import check_file_keys_repeated
 from i18n_check.check.sorted_keys import check_file_keys_sorted
+from i18n_check.corpus import get_source_corpus
+from i18n_check.file_writer import write_json_file
+from i18n_check.intermediates import get_intermediate, get_source_keys
 from i18n_check.utils import (
-    collect_files_to_check,
     collect_source_and_search_dir_files_to_fix,
     config_file_types_to_check,
     config_global_directories_to_skip,
     config_global_files_to_skip,
     config_i18n_directory,
-    config_i18n_src_file,
     config_key_naming_directories_to_skip,
     config_key_naming_files_to_skip,
     config_key_naming_regexes_to_ignore,
@@ -41,19 +41,16 @@ from i18n_check.utils import (
     get_all_json_files,
     path_to_valid_key,
     read_json_file,
-    replace_text_in_file,
+    replace_texts_in_files,
 )
 
-# MARK: Paths / Files
-
-i18n_src_dict = read_json_file(file_path=config_i18n_src_file)
-
 # MARK: Key-Files Dict
 
 
 def map_keys_to_files(
-    i18n_src_dict: dict[str, str] = i18n_src_dict,
+    i18n_src_dict: dict[str, str],
     src_directory: Path = config_src_directory,
+    file_keys: dict[str, list[str]] | None = None,
 ) -> dict[str, list[str]]:
     """
     Map i18n keys to the files they are used in.
@@ -66,38 +63,44 @@ def map_keys_to_files(
     src_directory : Path
         The source directory where the files are located.
 
+    file_keys : dict[str, list[str]], optional
+        The keys of i18n_src_dict that each file of the source corpus includes, such as from the shared "source-keys" intermediate.
+        The keys are extracted from the files with get_source_keys if not passed.
+
     Returns
     -------
     dict[str, list[str]]
         A dictionary where keys are i18n keys and values are lists of file paths where those keys are used.
     """
-    files_to_check = collect_files_to_check(
+    corpus = get_source_corpus()
+    files_to_check = corpus.files(
         directory=src_directory,
-        file_types_to_check=config_file_types_to_check,
         directories_to_skip=config_key_naming_directories_to_skip,
         files_to_skip=config_key_naming_files_to_skip,
     )
 
-    files_to_check_contents: dict[str, str] = {}
-    for frontend_file in files_to_check:
-        with open(frontend_file, "r", encoding="utf-8") as f:
-            files_to_check_contents[frontend_file] = f.read()
+    # Note: Each file is scanned once for all keys rather than once per key.
+    if file_keys is None:
+        file_keys = {
+            f: keys["src-keys"]
+            for f, keys in get_source_keys(
+                file_paths=files_to_check, i18n_src_dict=i18n_src_dict
+            ).items()
+        }
 
-    all_keys = list(i18n_src_dict.keys())
     key_file_dict: dict[str, list[str]] = defaultdict(list)
-    for k in all_keys:
-        key_file_dict[k] = []
-        for i, v in files_to_check_contents.items():
-            if k in v:
-                filepath_from_src = i.split(str(src_directory))[1]
-                filepath_from_src = filepath_from_src[1:]
-                for file_type in config_file_types_to_check:
-                    filepath_from_src = filepath_from_src.replace(file_type, "")
-
+    for i in files_to_check:
+        if file_keys[i]:
+            filepath_from_src = i.split(str(src_directory))[1]
+            filepath_from_src = filepath_from_src[1:]
+            for file_type in config_file_types_to_check:
+                filepath_from_src = filepath_from_src.replace(file_type, "")
+
+            for k in file_keys[i]:
                 key_file_dict[k].append(filepath_from_src)
 
-    # Note: This removes empty lists that are unused keys as this is handled by i18n_check_unused_keys.
-    return {k: list(set(v)) for k, v in key_file_dict.items() if len(v) > 0}
+    # Note: This removes unused keys as this is handled by i18n_check_unused_keys.
+    return {k: list(set(key_file_dict[k])) for k in i18n_src_dict if k in key_file_dict}
 
 
 # MARK: Reduce Keys
@@ -293,9 +296,9 @@ Please rename the following {name_key_or_keys} \\[current_key -> suggested_corre
         all_files_to_fix = json_files + files_to_fix
 
         # If incorrect key, replace it with the suggested key and give feedback with the replacement.
-        for current, correct in invalid_keys_by_name.items():
-            for f in all_files_to_fix:
-                replace_text_in_file(path=f, old=current, new=correct)
+        replace_texts_in_files(
+            paths=all_files_to_fix, replacements=invalid_keys_by_name
+        )
 
         # Sort all locale files if the sorted-keys and repeat-keys checks are activated.
         if config_sorted_keys_active:
@@ -310,11 +313,7 @@ Please rename the following {name_key_or_keys} \\[current_key -> suggested_corre
                     ):
                         sorted_locale_dict = dict(sorted(locale_dict.items()))
 
-                        with open(json_file, "w", encoding="utf-8") as lf:
-                            json.dump(
-                                sorted_locale_dict, lf, indent=2, ensure_ascii=False
-                            )
-                            lf.write("\n")
+                        write_json_file(file_path=json_file, data=sorted_locale_dict)
 
                     else:
                         rprint(
@@ -330,13 +329,19 @@ Please rename the following {name_key_or_keys} \\[current_key -> suggested_corre
     return True
 
 
-# MARK: Variables
+# MARK: Check Data
 
-invalid_keys_key_file_dict = map_keys_to_files(
-    i18n_src_dict=i18n_src_dict,
-    src_directory=config_src_directory,
-)
-invalid_keys_by_name = audit_invalid_i18n_key_names(
-    key_file_dict=invalid_keys_key_file_dict,
-    keys_to_ignore_regex=config_key_naming_regexes_to_ignore,
-)
+
+def get_invalid_keys_by_name() -> dict[str, str]:
+    """
+    Derive the invalid key names for the configured project.
+
+    Returns
+    -------
+    dict[str, str]
+        A dictionary mapping keys that are not named correctly to their suggested corrections.
+    """
+    return audit_invalid_i18n_key_names(
+        key_file_dict=get_intermediate("key-files"),
+        keys_to_ignore_regex=config_key_naming_regexes_to_ignore,
+    )
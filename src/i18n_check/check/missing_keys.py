@@ -12,7 +12,6 @@ Run the following script in terminal:
 >>> i18n-check -mk -f -l ENTER_ISO_2_CODE  # interactive mode to add missing keys
 """
 
-import json
 import sys
 from pathlib import Path
 
@@ -21,6 +20,9 @@ from rich.prompt import Prompt
 
 from i18n_check.check.key_naming import map_keys_to_files
 from i18n_check.check.repeat_keys import check_file_keys_repeated
+from i18n_check.file_writer import write_json_file
+from i18n_check.key_coverage import KeyCoverage
+from i18n_check.locale_store import iter_locale_pairs
 from i18n_check.utils import (
     PATH_SEPARATOR,
     config_i18n_directory,
@@ -33,20 +35,16 @@ from i18n_check.utils import (
     read_json_file,
 )
 
-# MARK: Paths / Files
-
-i18n_src_dict = read_json_file(file_path=config_i18n_src_file)
-
 # MARK: Missing Keys
 
 
-def get_missing_keys_by_locale(
-    i18n_src_dict: dict[str, str] = i18n_src_dict,
+def get_key_coverage(
+    i18n_src_dict: dict[str, str],
     i18n_directory: Path = config_i18n_directory,
     locales_to_check: list[str] = config_missing_keys_locales_to_check,
-) -> dict[str, tuple[list[str], float]]:
+) -> KeyCoverage:
     """
-    Get missing keys for each locale file compared to the source dictionary.
+    Get the source keys that each locale file translates as bitsets.
 
     Parameters
     ----------
@@ -61,13 +59,10 @@ def get_missing_keys_by_locale(
 
     Returns
     -------
-    dict
-        A dictionary where keys are locale filenames and values are tuples containing:
-        - A list of missing keys (including keys with empty string values)
-        - The percentage of missing keys (0-100)
+    KeyCoverage
+        The coverage of the source keys with a bitset for each locale filename.
     """
-    all_src_keys = set(i18n_src_dict.keys())
-    missing_keys_by_locale: dict[str, tuple[list[str], float]] = {}
+    key_coverage = KeyCoverage(keys=i18n_src_dict.keys())
 
     for json_file in get_all_json_files(directory=i18n_directory):
         # Get just the filename without the extension.
@@ -81,30 +76,59 @@ def get_missing_keys_by_locale(
         if locales_to_check and filename not in locales_to_check:
             continue
 
-        locale_dict = read_json_file(file_path=json_file)
-        locale_keys = set(locale_dict.keys())
+        # Keys are considered translated if they're present with values that aren't empty strings.
+        # Note: Only the keys are kept as the pairs are streamed, and the last value of a duplicate key is the one used, as when loading the file.
+        locale_keys: set[str] = set()
+        empty_value_keys: set[str] = set()
+        for key, value in iter_locale_pairs(file_path=json_file):
+            locale_keys.add(key)
+            if value == "":
+                empty_value_keys.add(key)
+
+            else:
+                empty_value_keys.discard(key)
+
+        key_coverage.add_locale(
+            locale=filename,
+            translated_keys=locale_keys - empty_value_keys
+            if empty_value_keys
+            else locale_keys,
+        )
 
-        # Find keys that are missing or have empty string values.
-        missing_keys = [
-            key
-            for key in all_src_keys
-            if key not in locale_keys or locale_dict.get(key) == ""
-        ]
+    return key_coverage
 
-        # Calculate the percentage of missing keys.
-        if all_src_keys:
-            missing_percentage = (len(missing_keys) / len(all_src_keys)) * 100
 
-        else:
-            missing_percentage = 0.0
+def get_missing_keys_by_locale(
+    i18n_src_dict: dict[str, str],
+    i18n_directory: Path = config_i18n_directory,
+    locales_to_check: list[str] = config_missing_keys_locales_to_check,
+) -> dict[str, tuple[list[str], float]]:
+    """
+    Get missing keys for each locale file compared to the source dictionary.
+
+    Parameters
+    ----------
+    i18n_src_dict : dict
+        The dictionary containing i18n source keys and their associated values.
 
-        if missing_keys:
-            missing_keys_by_locale[filename] = (
-                sorted(missing_keys),
-                missing_percentage,
-            )
+    i18n_directory : Path
+        The directory containing the i18n JSON files.
 
-    return missing_keys_by_locale
+    locales_to_check : list
+        List of locale files to check. If empty, all locale files are checked.
+
+    Returns
+    -------
+    dict
+        A dictionary where keys are locale filenames and values are tuples containing:
+        - A list of missing keys (including keys with empty string values)
+        - The percentage of missing keys (0-100)
+    """
+    return get_key_coverage(
+        i18n_src_dict=i18n_src_dict,
+        i18n_directory=i18n_directory,
+        locales_to_check=locales_to_check,
+    ).get_missing_keys_by_locale()
 
 
 # MARK: Error Outputs
@@ -113,6 +137,7 @@ def get_missing_keys_by_locale(
 def report_missing_keys(
     missing_keys_by_locale: dict[str, tuple[list[str], float]],
     all_checks_enabled: bool = False,
+    keys_by_missing_count: dict[int, list[str]] | None = None,
 ) -> None:
     """
     Report missing keys found in locale files.
@@ -125,6 +150,9 @@ def report_missing_keys(
     all_checks_enabled : bool, optional, default=False
         Whether all checks are being ran by the CLI.
 
+    keys_by_missing_count : dict, optional
+        A dictionary with numbers of locales as keys and the keys that are missing in that many locales as values.
+
     Raises
     ------
     ValueError, sys.exit(1)
@@ -144,6 +172,14 @@ def report_missing_keys(
 
             error_message += "\n"
 
+        # Report the keys that are missing in several locales first as they're most in need of translation.
+        for count, keys in (keys_by_missing_count or {}).items():
+            error_message += f"Keys missing in {count} locales:\n"
+            for key in keys:
+                error_message += f"  - {key}\n"
+
+            error_message += "\n"
+
         error_message += "Summary of missing keys by locale:\n"
         error_lines = [
             f"  {locale_file}: {percentage:.1f}% missing"
@@ -174,7 +210,7 @@ def report_missing_keys(
 
 def add_missing_keys_interactively(
     locale: str,
-    i18n_src_dict: dict[str, str] = i18n_src_dict,
+    i18n_src_dict: dict[str, str],
     i18n_directory: Path = config_i18n_directory,
 ) -> None:
     """
@@ -303,9 +339,7 @@ def add_missing_keys_interactively(
                                 "\n[yellow]⚠️  Note: JSON key sorting skipped as there are repeat keys (i18n-check -rk)[/yellow]"
                             )
 
-                        with open(locale_file_path, "w", encoding="utf-8") as f:
-                            json.dump(locale_dict, f, indent=2, ensure_ascii=False)
-                            f.write("\n")
+                        write_json_file(file_path=locale_file_path, data=locale_dict)
 
                         rprint(
                             f"[green]✅ Added translation for '{key}': '{translation}'[/green]\n"
@@ -340,7 +374,7 @@ def add_missing_keys_interactively(
 
 
 def missing_keys_check_and_fix(
-    i18n_src_dict: dict[str, str] = i18n_src_dict,
+    i18n_src_dict: dict[str, str],
     i18n_directory: Path = config_i18n_directory,
     locales_to_check: list[str] = config_missing_keys_locales_to_check,
     all_checks_enabled: bool = False,
@@ -379,14 +413,15 @@ def missing_keys_check_and_fix(
         )
 
     else:
-        missing_keys_by_locale = get_missing_keys_by_locale(
+        key_coverage = get_key_coverage(
             i18n_src_dict=i18n_src_dict,
             i18n_directory=i18n_directory,
             locales_to_check=locales_to_check,
         )
         report_missing_keys(
-            missing_keys_by_locale=missing_keys_by_locale,
+            missing_keys_by_locale=key_coverage.get_missing_keys_by_locale(),
             all_checks_enabled=all_checks_enabled,
+            keys_by_missing_count=key_coverage.get_keys_by_missing_count(min_count=2),
         )
 
     return True
@@ -19,6 +19,8 @@ from typing import Any
 from rich import print as rprint
 
 from i18n_check.check.repeat_keys import check_file_keys_repeated
+from i18n_check.file_writer import write_json_file
+from i18n_check.locale_store import get_locale_scan
 from i18n_check.utils import (
     config_i18n_directory,
     config_sorted_keys_active,
@@ -117,8 +119,7 @@ def derive_nested_files(
 
     for file_path in Path(directory).rglob("*.json"):
         try:
-            data = read_json_file(file_path=file_path)
-            if is_nested_json(data):
+            if get_locale_scan(file_path=file_path).is_nested:
                 nested_files.append(file_path)
 
         except (json.JSONDecodeError, IOError) as e:
@@ -219,12 +220,10 @@ def nested_files_check_and_fix(
                 failed.append(file_path)
                 continue
 
-            with file_path.open("w", encoding="utf-8") as file_obj:
-                if config_sorted_keys_active:
-                    flattened = dict(sorted(flattened.items()))
+            if config_sorted_keys_active:
+                flattened = dict(sorted(flattened.items()))
 
-                json.dump(flattened, file_obj, indent=2, ensure_ascii=False)
-                file_obj.write("\n")
+            write_json_file(file_path=file_path, data=flattened)
 
             rprint(f"[green]✅ Flattened nested keys in {file_path}[/green]")
 
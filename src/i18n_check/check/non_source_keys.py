@@ -11,12 +11,13 @@ Run the following script in terminal:
 >>> i18n-check -nsk
 """
 
-import json
 import sys
 from pathlib import Path
 
 from rich import print as rprint
 
+from i18n_check.file_writer import get_json_text, write_files
+from i18n_check.locale_store import iter_locale_pairs
 from i18n_check.utils import (
     PATH_SEPARATOR,
     config_i18n_directory,
@@ -26,15 +27,11 @@ from i18n_check.utils import (
     read_json_file,
 )
 
-# MARK: Paths / Files
-
-i18n_src_dict = read_json_file(file_path=config_i18n_src_file)
-
 # MARK: Non Source Keys
 
 
 def get_non_source_keys(
-    i18n_src_dict: dict[str, str] = i18n_src_dict,
+    i18n_src_dict: dict[str, str],
     i18n_directory: Path = config_i18n_directory,
 ) -> dict[str, set[str]]:
     """
@@ -60,9 +57,7 @@ def get_non_source_keys(
             json_file.split(PATH_SEPARATOR)[-1]
             != str(config_i18n_src_file).split(PATH_SEPARATOR)[-1]
         ):
-            json_dict = read_json_file(file_path=json_file)
-
-            all_keys = json_dict.keys()
+            all_keys = {key for key, _ in iter_locale_pairs(file_path=json_file)}
 
             if len(all_keys - all_src_keys) > 0:
                 non_source_keys_dict[json_file.split(PATH_SEPARATOR)[-1]] = (
@@ -170,7 +165,7 @@ def non_source_keys_check_and_delete(
         return True
 
     try:
-        files_updated = 0
+        target_file_contents: dict[str, str] = {}
         total_keys_removed = 0
 
         # Process each file that has non-source keys.
@@ -188,14 +183,13 @@ def non_source_keys_check_and_delete(
                     keys_removed_from_file += 1
 
             if keys_removed_from_file > 0:
-                # Write updated target file.
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(target_data, f, indent=2, ensure_ascii=False)
-                    f.write("\n")
-
-                files_updated += 1
+                target_file_contents[str(file_path)] = get_json_text(data=target_data)
                 total_keys_removed += keys_removed_from_file
 
+        # Write updated target files.
+        write_files(file_contents=target_file_contents)
+        files_updated = len(target_file_contents)
+
         # Check if sorted-keys is enabled and sort target files if needed.
         try:
             from i18n_check.utils import config
@@ -234,11 +228,3 @@ def non_source_keys_check_and_delete(
 
         else:
             sys.exit(1)
-
-
-# MARK: Variables
-
-non_source_keys_dict = get_non_source_keys(
-    i18n_src_dict=i18n_src_dict,
-    i18n_directory=config_i18n_directory,
-)
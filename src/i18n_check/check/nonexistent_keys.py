@@ -12,21 +12,19 @@ Run the following script in terminal:
 >>> i18n-check -nk -f  # interactive mode to add nonexistent keys
 """
 
-import json
-import re
 import sys
 from pathlib import Path
-from typing import Any
 
 from rich import print as rprint
 from rich.prompt import Prompt
 
 from i18n_check.check.key_naming import map_keys_to_files
 from i18n_check.check.repeat_keys import check_file_keys_repeated
+from i18n_check.corpus import get_source_corpus
+from i18n_check.file_writer import write_json_file
+from i18n_check.intermediates import get_source_keys
 from i18n_check.utils import (
     PATH_SEPARATOR,
-    collect_files_to_check,
-    config_file_types_to_check,
     config_i18n_src_file,
     config_i18n_src_file_name,
     config_nonexistent_keys_directories_to_skip,
@@ -38,18 +36,14 @@ from i18n_check.utils import (
     read_json_file,
 )
 
-# MARK: Paths / Files
-
-i18n_src_dict = read_json_file(file_path=config_i18n_src_file)
-
-
 # MARK: Key Comparisons
 
 
 def get_used_i18n_keys(
-    i18n_src_dict: dict[str, str] = i18n_src_dict,
+    i18n_src_dict: dict[str, str],
     src_directory: Path = config_src_directory,
     search_dirs: list[Path] = [],
+    file_keys: dict[str, list[str]] | None = None,
 ) -> set[str]:
     """
     Get all i18n keys that are used in the project.
@@ -65,53 +59,40 @@ def get_used_i18n_keys(
     search_dirs : list[Path]
         Additional directories to search for i18n key usage (e.g. test directories).
 
+    file_keys : dict[str, list[str]], optional
+        The i18n keys that each file of the source corpus uses, such as from the shared "source-keys" intermediate.
+        The keys are extracted from the files with get_source_keys if not passed.
+
     Returns
     -------
     set[str]
         A set of all i18n keys that are used in the project.
     """
 
-    i18n_key_pattern_quote = r"\'i18n\.[_\S\.]+?\'"
-    i18n_key_pattern_double_quote = r"\"i18n\.[_\S\.]+?\""
-    i18n_key_pattern_back_tick = r"\`i18n\.[_\S\.]+?\`"
-    all_i18n_key_patterns = [
-        i18n_key_pattern_quote,
-        i18n_key_pattern_double_quote,
-        i18n_key_pattern_back_tick,
-    ]
-
-    files_to_check = collect_files_to_check(
-        directory=src_directory,
-        file_types_to_check=config_file_types_to_check,
-        directories_to_skip=config_nonexistent_keys_directories_to_skip,
-        files_to_skip=config_nonexistent_keys_files_to_skip,
-    )
-
-    for search_dir in search_dirs:
-        files_to_check += collect_files_to_check(
-            directory=search_dir,
-            file_types_to_check=config_file_types_to_check,
+    corpus = get_source_corpus()
+    files_to_check: list[str] = []
+    for directory in [src_directory, *search_dirs]:
+        files_to_check += corpus.files(
+            directory=directory,
             directories_to_skip=config_nonexistent_keys_directories_to_skip,
             files_to_skip=config_nonexistent_keys_files_to_skip,
         )
 
-    files_to_check_contents: dict[str, str] = {}
-    for frontend_file in files_to_check:
-        with open(frontend_file, "r", encoding="utf-8") as f:
-            files_to_check_contents[frontend_file] = f.read()
-
-    all_used_i18n_keys: set[Any] = set()
-    for v in files_to_check_contents.values():
-        all_file_i18n_keys: list[Any] = []
-        all_file_i18n_keys.extend(
-            re.findall(i18n_kp, v) for i18n_kp in all_i18n_key_patterns
-        )
-        # Remove the first and last characters that are the quotes or back ticks.
-        all_file_i18n_keys = [k[1:-1] for ks in all_file_i18n_keys for k in ks]
+    # Note: Keys are only extracted from files that changed since they were cached.
+    # Files are opened one at a time and their contents aren't kept, so only the keys stay in memory.
+    if file_keys is None:
+        file_keys = {
+            f: keys["used-keys"]
+            for f, keys in get_source_keys(
+                file_paths=files_to_check, i18n_src_dict=i18n_src_dict
+            ).items()
+        }
 
-        all_used_i18n_keys.update(all_file_i18n_keys)
+    all_used_i18n_keys: set[str] = set()
+    for file_path in files_to_check:
+        all_used_i18n_keys.update(file_keys[file_path])
 
-    return set(all_used_i18n_keys)
+    return all_used_i18n_keys
 
 
 # MARK: Error Outputs
@@ -119,7 +100,7 @@ def get_used_i18n_keys(
 
 def nonexistent_keys_check(
     all_used_i18n_keys: set[str],
-    i18n_src_dict: dict[str, str] = i18n_src_dict,
+    i18n_src_dict: dict[str, str],
     all_checks_enabled: bool = False,
 ) -> bool:
     """
@@ -130,7 +111,7 @@ def nonexistent_keys_check(
     all_used_i18n_keys : set[str]
         A set of all i18n keys that are used in the project.
 
-    i18n_src_dict : dict[str, str], default=i18n_src_dict
+    i18n_src_dict : dict[str, str]
         The dictionary containing i18n source keys and their associated values.
 
     all_checks_enabled : bool, optional, default=False
@@ -182,7 +163,7 @@ def nonexistent_keys_check(
 
 def add_nonexistent_keys_interactively(
     all_used_i18n_keys: set[str],
-    i18n_src_dict: dict[str, str] = i18n_src_dict,
+    i18n_src_dict: dict[str, str],
     i18n_src_file: Path = config_i18n_src_file,
     src_directory: Path = config_src_directory,
 ) -> None:
@@ -194,7 +175,7 @@ def add_nonexistent_keys_interactively(
     all_used_i18n_keys : set[str]
         A set of all i18n keys that are used in the project.
 
-    i18n_src_dict : dict[str, str], default=i18n_src_dict
+    i18n_src_dict : dict[str, str]
         The dictionary containing i18n source keys and their associated values.
 
     i18n_src_file : Path, default=config_i18n_src_file
@@ -272,9 +253,7 @@ def add_nonexistent_keys_interactively(
                         )
 
                 # Write to file.
-                with open(i18n_src_file, "w", encoding="utf-8") as f:
-                    json.dump(i18n_src_dict_updated, f, indent=2, ensure_ascii=False)
-                    f.write("\n")
+                write_json_file(file_path=i18n_src_file, data=i18n_src_dict_updated)
 
                 rprint(f"[green]✅ Added '{key}': '{value}'[/green]\n")
 
@@ -304,7 +283,7 @@ def add_nonexistent_keys_interactively(
 
 def nonexistent_keys_check_and_fix(
     all_used_i18n_keys: set[str],
-    i18n_src_dict: dict[str, str] = i18n_src_dict,
+    i18n_src_dict: dict[str, str],
     i18n_src_file: Path = config_i18n_src_file,
     src_directory: Path = config_src_directory,
     all_checks_enabled: bool = False,
@@ -318,7 +297,7 @@ def nonexistent_keys_check_and_fix(
     all_used_i18n_keys : set[str]
         A set of all i18n keys that are used in the project.
 
-    i18n_src_dict : dict[str, str], default=i18n_src_dict
+    i18n_src_dict : dict[str, str]
         The dictionary containing i18n source keys and their associated values.
 
     i18n_src_file : Path, default=config_i18n_src_file
@@ -354,10 +333,32 @@ def nonexistent_keys_check_and_fix(
     return True
 
 
-# MARK: Variables
+# MARK: Check Data
 
-all_used_i18n_keys = get_used_i18n_keys(
-    i18n_src_dict=i18n_src_dict,
-    src_directory=config_src_directory,
-    search_dirs=config_nonexistent_keys_search_dirs,
-)
+
+def get_all_used_i18n_keys(
+    i18n_src_dict: dict[str, str],
+    file_keys: dict[str, list[str]] | None = None,
+) -> set[str]:
+    """
+    Derive all i18n keys used in the configured source and search directories.
+
+    Parameters
+    ----------
+    i18n_src_dict : dict[str, str]
+        The dictionary of i18n source keys and their associated values.
+
+    file_keys : dict[str, list[str]], optional
+        The i18n keys that each file of the source corpus uses, which are extracted from the files if not passed.
+
+    Returns
+    -------
+    set[str]
+        A set of all i18n keys that are used in the project.
+    """
+    return get_used_i18n_keys(
+        i18n_src_dict=i18n_src_dict,
+        src_directory=config_src_directory,
+        search_dirs=config_nonexistent_keys_search_dirs,
+        file_keys=file_keys,
+    )
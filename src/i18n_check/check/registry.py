@@ -0,0 +1,516 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Registry of the i18n checks that can be ran by the CLI.
+
+Each check is registered with a runner that derives the data the check needs only when it's called.
+Check modules are imported within the runners so that selecting one check doesn't pay for the others.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from i18n_check.cache import get_result_cache
+from i18n_check.intermediates import get_intermediate
+from i18n_check.utils import (
+    config_alt_texts_active,
+    config_aria_labels_active,
+    config_key_formatting_active,
+    config_key_naming_active,
+    config_missing_keys_active,
+    config_nested_files_active,
+    config_non_source_keys_active,
+    config_nonexistent_keys_active,
+    config_repeat_keys_active,
+    config_repeat_values_active,
+    config_repeat_values_locale_values,
+    config_sorted_keys_active,
+    config_unused_keys_active,
+)
+
+# MARK: Runners
+
+
+def _run_key_formatting(all_checks_enabled: bool, fix: bool) -> bool:
+    """
+    Run the key-formatting check.
+
+    Parameters
+    ----------
+    all_checks_enabled : bool
+        Whether all checks are being ran by the CLI.
+
+    fix : bool
+        Whether to automatically fix issues (not allowed when all checks are ran).
+
+    Returns
+    -------
+    bool
+        True if the check is successful.
+    """
+    from i18n_check.check import key_formatting
+
+    return key_formatting.invalid_key_formats_check_and_fix(
+        invalid_keys_by_format=key_formatting.get_invalid_keys_by_format(),
+        all_checks_enabled=all_checks_enabled,
+        fix=fix and not all_checks_enabled,
+    )
+
+
+def _run_key_naming(all_checks_enabled: bool, fix: bool) -> bool:
+    """
+    Run the key-naming check.
+
+    Parameters
+    ----------
+    all_checks_enabled : bool
+        Whether all checks are being ran by the CLI.
+
+    fix : bool
+        Whether to automatically fix issues.
+
+    Returns
+    -------
+    bool
+        True if the check is successful.
+    """
+    from i18n_check.check import key_naming
+
+    return key_naming.invalid_key_names_check_and_fix(
+        invalid_keys_by_name=key_naming.get_invalid_keys_by_name(),
+        all_checks_enabled=all_checks_enabled,
+        fix=fix,
+    )
+
+
+def _run_nonexistent_keys(all_checks_enabled: bool, fix: bool) -> bool:
+    """
+    Run the nonexistent-keys check.
+
+    Parameters
+    ----------
+    all_checks_enabled : bool
+        Whether all checks are being ran by the CLI.
+
+    fix : bool
+        Whether to interactively fix issues (not allowed when all checks are ran).
+
+    Returns
+    -------
+    bool
+        True if the check is successful.
+    """
+    from i18n_check.check import nonexistent_keys
+
+    return nonexistent_keys.nonexistent_keys_check_and_fix(
+        all_used_i18n_keys=get_intermediate("used-keys"),
+        i18n_src_dict=get_intermediate("i18n-src-dict"),
+        all_checks_enabled=all_checks_enabled,
+        fix=fix and not all_checks_enabled,
+    )
+
+
+def _run_unused_keys(all_checks_enabled: bool, fix: bool) -> bool:
+    """
+    Run the unused-keys check.
+
+    Parameters
+    ----------
+    all_checks_enabled : bool
+        Whether all checks are being ran by the CLI.
+
+    fix : bool
+        Unused as the unused-keys check has no fix option.
+
+    Returns
+    -------
+    bool
+        True if the check is successful.
+    """
+    from i18n_check.check import unused_keys
+
+    return unused_keys.unused_keys_check(
+        unused_keys=unused_keys.get_unused_keys(
+            i18n_src_dict=get_intermediate("i18n-src-dict")
+        ),
+        all_checks_enabled=all_checks_enabled,
+    )
+
+
+def _run_non_source_keys(all_checks_enabled: bool, fix: bool) -> bool:
+    """
+    Run the non-source-keys check.
+
+    Parameters
+    ----------
+    all_checks_enabled : bool
+        Whether all checks are being ran by the CLI.
+
+    fix : bool
+        Unused as the non-source-keys check has no fix option.
+
+    Returns
+    -------
+    bool
+        True if the check is successful.
+    """
+    from i18n_check.check import non_source_keys
+
+    return non_source_keys.non_source_keys_check(
+        non_source_keys_dict=non_source_keys.get_non_source_keys(
+            i18n_src_dict=get_intermediate("i18n-src-dict")
+        ),
+        all_checks_enabled=all_checks_enabled,
+    )
+
+
+def _run_repeat_keys(all_checks_enabled: bool, fix: bool) -> bool:
+    """
+    Run the repeat-keys check.
+
+    Parameters
+    ----------
+    all_checks_enabled : bool
+        Whether all checks are being ran by the CLI.
+
+    fix : bool
+        Unused as the repeat-keys check has no fix option.
+
+    Returns
+    -------
+    bool
+        True if the check is successful.
+    """
+    from i18n_check.check import repeat_keys
+
+    return repeat_keys.repeat_keys_check(all_checks_enabled=all_checks_enabled)
+
+
+def _run_repeat_values(all_checks_enabled: bool, fix: bool) -> bool:
+    """
+    Run the repeat-values check.
+
+    Parameters
+    ----------
+    all_checks_enabled : bool
+        Whether all checks are being ran by the CLI.
+
+    fix : bool
+        Unused as the repeat-values check has no fix option.
+
+    Returns
+    -------
+    bool
+        True if the check is successful.
+    """
+    from i18n_check.check import repeat_values
+
+    i18n_src_dict = get_intermediate("i18n-src-dict")
+    json_repeat_value_counts, repeat_value_error_report = (
+        repeat_values.get_repeat_value_report(i18n_src_dict=i18n_src_dict)
+    )
+    similar_values, similar_value_error_report = repeat_values.get_similar_value_report(
+        i18n_src_dict=i18n_src_dict
+    )
+    locale_value_issues, locale_value_error_report = (
+        repeat_values.get_locale_value_report(i18n_src_dict=i18n_src_dict)
+    )
+
+    return repeat_values.repeat_values_check(
+        json_repeat_value_counts=json_repeat_value_counts,
+        repeat_value_error_report=repeat_value_error_report,
+        all_checks_enabled=all_checks_enabled,
+        locale_value_issues=locale_value_issues,
+        locale_value_error_report=locale_value_error_report,
+        similar_values=similar_values,
+        similar_value_error_report=similar_value_error_report,
+    )
+
+
+def _run_sorted_keys(all_checks_enabled: bool, fix: bool) -> bool:
+    """
+    Run the sorted-keys check.
+
+    Parameters
+    ----------
+    all_checks_enabled : bool
+        Whether all checks are being ran by the CLI.
+
+    fix : bool
+        Whether to automatically fix issues.
+
+    Returns
+    -------
+    bool
+        True if the check is successful.
+    """
+    from i18n_check.check import sorted_keys
+
+    return sorted_keys.sorted_keys_check_and_fix(
+        all_checks_enabled=all_checks_enabled, fix=fix
+    )
+
+
+def _run_nested_files(all_checks_enabled: bool, fix: bool) -> bool:
+    """
+    Run the nested-files check.
+
+    Parameters
+    ----------
+    all_checks_enabled : bool
+        Whether all checks are being ran by the CLI.
+
+    fix : bool
+        Whether to automatically fix issues (not allowed when all checks are ran).
+
+    Returns
+    -------
+    bool
+        True if the check is successful.
+    """
+    from i18n_check.check import nested_files
+
+    if fix and not all_checks_enabled:
+        return nested_files.nested_files_check_and_fix()
+
+    # Note: This check warns the user and doesn't raise an error, so no need for all_checks_enabled.
+    return nested_files.nested_files_check()
+
+
+def _run_missing_keys(all_checks_enabled: bool, fix: bool) -> bool:
+    """
+    Run the missing-keys check.
+
+    Parameters
+    ----------
+    all_checks_enabled : bool
+        Whether all checks are being ran by the CLI.
+
+    fix : bool
+        Unused as fixing missing keys requires a locale and is handled by the CLI.
+
+    Returns
+    -------
+    bool
+        True if the check is successful.
+    """
+    from i18n_check.check import missing_keys
+
+    return missing_keys.missing_keys_check_and_fix(
+        i18n_src_dict=get_intermediate("i18n-src-dict"),
+        all_checks_enabled=all_checks_enabled,
+    )
+
+
+def _run_aria_labels(all_checks_enabled: bool, fix: bool) -> bool:
+    """
+    Run the aria-labels check.
+
+    Parameters
+    ----------
+    all_checks_enabled : bool
+        Whether all checks are being ran by the CLI.
+
+    fix : bool
+        Whether to automatically fix issues.
+
+    Returns
+    -------
+    bool
+        True if the check is successful.
+    """
+    from i18n_check.check import aria_labels
+
+    return aria_labels.aria_labels_check_and_fix(
+        fix=fix, all_checks_enabled=all_checks_enabled
+    )
+
+
+def _run_alt_texts(all_checks_enabled: bool, fix: bool) -> bool:
+    """
+    Run the alt-texts check.
+
+    Parameters
+    ----------
+    all_checks_enabled : bool
+        Whether all checks are being ran by the CLI.
+
+    fix : bool
+        Whether to automatically fix issues.
+
+    Returns
+    -------
+    bool
+        True if the check is successful.
+    """
+    from i18n_check.check import alt_texts
+
+    return alt_texts.alt_texts_check_and_fix(
+        fix=fix, all_checks_enabled=all_checks_enabled
+    )
+
+
+# MARK: Registry
+
+
+@dataclass(frozen=True)
+class RegisteredCheck:
+    """
+    A check that can be ran by the CLI.
+
+    Parameters
+    ----------
+    name : str
+        The name of the check as used in the configuration file.
+
+    active : bool
+        Whether the check is active given the configuration file.
+
+    run : Callable[[bool, bool], bool]
+        The runner for the check that takes all_checks_enabled and fix arguments.
+
+    uses_source_corpus : bool, default=False
+        Whether the check reads the source files of the project.
+
+    uses_locale_files : bool, default=False
+        Whether the check reads the JSON files of the i18n-dir other than the i18n-src file.
+
+    intermediates : tuple[str, ...], default=()
+        The names of the shared intermediate results that the check uses.
+    """
+
+    name: str
+    active: bool
+    run: Callable[[bool, bool], bool]
+    uses_source_corpus: bool = False
+    uses_locale_files: bool = False
+    intermediates: tuple[str, ...] = ()
+
+
+CHECK_REGISTRY: dict[str, RegisteredCheck] = {
+    c.name: c
+    for c in [
+        RegisteredCheck(
+            "key-formatting",
+            config_key_formatting_active,
+            _run_key_formatting,
+            uses_source_corpus=True,
+            intermediates=("key-files",),
+        ),
+        RegisteredCheck(
+            "key-naming",
+            config_key_naming_active,
+            _run_key_naming,
+            uses_source_corpus=True,
+            intermediates=("key-files",),
+        ),
+        RegisteredCheck(
+            "nonexistent-keys",
+            config_nonexistent_keys_active,
+            _run_nonexistent_keys,
+            uses_source_corpus=True,
+            intermediates=("used-keys",),
+        ),
+        RegisteredCheck(
+            "unused-keys",
+            config_unused_keys_active,
+            _run_unused_keys,
+            uses_source_corpus=True,
+            intermediates=("source-contents",),
+        ),
+        RegisteredCheck(
+            "non-source-keys",
+            config_non_source_keys_active,
+            _run_non_source_keys,
+            uses_locale_files=True,
+            intermediates=("locale-files",),
+        ),
+        RegisteredCheck(
+            "repeat-keys",
+            config_repeat_keys_active,
+            _run_repeat_keys,
+            uses_locale_files=True,
+            intermediates=("locale-scans",),
+        ),
+        RegisteredCheck(
+            "repeat-values",
+            config_repeat_values_active,
+            _run_repeat_values,
+            uses_source_corpus=True,
+            uses_locale_files=config_repeat_values_locale_values,
+            intermediates=("key-files", "locale-files")
+            if config_repeat_values_locale_values
+            else ("key-files",),
+        ),
+        RegisteredCheck(
+            "sorted-keys",
+            config_sorted_keys_active,
+            _run_sorted_keys,
+            uses_locale_files=True,
+            intermediates=("locale-scans",),
+        ),
+        RegisteredCheck(
+            "nested-files",
+            config_nested_files_active,
+            _run_nested_files,
+            uses_locale_files=True,
+            intermediates=("locale-scans",),
+        ),
+        RegisteredCheck(
+            "missing-keys",
+            config_missing_keys_active,
+            _run_missing_keys,
+            uses_locale_files=True,
+            intermediates=("locale-files",),
+        ),
+        RegisteredCheck(
+            "aria-labels",
+            config_aria_labels_active,
+            _run_aria_labels,
+            uses_locale_files=True,
+            intermediates=("locale-files",),
+        ),
+        RegisteredCheck(
+            "alt-texts",
+            config_alt_texts_active,
+            _run_alt_texts,
+            uses_locale_files=True,
+            intermediates=("locale-files",),
+        ),
+    ]
+}
+
+
+def run_check(name: str, all_checks_enabled: bool = False, fix: bool = False) -> bool:
+    """
+    Run a registered check by its name.
+
+    Parameters
+    ----------
+    name : str
+        The name of the check as used in the configuration file.
+
+    all_checks_enabled : bool, optional, default=False
+        Whether all checks are being ran by the CLI.
+
+    fix : bool, optional, default=False
+        Whether to automatically fix issues if the check allows it.
+
+    Returns
+    -------
+    bool
+        True if the check is successful.
+
+    Raises
+    ------
+    KeyError
+        If there is no check registered with the given name.
+    """
+    if name not in CHECK_REGISTRY:
+        raise KeyError(f"There is no i18n check named '{name}'.")
+
+    try:
+        return CHECK_REGISTRY[name].run(all_checks_enabled, fix)
+
+    finally:
+        # Note: Results are saved even if the check fails so the next run can reuse them.
+        get_result_cache().save()
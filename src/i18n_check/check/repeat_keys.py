@@ -19,6 +19,7 @@ from typing import Any
 
 from rich import print as rprint
 
+from i18n_check.locale_store import get_locale_scan
 from i18n_check.utils import config_i18n_directory, get_all_json_files
 
 # MARK: Repeat Keys
@@ -130,10 +131,7 @@ def check_file_keys_repeated(file_path: str) -> tuple[str, dict[str, list[str]]]
     >>> check_file_keys_repeated("example.json")
     ('example.json', {'duplicate_key': ['value1', 'value2']})
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    return (Path(file_path).name, find_repeat_keys(content))
+    return (Path(file_path).name, get_locale_scan(file_path=file_path).repeat_keys)
 
 
 # MARK: Error Outputs
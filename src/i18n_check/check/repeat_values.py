@@ -4,6 +4,9 @@ Checks if the i18n-src file has repeat string values.
 
 If yes, suggest that they be combined using a `_global` sub key at the lowest matching level of i18n-src.
 
+With `locale-values` set, the values of the other locale files are also checked for keys with the same source value
+that are translated in different ways and for keys with different source values that have the same translation.
+
 Examples
 --------
 Run the following script in terminal:
@@ -12,29 +15,114 @@ Run the following script in terminal:
 """
 
 import itertools
+import os
 import sys
-from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
 
 from rich import print as rprint
 
 from i18n_check.check.key_naming import audit_invalid_i18n_key_names, map_keys_to_files
+from i18n_check.extraction import map_shards
+from i18n_check.intermediates import get_intermediate
+from i18n_check.json_stream import iter_json_pairs
+from i18n_check.locale_store import is_stream_json, iter_locale_pairs
+from i18n_check.normalization import normalize_values
+from i18n_check.similarity import cluster_similar_values, get_similarity_threshold
 from i18n_check.utils import (
+    PATH_SEPARATOR,
+    config_i18n_directory,
     config_i18n_src_file,
     config_i18n_src_file_name,
     config_key_naming_regexes_to_ignore,
+    config_repeat_values_locale_values,
+    config_repeat_values_unicode_normalization,
     config_src_directory,
-    lower_and_remove_punctuation,
-    read_json_file,
+    get_all_json_files,
 )
 
-# MARK: Paths / Files
+# MARK: Repeat Values
 
-i18n_src_dict = read_json_file(file_path=config_i18n_src_file)
 
-# MARK: Repeat Values
+def get_value_keys(
+    i18n_src_dict: dict[str, str],
+    unicode_aware: bool = config_repeat_values_unicode_normalization,
+) -> dict[str, list[str]]:
+    """
+    Index the keys of the i18n source dictionary by their values after lowercasing and removing punctuation.
 
+    Parameters
+    ----------
+    i18n_src_dict : dict[str, str]
+        The dictionary containing i18n keys and their associated values.
+
+    unicode_aware : bool, default=`unicode-normalization`
+        Whether values are also NFKC normalized and case folded with the punctuation of all scripts removed.
 
-def get_repeat_value_counts(i18n_src_dict: dict[str, str]) -> dict[str, int]:
+    Returns
+    -------
+    dict[str, list[str]]
+        A dictionary where keys are normalized values and values are the keys that have them in the order of the dictionary.
+    """
+    # Note: Only hashable types are included, and all values are normalized at once.
+    keys = [
+        k for k, v in i18n_src_dict.items() if isinstance(v, (str, int, float, tuple))
+    ]
+    value_keys: dict[str, list[str]] = {}
+    for k, normalized_value in zip(
+        keys,
+        normalize_values(
+            values=[i18n_src_dict[k] for k in keys], unicode_aware=unicode_aware
+        ),
+    ):
+        value_keys.setdefault(normalized_value, []).append(k)
+
+    return value_keys
+
+
+def get_similar_values(
+    value_keys: dict[str, list[str]], similarity_threshold: float | None = None
+) -> dict[str, list[str]]:
+    """
+    Group the normalized values of the i18n source dictionary into clusters of near-duplicates.
+
+    Parameters
+    ----------
+    value_keys : dict[str, list[str]]
+        The index of keys by their normalized values from get_value_keys.
+
+    similarity_threshold : float, optional
+        The similarity of the shingles of values from which they're near-duplicates, defaulting to the one set by --similarity-threshold.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        A dictionary where keys are the values of clusters with the most keys and values are the other values of their clusters,
+        which is empty if no similarity threshold is set.
+    """
+    if similarity_threshold is None:
+        similarity_threshold = get_similarity_threshold()
+
+    if similarity_threshold is None:
+        return {}
+
+    similar_values: dict[str, list[str]] = {}
+    for cluster in cluster_similar_values(
+        values=[v for v in value_keys if isinstance(v, str)],
+        similarity_threshold=similarity_threshold,
+    ):
+        # Note: The first value with the most keys represents the cluster as it's most likely the one to keep.
+        cluster_value = max(cluster, key=lambda v: len(value_keys[v]))
+        similar_values[cluster_value] = [v for v in cluster if v != cluster_value]
+
+    return similar_values
+
+
+def get_repeat_value_counts(
+    i18n_src_dict: dict[str, str],
+    value_keys: dict[str, list[str]] | None = None,
+) -> dict[str, int]:
     """
     Count repeated values in the i18n source dictionary.
 
@@ -43,23 +131,26 @@ def get_repeat_value_counts(i18n_src_dict: dict[str, str]) -> dict[str, int]:
     i18n_src_dict : dict[str, str]
         The dictionary containing i18n keys and their associated values.
 
+    value_keys : dict[str, list[str]], optional
+        The index of keys by their normalized values from get_value_keys, which is derived if not passed.
+
     Returns
     -------
     dict[str, int]
         A dictionary with values that appear more than once, mapped to their count.
     """
     # Note: The following automatically removes repeat keys from i18n_src_dict.
-    all_json_values = [
-        lower_and_remove_punctuation(text=v)
-        for v in list(i18n_src_dict.values())
-        if isinstance(v, (str, int, float, tuple))  # include only hashable types.
-    ]
+    if value_keys is None:
+        value_keys = get_value_keys(i18n_src_dict=i18n_src_dict)
 
-    return {k: v for k, v in dict(Counter(all_json_values)).items() if v > 1}
+    return {v: len(keys) for v, keys in value_keys.items() if len(keys) > 1}
 
 
 def analyze_and_generate_repeat_value_report(
-    i18n_src_dict: dict[str, str], json_repeat_value_counts: dict[str, int]
+    i18n_src_dict: dict[str, str],
+    json_repeat_value_counts: dict[str, int],
+    key_file_dict: dict[str, list[str]] | None = None,
+    value_keys: dict[str, list[str]] | None = None,
 ) -> tuple[dict[str, int], str]:
     """
     Analyze repeated values and generates a report of repeat values with changes that should be made.
@@ -72,6 +163,12 @@ def analyze_and_generate_repeat_value_report(
     json_repeat_value_counts : dict[str, int]
         A dictionary of repeated values and their occurrence counts.
 
+    key_file_dict : dict[str, list[str]], optional
+        A dictionary of i18n keys and the files they are used in, which is derived if not passed.
+
+    value_keys : dict[str, list[str]], optional
+        The index of keys by their normalized values from get_value_keys, which is derived if not passed.
+
     Returns
     -------
     dict[str, int], str
@@ -79,13 +176,25 @@ def analyze_and_generate_repeat_value_report(
     """
     repeat_value_error_report = ""
 
+    # Note: The files of keys are mapped once for all repeat values rather than once per value.
+    if key_file_dict is None and json_repeat_value_counts:
+        key_file_dict = map_keys_to_files(
+            i18n_src_dict=i18n_src_dict, src_directory=config_src_directory
+        )
+
+    # Note: The keys of each value are looked up in the index rather than scanning all keys per value.
+    if value_keys is None and json_repeat_value_counts:
+        value_keys = get_value_keys(i18n_src_dict=i18n_src_dict)
+
+    key_file_dict = key_file_dict or {}
+    key_file_order = {k: i for i, k in enumerate(key_file_dict)}
+
     keys_to_remove: list[str] = []
     for repeat_value in json_repeat_value_counts:
         repeat_value_i18n_keys = [
             k
-            for k, v in i18n_src_dict.items()
-            if repeat_value == lower_and_remove_punctuation(text=v)
-            and k[-len("_lower") :] != "_lower"
+            for k in (value_keys or {}).get(repeat_value, [])
+            if not k.endswith("_lower")
         ]
 
         # Needed as we're removing keys that are set to lowercase above.
@@ -97,14 +206,13 @@ def analyze_and_generate_repeat_value_report(
             )
 
             # Use the methods from the invalid keys check to assure that results are consistent.
-            repeat_values_key_file_dict = map_keys_to_files(
-                i18n_src_dict={
-                    k: v
-                    for k, v in i18n_src_dict.items()
-                    if k in repeat_value_i18n_keys
-                },
-                src_directory=config_src_directory,
-            )
+            repeat_values_key_file_dict = {
+                k: key_file_dict[k]
+                for k in sorted(
+                    (k for k in repeat_value_i18n_keys if k in key_file_dict),
+                    key=key_file_order.__getitem__,
+                )
+            }
 
             # Replace with 'repeat_key' as a dummy for if this was the key in all files.
             repeat_key_key_file_dict = {
@@ -140,6 +248,258 @@ def analyze_and_generate_repeat_value_report(
     return json_repeat_value_counts, repeat_value_error_report
 
 
+def generate_similar_value_report(
+    value_keys: dict[str, list[str]], similar_values: dict[str, list[str]]
+) -> str:
+    """
+    Generate a report of the clusters of near-duplicate values and the keys of each of their values.
+
+    Parameters
+    ----------
+    value_keys : dict[str, list[str]]
+        The index of keys by their normalized values from get_value_keys.
+
+    similar_values : dict[str, list[str]]
+        The clusters of near-duplicate values from get_similar_values.
+
+    Returns
+    -------
+    str
+        A report to be added to the error.
+    """
+    similar_value_error_report = ""
+    for cluster_value, other_values in similar_values.items():
+        quoted_values = [f"'{v}'" for v in (cluster_value, *other_values)]
+        similar_value_error_report += (
+            f"\n\nNear-duplicate values: {', '.join(quoted_values)}"
+        )
+        for v in (cluster_value, *other_values):
+            similar_value_error_report += f"\n'{v}': {', '.join(sorted(value_keys[v]))}"
+
+    return similar_value_error_report
+
+
+# MARK: Locale Values
+
+
+@dataclass(frozen=True)
+class LocaleValueIssues:
+    """
+    The values of a locale file that aren't consistent with the values of the i18n-src file.
+
+    Parameters
+    ----------
+    inconsistent_translations : dict[Any, dict[str, list[str]]]
+        A dictionary where keys are normalized source values that are translated in more than one way
+        and values are dictionaries of each normalized translation to the keys that have it.
+
+    repeat_values : dict[str, list[str]]
+        A dictionary where keys are normalized translations of keys with different source values and values are the keys.
+    """
+
+    inconsistent_translations: dict[Any, dict[str, list[str]]]
+    repeat_values: dict[str, list[str]]
+
+
+class LocaleValueAnalyzer:
+    """
+    Find the inconsistent and repeat values of a shard of locale files.
+
+    Instances are passed to worker processes, so the keys are grouped by their source values before.
+
+    Parameters
+    ----------
+    key_source_values : dict[str, Any]
+        A dictionary where keys are the keys of the i18n-src file and values are their normalized source values.
+
+    unicode_aware : bool
+        Whether values are also NFKC normalized and case folded with the punctuation of all scripts removed.
+
+    stream_json : bool
+        Whether the key-value pairs of the locale files are streamed rather than loaded.
+    """
+
+    def __init__(
+        self, key_source_values: dict[str, Any], unicode_aware: bool, stream_json: bool
+    ) -> None:
+        self.key_source_values = key_source_values
+        self.unicode_aware = unicode_aware
+        self.stream_json = stream_json
+
+    def __call__(self, shard: list[str]) -> dict[str, LocaleValueIssues]:
+        """
+        Find the inconsistent and repeat values of each locale file of a shard.
+
+        Parameters
+        ----------
+        shard : list[str]
+            The paths to the locale files.
+
+        Returns
+        -------
+        dict[str, LocaleValueIssues]
+            A dictionary where keys are the paths to the locale files and values are their issues.
+        """
+        return {file_path: self.analyze(file_path=file_path) for file_path in shard}
+
+    def analyze(self, file_path: str) -> LocaleValueIssues:
+        """
+        Find the inconsistent and repeat values of a locale file with one pass over its keys.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the locale file.
+
+        Returns
+        -------
+        LocaleValueIssues
+            The inconsistent translations and repeat values of the locale file.
+        """
+        # Note: Worker processes don't share the settings of the main process, so streaming is chosen here.
+        pairs = (
+            iter_json_pairs(file_path=file_path)
+            if self.stream_json
+            else iter_locale_pairs(file_path=file_path)
+        )
+
+        # Note: The last value of a duplicate key is the one that's used, and untranslated keys are skipped.
+        locale_values = {k: v for k, v in pairs if k in self.key_source_values}
+        keys = [k for k, v in locale_values.items() if isinstance(v, str) and v]
+
+        source_values = [self.key_source_values[k] for k in keys]
+        translations = normalize_values(
+            values=[locale_values[k] for k in keys], unicode_aware=self.unicode_aware
+        )
+
+        # Note: Values are flagged when they differ from the first one, so keys are only collected for flagged values.
+        first_translations: dict[Any, str] = {}
+        first_source_values: dict[str, Any] = {}
+        inconsistent_source_values = set()
+        repeat_translations = set()
+        for source_value, translation in zip(source_values, translations):
+            if first_translations.setdefault(source_value, translation) != translation:
+                inconsistent_source_values.add(source_value)
+
+            if (
+                first_source_values.setdefault(translation, source_value)
+                != source_value
+            ):
+                repeat_translations.add(translation)
+
+        inconsistent_translations: dict[Any, dict[str, list[str]]] = {}
+        repeat_values: dict[str, list[str]] = {}
+        if inconsistent_source_values or repeat_translations:
+            for k, source_value, translation in zip(keys, source_values, translations):
+                if source_value in inconsistent_source_values:
+                    inconsistent_translations.setdefault(source_value, {}).setdefault(
+                        translation, []
+                    ).append(k)
+
+                if translation in repeat_translations:
+                    repeat_values.setdefault(translation, []).append(k)
+
+        return LocaleValueIssues(
+            inconsistent_translations=inconsistent_translations,
+            repeat_values=repeat_values,
+        )
+
+
+def get_locale_value_issues(
+    value_keys: dict[str, list[str]],
+    i18n_directory: str | Path = config_i18n_directory,
+    unicode_aware: bool = config_repeat_values_unicode_normalization,
+    jobs: int | None = None,
+) -> dict[str, LocaleValueIssues]:
+    """
+    Find the inconsistent and repeat values of all locale files with the keys grouped by their source values once.
+
+    Parameters
+    ----------
+    value_keys : dict[str, list[str]]
+        The index of keys by their normalized source values from get_value_keys.
+
+    i18n_directory : str | Path, default=`i18n-dir`
+        The directory with the locale files, with the i18n-src file being skipped.
+
+    unicode_aware : bool, default=`unicode-normalization`
+        Whether values are also NFKC normalized and case folded with the punctuation of all scripts removed.
+
+    jobs : int, optional
+        The number of worker processes that locale files are analyzed with, defaulting to the number that's set by --jobs.
+
+    Returns
+    -------
+    dict[str, LocaleValueIssues]
+        A dictionary where keys are the names of locales with issues and values are their issues in the order of the files.
+    """
+    key_source_values = {k: v for v, keys in value_keys.items() for k in keys}
+
+    i18n_src_file_path = os.path.realpath(config_i18n_src_file)
+    locale_files = [
+        f
+        for f in get_all_json_files(directory=i18n_directory)
+        if os.path.realpath(f) != i18n_src_file_path
+    ]
+
+    issues_by_file: dict[str, LocaleValueIssues] = {}
+    for shard_issues in map_shards(
+        function=LocaleValueAnalyzer(
+            key_source_values=key_source_values,
+            unicode_aware=unicode_aware,
+            stream_json=is_stream_json(),
+        ),
+        items=locale_files,
+        sizes=[os.path.getsize(f) for f in locale_files],
+        jobs=jobs,
+    ):
+        issues_by_file.update(shard_issues)
+
+    return {
+        f.split(PATH_SEPARATOR)[-1].split(".")[0]: issues_by_file[f]
+        for f in locale_files
+        if issues_by_file[f].inconsistent_translations
+        or issues_by_file[f].repeat_values
+    }
+
+
+def generate_locale_value_report(
+    locale_value_issues: dict[str, LocaleValueIssues],
+) -> str:
+    """
+    Generate a report of the inconsistent and repeat values of locale files.
+
+    Parameters
+    ----------
+    locale_value_issues : dict[str, LocaleValueIssues]
+        A dictionary where keys are the names of locales and values are their issues.
+
+    Returns
+    -------
+    str
+        A report to be added to the error.
+    """
+    locale_value_error_report = ""
+    for locale, issues in locale_value_issues.items():
+        for source_value, translations in issues.inconsistent_translations.items():
+            locale_value_error_report += (
+                f"\n\nInconsistent translations in {locale}: '{source_value}'"
+            )
+            for translation, keys in translations.items():
+                locale_value_error_report += (
+                    f"\n'{translation}': {', '.join(sorted(keys))}"
+                )
+
+        for translation, keys in issues.repeat_values.items():
+            locale_value_error_report += (
+                f"\n\nRepeat value in {locale}: '{translation}'"
+                f"\nNumber of instances: {len(keys)}"
+                f"\nKeys: {', '.join(sorted(keys))}"
+            )
+
+    return locale_value_error_report
+
+
 # MARK: Error Outputs
 
 
@@ -147,6 +507,10 @@ def repeat_values_check(
     json_repeat_value_counts: dict[str, int],
     repeat_value_error_report: str,
     all_checks_enabled: bool = False,
+    locale_value_issues: dict[str, LocaleValueIssues] | None = None,
+    locale_value_error_report: str = "",
+    similar_values: dict[str, list[str]] | None = None,
+    similar_value_error_report: str = "",
 ) -> bool:
     """
     Check and report if there are repeat translation values.
@@ -162,6 +526,18 @@ def repeat_values_check(
     all_checks_enabled : bool, optional, default=False
         Whether all checks are being ran by the CLI.
 
+    locale_value_issues : dict[str, LocaleValueIssues], optional
+        A dictionary where keys are the names of locales and values are their inconsistent and repeat values.
+
+    locale_value_error_report : str, default=""
+        An error report including the inconsistent and repeat values of locales.
+
+    similar_values : dict[str, list[str]], optional
+        The clusters of near-duplicate values of the i18n-src file from get_similar_values.
+
+    similar_value_error_report : str, default=""
+        An error report including the near-duplicate values and their keys.
+
     Returns
     -------
     bool
@@ -172,18 +548,46 @@ def repeat_values_check(
     ValueError, sys.exit(1)
         An error is raised and the system prints error details if repeat values are found.
     """
-    if json_repeat_value_counts:
-        is_or_are = "is"
-        it_or_them = "it"
-        value_or_values = "value"
-        if len(json_repeat_value_counts) > 1:
-            is_or_are = "are"
-            it_or_them = "them"
-            value_or_values = "values"
-
+    if json_repeat_value_counts or similar_values or locale_value_issues:
         error_message = "\n[red]"
-        error_message += f"❌ repeat-values error: There {is_or_are} {len(json_repeat_value_counts)} repeat i18n {value_or_values} present in the {config_i18n_src_file_name} i18n source file. Please follow the directions below to combine {it_or_them} into one key:"
-        error_message += repeat_value_error_report
+        if json_repeat_value_counts:
+            is_or_are = "is"
+            it_or_them = "it"
+            value_or_values = "value"
+            if len(json_repeat_value_counts) > 1:
+                is_or_are = "are"
+                it_or_them = "them"
+                value_or_values = "values"
+
+            error_message += f"❌ repeat-values error: There {is_or_are} {len(json_repeat_value_counts)} repeat i18n {value_or_values} present in the {config_i18n_src_file_name} i18n source file. Please follow the directions below to combine {it_or_them} into one key:"
+            error_message += repeat_value_error_report
+
+        if similar_values:
+            if json_repeat_value_counts:
+                error_message += "\n\n"
+
+            is_or_are = "is"
+            group_or_groups = "group"
+            if len(similar_values) > 1:
+                is_or_are = "are"
+                group_or_groups = "groups"
+
+            error_message += f"❌ repeat-values error: There {is_or_are} {len(similar_values)} {group_or_groups} of near-duplicate i18n values present in the {config_i18n_src_file_name} i18n source file. Please check whether the values of each group should be combined into one key:"
+            error_message += similar_value_error_report
+
+        if locale_value_issues:
+            if json_repeat_value_counts or similar_values:
+                error_message += "\n\n"
+
+            is_or_are = "is"
+            locale_or_locales = "locale"
+            if len(locale_value_issues) > 1:
+                is_or_are = "are"
+                locale_or_locales = "locales"
+
+            error_message += f"❌ repeat-values error: There {is_or_are} {len(locale_value_issues)} {locale_or_locales} with keys of the same source value that are translated differently or keys of different source values that are translated the same. Please check the translations below:"
+            error_message += locale_value_error_report
+
         error_message += "[/red]"
 
         rprint(error_message)
@@ -202,12 +606,87 @@ def repeat_values_check(
     return True
 
 
-# MARK: Variables
+# MARK: Check Data
+
+
+def get_repeat_value_report(
+    i18n_src_dict: dict[str, str],
+) -> tuple[dict[str, int], str]:
+    """
+    Derive the repeat value counts and error report for the i18n-src file.
+
+    Parameters
+    ----------
+    i18n_src_dict : dict[str, str]
+        The dictionary of i18n source keys and their associated values.
+
+    Returns
+    -------
+    dict[str, int], str
+        The repeat value counts after suggested changes and a report to be added to the error.
+    """
+    value_keys = get_value_keys(i18n_src_dict=i18n_src_dict)
 
-json_repeat_value_counts = get_repeat_value_counts(i18n_src_dict)
-json_repeat_value_counts, repeat_value_error_report = (
-    analyze_and_generate_repeat_value_report(
+    return analyze_and_generate_repeat_value_report(
         i18n_src_dict=i18n_src_dict,
-        json_repeat_value_counts=json_repeat_value_counts,
+        json_repeat_value_counts=get_repeat_value_counts(
+            i18n_src_dict=i18n_src_dict, value_keys=value_keys
+        ),
+        key_file_dict=get_intermediate("key-files"),
+        value_keys=value_keys,
+    )
+
+
+def get_similar_value_report(
+    i18n_src_dict: dict[str, str],
+) -> tuple[dict[str, list[str]], str]:
+    """
+    Derive the clusters of near-duplicate values of the i18n-src file and their error report if --similarity-threshold is set.
+
+    Parameters
+    ----------
+    i18n_src_dict : dict[str, str]
+        The dictionary of i18n source keys and their associated values.
+
+    Returns
+    -------
+    dict[str, list[str]], str
+        The clusters of near-duplicate values and a report to be added to the error, which are empty if no similarity threshold is set.
+    """
+    if get_similarity_threshold() is None:
+        return {}, ""
+
+    value_keys = get_value_keys(i18n_src_dict=i18n_src_dict)
+    similar_values = get_similar_values(value_keys=value_keys)
+
+    return similar_values, generate_similar_value_report(
+        value_keys=value_keys, similar_values=similar_values
+    )
+
+
+def get_locale_value_report(
+    i18n_src_dict: dict[str, str],
+) -> tuple[dict[str, LocaleValueIssues], str]:
+    """
+    Derive the inconsistent and repeat values of the locale files and their error report if `locale-values` is set.
+
+    Parameters
+    ----------
+    i18n_src_dict : dict[str, str]
+        The dictionary of i18n source keys and their associated values.
+
+    Returns
+    -------
+    dict[str, LocaleValueIssues], str
+        The issues of each locale and a report to be added to the error, which are empty if `locale-values` isn't set.
+    """
+    if not config_repeat_values_locale_values:
+        return {}, ""
+
+    locale_value_issues = get_locale_value_issues(
+        value_keys=get_value_keys(i18n_src_dict=i18n_src_dict)
+    )
+
+    return locale_value_issues, generate_locale_value_report(
+        locale_value_issues=locale_value_issues
     )
-)
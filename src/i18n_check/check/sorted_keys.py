@@ -12,13 +12,14 @@ Run the following script in terminal:
 >>> i18n-check -sk -f  # to fix issues automatically
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import Any
 
 from rich import print as rprint
 
+from i18n_check.file_writer import write_json_file
+from i18n_check.locale_store import get_locale_dict, get_locale_scan
 from i18n_check.utils import (
     config_i18n_directory,
     get_all_json_files,
@@ -50,6 +51,28 @@ def check_file_keys_sorted(json_data: dict[str, Any]) -> tuple[bool, list[str]]:
     return keys == sorted_keys, sorted_keys
 
 
+def is_file_sorted(file_path: str | Path) -> bool:
+    """
+    Check if keys in a specific JSON file are sorted alphabetically without sorting them.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        Path to the JSON file to check.
+
+    Returns
+    -------
+    bool
+        True if keys are sorted, False otherwise or if the file can't be read.
+    """
+    try:
+        return get_locale_scan(file_path=file_path).first_unsorted_index is None
+
+    except Exception as e:
+        rprint(f"[red]Error reading {file_path}: {e}[/red]")
+        return False
+
+
 def check_file_sorted(file_path: str | Path) -> tuple[bool, list[str]]:
     """
     Check if keys in a specific JSON file are sorted alphabetically.
@@ -67,8 +90,8 @@ def check_file_sorted(file_path: str | Path) -> tuple[bool, list[str]]:
         - list[str]: List of keys in their correct alphabetical order
     """
     try:
-        json_data = read_json_file(file_path)
-        return check_file_keys_sorted(json_data)
+        is_sorted = get_locale_scan(file_path=file_path).first_unsorted_index is None
+        return is_sorted, sorted(get_locale_dict(file_path=file_path))
 
     except Exception as e:
         rprint(f"[red]Error reading {file_path}: {e}[/red]")
@@ -95,9 +118,7 @@ def fix_sorted_keys(file_path: str | Path) -> bool:
         # Create a new dictionary with sorted keys.
         sorted_data = dict(sorted(json_data.items()))
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(sorted_data, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        write_json_file(file_path=file_path, data=sorted_data)
 
         return True
 
@@ -145,9 +166,7 @@ def sorted_keys_check_and_fix(
 
     unsorted_files: list[str] = []
     for file_path in json_files:
-        is_sorted, sorted_keys = check_file_sorted(file_path)
-
-        if not is_sorted:
+        if not is_file_sorted(file_path=file_path):
             unsorted_files.append(file_path)
 
     if unsorted_files and not fix:
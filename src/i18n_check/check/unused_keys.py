@@ -12,16 +12,18 @@ Run the following script in terminal:
 We need the message for the option to delete the keys.
 """
 
-import json
 import re
 import sys
+from functools import partial
 from pathlib import Path
 
 from rich import print as rprint
 
+from i18n_check.corpus import get_source_corpus
+from i18n_check.extraction import map_shards
+from i18n_check.file_writer import get_json_text, write_files, write_json_file
+from i18n_check.key_matcher import KeySegmentIndex
 from i18n_check.utils import (
-    collect_files_to_check,
-    config_file_types_to_check,
     config_i18n_directory,
     config_i18n_src_file,
     config_i18n_src_file_name,
@@ -29,24 +31,67 @@ from i18n_check.utils import (
     config_unused_keys_directories_to_skip,
     config_unused_keys_files_to_skip,
     config_unused_keys_regexes_to_ignore,
-    read_files_to_dict,
     read_json_file,
 )
 
 # MARK: Paths / Files
 
-i18n_src_dict = read_json_file(file_path=config_i18n_src_file)
-files_to_check = collect_files_to_check(
-    directory=config_src_directory,
-    file_types_to_check=config_file_types_to_check,
-    directories_to_skip=config_unused_keys_directories_to_skip,
-    files_to_skip=config_unused_keys_files_to_skip,
-)
-files_to_check_contents = read_files_to_dict(files=files_to_check)
+
+def get_files_to_check_contents() -> dict[str, str]:
+    """
+    Read the source files that the unused keys check searches for key usage.
+
+    Returns
+    -------
+    dict[str, str]
+        A dictionary where keys are file paths and values are file contents.
+    """
+    return get_source_corpus().view(
+        directory=config_src_directory,
+        directories_to_skip=config_unused_keys_directories_to_skip,
+        files_to_skip=config_unused_keys_files_to_skip,
+    )
+
 
 # MARK: Unused Keys
 
 
+def find_used_keys(
+    files_to_check_contents: list[tuple[str, str]], keys: list[str]
+) -> set[str]:
+    """
+    Find the translation keys that are used in a shard of files.
+
+    Parameters
+    ----------
+    files_to_check_contents : list[tuple[str, str]]
+        The filenames of the shard with their contents.
+
+    keys : list[str]
+        The keys to search for.
+
+    Returns
+    -------
+    set[str]
+        The keys that are used in any of the files.
+    """
+    contents_by_file = dict(files_to_check_contents)
+
+    # Only search the files in which all key segments are found rather than all files.
+    key_segment_index = KeySegmentIndex(files_to_check_contents=contents_by_file)
+    used_keys: set[str] = set()
+
+    for k in keys:
+        key_search_pattern = re.compile(r"[\S]*\.".join(k.split(".")))
+
+        for file in key_segment_index.candidate_files(key=k):
+            if key_search_pattern.search(contents_by_file[file]):
+                used_keys.add(k)
+                break
+
+    return used_keys
+
+
 def find_unused_keys(
     i18n_src_dict: dict[str, str], files_to_check_contents: dict[str, str]
 ) -> list[str]:
@@ -67,21 +112,22 @@ def find_unused_keys(
         A list of keys that are not used in any of the provided file contents.
     """
     all_keys = list(i18n_src_dict.keys())
-    used_keys: list[str] = []
-
-    for k in all_keys:
-        key_search_pattern = r"[\S]*\.".join(k.split("."))
-
-        for file_contents in files_to_check_contents.values():
-            if re.search(key_search_pattern, file_contents):
-                used_keys.append(k)
-                break
 
+    # Note: Ignored keys are removed first so that they aren't searched for.
     for r in config_unused_keys_regexes_to_ignore:
         pattern = re.compile(r)
         all_keys = [k for k in all_keys if not pattern.match(k)]
 
-    return list(set(all_keys) - set(used_keys))
+    # Note: Files are split into shards of similar size that are searched in parallel with --jobs.
+    used_keys: set[str] = set()
+    for shard_used_keys in map_shards(
+        function=partial(find_used_keys, keys=all_keys),
+        items=list(files_to_check_contents.items()),
+        sizes=[len(c) for c in files_to_check_contents.values()],
+    ):
+        used_keys.update(shard_used_keys)
+
+    return list(set(all_keys) - used_keys)
 
 
 # MARK: Error Outputs
@@ -179,9 +225,7 @@ def unused_keys_check_and_delete(
                 del src_data[key]
 
         # Write updated source file.
-        with open(config_i18n_src_file, "w", encoding="utf-8") as f:
-            json.dump(src_data, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        write_json_file(file_path=config_i18n_src_file, data=src_data)
 
         # Get all target JSON files.
         from i18n_check.utils import get_all_json_files
@@ -189,7 +233,7 @@ def unused_keys_check_and_delete(
         json_files = get_all_json_files(directory=config_i18n_directory)
 
         # Remove unused keys from all target files.
-        target_files_updated = 0
+        target_file_contents: dict[str, str] = {}
         for file_path in json_files:
             # Skip the source file.
             if Path(file_path).resolve() == Path(config_i18n_src_file).resolve():
@@ -204,10 +248,10 @@ def unused_keys_check_and_delete(
                     keys_removed = True
 
             if keys_removed:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(target_data, f, indent=2, ensure_ascii=False)
-                    f.write("\n")
-                target_files_updated += 1
+                target_file_contents[file_path] = get_json_text(data=target_data)
+
+        write_files(file_contents=target_file_contents)
+        target_files_updated = len(target_file_contents)
 
         # Check if sorted-keys is enabled and sort files if needed.
         try:
@@ -259,8 +303,24 @@ def unused_keys_check_and_delete(
             sys.exit(1)
 
 
-# MARK: Variables
+# MARK: Check Data
 
-unused_keys = find_unused_keys(
-    i18n_src_dict=i18n_src_dict, files_to_check_contents=files_to_check_contents
-)
+
+def get_unused_keys(i18n_src_dict: dict[str, str]) -> list[str]:
+    """
+    Derive the unused keys of the i18n-src file for the configured project.
+
+    Parameters
+    ----------
+    i18n_src_dict : dict[str, str]
+        The dictionary of i18n source keys and their associated values.
+
+    Returns
+    -------
+    list[str]
+        A list of keys that are not used in any of the source files.
+    """
+    return find_unused_keys(
+        i18n_src_dict=i18n_src_dict,
+        files_to_check_contents=get_files_to_check_contents(),
+    )
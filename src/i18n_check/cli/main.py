@@ -5,35 +5,15 @@ Setup and commands for the i18n-check command line interface.
 
 import argparse
 import sys
+from typing import Any
 
 from rich import print as rprint
 
+from i18n_check.cache import ResultCache, set_result_cache
 from i18n_check.check.all_checks import run_all_checks
-from i18n_check.check.alt_texts import alt_texts_check_and_fix
-from i18n_check.check.aria_labels import aria_labels_check_and_fix
-from i18n_check.check.key_formatting import (
-    invalid_key_formats_check_and_fix,
-    invalid_keys_by_format,
-)
-from i18n_check.check.key_naming import (
-    invalid_key_names_check_and_fix,
-    invalid_keys_by_name,
-)
 from i18n_check.check.missing_keys import missing_keys_check_and_fix
 from i18n_check.check.nested_files import nested_files_check, nested_files_check_and_fix
-from i18n_check.check.non_source_keys import non_source_keys_check, non_source_keys_dict
-from i18n_check.check.nonexistent_keys import (
-    all_used_i18n_keys,
-    nonexistent_keys_check_and_fix,
-)
-from i18n_check.check.repeat_keys import repeat_keys_check
-from i18n_check.check.repeat_values import (
-    json_repeat_value_counts,
-    repeat_value_error_report,
-    repeat_values_check,
-)
-from i18n_check.check.sorted_keys import sorted_keys_check_and_fix
-from i18n_check.check.unused_keys import unused_keys, unused_keys_check
+from i18n_check.check.registry import run_check
 from i18n_check.cli.generate_config_file import (
     config_file_is_valid,
     generate_config_file,
@@ -41,6 +21,59 @@ from i18n_check.cli.generate_config_file import (
 from i18n_check.cli.generate_test_frontends import generate_test_frontends
 from i18n_check.cli.upgrade import upgrade_cli
 from i18n_check.cli.version import get_version_message
+from i18n_check.extraction import set_jobs
+from i18n_check.file_writer import set_dry_run
+from i18n_check.intermediates import get_intermediate
+from i18n_check.locale_store import set_stream_json
+from i18n_check.similarity import set_similarity_threshold
+
+
+class _VersionAction(argparse.Action):
+    """
+    Print the version message only when the version argument is passed.
+
+    Note: The argparse 'version' action requires the message when the parser is built,
+    which would mean a request to GitHub for every invocation of the CLI.
+
+    Parameters
+    ----------
+    option_strings : list[str]
+        The option strings for the argument.
+
+    dest : str, default=argparse.SUPPRESS
+        The attribute name in the parsed namespace.
+
+    default : Any, default=argparse.SUPPRESS
+        The default value of the argument.
+
+    help : str, optional
+        The help message for the argument.
+    """
+
+    def __init__(
+        self,
+        option_strings: list[str],
+        dest: str = argparse.SUPPRESS,
+        default: Any = argparse.SUPPRESS,
+        help: str | None = None,
+    ) -> None:
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> None:
+        print(get_version_message())
+        parser.exit()
 
 
 def main() -> None:
@@ -79,6 +112,14 @@ def main() -> None:
     - --fix (-f): Automatically fix key issues. Can be used with -kf, -kn, -nk, -sk, -mk, -al, -at or -nf.
     - --locale (-l): Specify locale for interactive key addition.
     - --delete (-d): Delete unused keys or non-source keys from JSON files. Can be used with -uk or -nsk.
+    - --no-cache (-nc): Process all files rather than reusing results cached in .i18n-check-cache.
+    - --stream-json (-sj): Stream the keys and values of JSON files rather than loading them to check very large locale files in bounded memory.
+    - --jobs (-j): The number of processes that source files are searched for keys with, with 0 using one per CPU.
+    - --similarity-threshold (-sim): Also report groups of near-duplicate values whose character trigrams are at least this similar. Can be used with -rv or -a. Runs take about 2-2.5x as long as without it at 0.8 to 0.9 and over 3x at 0.5.
+    - --changed-since (-cs): Only run the checks that could be affected by files changed since a git reference. Can be used with -a, but not with -st.
+    - --staged (-st): Only run the checks that could be affected by files staged in git. Can be used with -a, but not with -cs.
+    - --watch (-w): Run all checks and rerun the affected checks whenever files change.
+    - --timings (-tm): Show how long each check and the setup of the process pool took. Can be used with -a.
 
     Examples
     --------
@@ -87,6 +128,10 @@ def main() -> None:
     >>> i18n-check --key-formatting --fix  # -kf -f
     >>> i18n-check --key-naming --fix  # -kn -f
     >>> i18n-check --all-checks  # -a
+    >>> i18n-check --all-checks --staged  # -a -st
+    >>> i18n-check --all-checks --jobs 8  # -a -j 8
+    >>> i18n-check --repeat-values --similarity-threshold 0.8  # -rv -sim 0.8
+    >>> i18n-check --watch  # -w
     >>> i18n-check --missing-keys --fix --locale ENTER_ISO_2_CODE  # interactive mode to add missing keys
     """
     # MARK: CLI Base
@@ -103,8 +148,7 @@ def main() -> None:
     parser.add_argument(
         "-v",
         "--version",
-        action="version",
-        version=f"{get_version_message()}",
+        action=_VersionAction,
         help="Show the version of the i18n-check CLI.",
     )
 
@@ -241,6 +285,76 @@ def main() -> None:
         help="Delete unused keys or non-source keys from JSON files. Can be used with -uk or -nsk.",
     )
 
+    parser.add_argument(
+        "-dr",
+        "--dry-run",
+        action="store_true",
+        help="Print the changes that -f or -d would make to files as unified diffs without writing them.",
+    )
+
+    parser.add_argument(
+        "-nc",
+        "--no-cache",
+        action="store_true",
+        help="Process all files rather than reusing results cached in .i18n-check-cache.",
+    )
+
+    parser.add_argument(
+        "-sj",
+        "--stream-json",
+        action="store_true",
+        help="Stream the keys and values of JSON files rather than loading them to check very large locale files in bounded memory.",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="The number of processes that source files are searched for keys with, with 0 using one per CPU.",
+    )
+
+    parser.add_argument(
+        "-sim",
+        "--similarity-threshold",
+        type=float,
+        metavar="THRESHOLD",
+        help="Also report groups of near-duplicate values whose character trigrams are at least this similar. Can be used with -rv or -a. Runs take about 2-2.5x as long as without it at 0.8 to 0.9 and over 3x at 0.5.",
+    )
+
+    # Note: Only one set of changed files is checked, so the options can't be passed together.
+    changed_files_group = parser.add_mutually_exclusive_group()
+
+    changed_files_group.add_argument(
+        "-cs",
+        "--changed-since",
+        type=str,
+        metavar="REF",
+        help="Only run the checks that could be affected by files changed since a git reference. Can be used with -a, but not with -st.",
+    )
+
+    changed_files_group.add_argument(
+        "-st",
+        "--staged",
+        action="store_true",
+        help="Only run the checks that could be affected by files staged in git. Can be used with -a, but not with -cs.",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Run all checks and rerun the affected checks whenever files change.",
+    )
+
+    parser.add_argument(
+        "-tm",
+        "--timings",
+        action="store_true",
+        help="Show how long each check and the setup of the process pool took. Can be used with -a.",
+    )
+
     # MARK: Setup CLI
 
     args = parser.parse_args()
@@ -262,72 +376,101 @@ def main() -> None:
 
     # MARK: Run Checks
 
+    if args.no_cache:
+        set_result_cache(ResultCache(enabled=False))
+
+    if args.dry_run:
+        set_dry_run(True)
+
+    if args.stream_json:
+        set_stream_json(True)
+
+    set_jobs(args.jobs)
+
+    if args.similarity_threshold is not None:
+        if not 0 < args.similarity_threshold <= 1:
+            rprint(
+                "[red]❌ Error: --similarity-threshold (-sim) needs to be greater than 0 and at most 1.[/red]"
+            )
+            sys.exit(1)
+
+        set_similarity_threshold(args.similarity_threshold)
+
+    if args.watch:
+        from i18n_check.watch import CheckWatcher
+
+        CheckWatcher().watch()
+        return
+
     if args.all_checks:
         run_all_checks(args=args)
         return
 
-    if args.key_formatting:
-        invalid_key_formats_check_and_fix(
-            invalid_keys_by_format=invalid_keys_by_format,
-            all_checks_enabled=False,
-            fix=args.fix,
+    if args.changed_since or args.staged:
+        rprint(
+            "[red]❌ Error: --changed-since (-cs) and --staged (-st) can only be used with --all-checks (-a)[/red]"
         )
+        sys.exit(1)
+
+    # Note: Checks derive their data when ran so that only the selected check does work.
+    if args.key_formatting:
+        run_check("key-formatting", fix=args.fix)
         return
 
     if args.key_naming:
-        invalid_key_names_check_and_fix(
-            invalid_keys_by_name=invalid_keys_by_name,
-            all_checks_enabled=False,
-            fix=args.fix,
-        )
+        run_check("key-naming", fix=args.fix)
         return
 
     if args.nonexistent_keys:
-        nonexistent_keys_check_and_fix(
-            all_used_i18n_keys=all_used_i18n_keys,
-            fix=args.fix,
-        )
+        run_check("nonexistent-keys", fix=args.fix)
         return
 
     if args.unused_keys:
         if args.delete:
             from i18n_check.check.unused_keys import (
+                get_unused_keys,
                 unused_keys_check_and_delete,  # needed for tests
             )
 
-            unused_keys_check_and_delete(unused_keys=unused_keys)
+            unused_keys_check_and_delete(
+                unused_keys=get_unused_keys(
+                    i18n_src_dict=get_intermediate("i18n-src-dict")
+                )
+            )
 
         else:
-            unused_keys_check(unused_keys=unused_keys)
+            run_check("unused-keys")
 
         return
 
     if args.non_source_keys:
         if args.delete:
             from i18n_check.check.non_source_keys import (
+                get_non_source_keys,
                 non_source_keys_check_and_delete,  # needed for tests
             )
 
-            non_source_keys_check_and_delete(non_source_keys_dict=non_source_keys_dict)
+            non_source_keys_check_and_delete(
+                non_source_keys_dict=get_non_source_keys(
+                    i18n_src_dict=get_intermediate("i18n-src-dict")
+                )
+            )
 
         else:
-            non_source_keys_check(non_source_keys_dict=non_source_keys_dict)
+            run_check("non-source-keys")
 
         return
 
     if args.repeat_keys:
-        repeat_keys_check()
+        run_check("repeat-keys")
         return
 
     if args.repeat_values:
-        repeat_values_check(
-            json_repeat_value_counts=json_repeat_value_counts,
-            repeat_value_error_report=repeat_value_error_report,
-        )
+        run_check("repeat-values")
         return
 
     if args.sorted_keys:
-        sorted_keys_check_and_fix(fix=args.fix)
+        run_check("sorted-keys", fix=args.fix)
         return
 
     if args.nested_files:
@@ -341,7 +484,9 @@ def main() -> None:
 
     if args.missing_keys:
         if args.fix and args.locale:
-            missing_keys_check_and_fix(fix_locale=args.locale)
+            missing_keys_check_and_fix(
+                i18n_src_dict=get_intermediate("i18n-src-dict"), fix_locale=args.locale
+            )
 
         elif args.fix:
             rprint(
@@ -351,16 +496,16 @@ def main() -> None:
             sys.exit(1)
 
         else:
-            missing_keys_check_and_fix()
+            missing_keys_check_and_fix(i18n_src_dict=get_intermediate("i18n-src-dict"))
 
         return
 
     if args.aria_labels:
-        aria_labels_check_and_fix(fix=args.fix)
+        run_check("aria-labels", fix=args.fix)
         return
 
     if args.alt_texts:
-        alt_texts_check_and_fix(fix=args.fix)
+        run_check("alt-texts", fix=args.fix)
         return
 
     parser.print_help()
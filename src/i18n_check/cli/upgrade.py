@@ -26,7 +26,7 @@ def upgrade_cli() -> None:
         If the installation of the latest version fails.
     """
     local_version = get_local_version()
-    latest_version_message = get_latest_version()
+    latest_version_message = get_latest_version(use_cache=False)
 
     if latest_version_message == UNKNOWN_VERSION_NOT_FETCHED:
         print(
@@ -4,14 +4,89 @@ Functions for checking current version of the i18n-check CLI.
 """
 
 import importlib.metadata
+import json
+import os
+import sys
+import time
+from pathlib import Path
 from typing import Any
 
-import requests
-
 UNKNOWN_VERSION = "Unknown i18n-check version"
 UNKNOWN_VERSION_NOT_PIP = f"{UNKNOWN_VERSION} (Not installed via pip)"
 UNKNOWN_VERSION_NOT_FETCHED = f"{UNKNOWN_VERSION} (Unable to fetch version)"
 
+LATEST_RELEASE_URL = (
+    "https://api.github.com/repos/activist-org/i18n-check/releases/latest"
+)
+# Note: Short so that air-gapped environments aren't blocked waiting on GitHub.
+LATEST_VERSION_REQUEST_TIMEOUT = 3
+LATEST_VERSION_CACHE_TTL = 60 * 60 * 24
+
+
+def get_user_cache_dir() -> Path:
+    """
+    Get the directory in which i18n-check caches data for the current user.
+
+    Returns
+    -------
+    Path
+        The platform specific user cache directory for i18n-check.
+    """
+    if os.name == "nt":
+        base_dir = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+
+    elif sys.platform == "darwin":
+        base_dir = Path.home() / "Library" / "Caches"
+
+    else:
+        base_dir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+
+    return Path(base_dir) / "i18n-check"
+
+
+def _read_cached_latest_version() -> str | None:
+    """
+    Read the latest release name from the user cache if it hasn't expired.
+
+    Returns
+    -------
+    str | None
+        The cached name of the latest release or None if there is no valid cache.
+    """
+    cache_file = get_user_cache_dir() / "latest_version.json"
+
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        if time.time() - cached["fetched_at"] < LATEST_VERSION_CACHE_TTL:
+            return cached["name"]
+
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    return None
+
+
+def _write_cached_latest_version(name: str) -> None:
+    """
+    Write the latest release name to the user cache.
+
+    Parameters
+    ----------
+    name : str
+        The name of the latest release of i18n-check.
+    """
+    cache_file = get_user_cache_dir() / "latest_version.json"
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            json.dumps({"name": name, "fetched_at": time.time()}), encoding="utf-8"
+        )
+
+    except OSError:
+        # Note: Caching is an optimization, so an unwritable cache dir isn't an error.
+        pass
+
 
 def get_local_version() -> str:
     """
@@ -30,26 +105,41 @@ def get_local_version() -> str:
         return UNKNOWN_VERSION_NOT_PIP
 
 
-def get_latest_version() -> Any:
+def get_latest_version(use_cache: bool = True) -> Any:
     """
     Get the latest version of the i18n-check package from GitHub.
 
+    Parameters
+    ----------
+    use_cache : bool, optional, default=True
+        Whether a latest version that was fetched within the cache TTL can be returned.
+
     Returns
     -------
     Any
         The latest version of the i18n-check package, or a message indicating
         that the version could not be fetched.
     """
+    if use_cache and (cached_latest_version := _read_cached_latest_version()):
+        return cached_latest_version
+
     try:
+        # Note: Imported here to keep requests out of the import graph of check runs.
+        import requests
+
         response = requests.get(
-            "https://api.github.com/repos/activist-org/i18n-check/releases/latest"
+            LATEST_RELEASE_URL, timeout=LATEST_VERSION_REQUEST_TIMEOUT
         )
         response_data: dict[str, Any] = response.json()
-        return response_data["name"]
+        latest_version = response_data["name"]
 
     except Exception:
         return UNKNOWN_VERSION_NOT_FETCHED
 
+    _write_cached_latest_version(name=latest_version)
+
+    return latest_version
+
 
 def get_version_message() -> str:
     """
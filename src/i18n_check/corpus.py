@@ -0,0 +1,290 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Source corpus that walks and reads the files of the project once for all checks.
+"""
+
+import mmap
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from i18n_check.path_patterns import SkipRules
+from i18n_check.utils import (
+    clear_collected_files_caches,
+    collect_files_to_check,
+    config_file_types_to_check,
+    config_global_directories_to_skip,
+    config_global_files_to_skip,
+    config_global_respect_gitignore,
+)
+
+# Note: Smaller files are read as mapping them costs more than reading them.
+MMAP_MIN_FILE_SIZE = 1 << 20
+
+# MARK: Source Corpus
+
+
+class SourceCorpus:
+    """
+    The source files of the project that are shared between checks.
+
+    Each directory is walked once with the global skip lists, and each file is read and decoded once.
+    Checks with their own skip lists receive views over the shared files.
+
+    Parameters
+    ----------
+    file_types_to_check : list[str], default=`file-types-to-check`
+        The extensions for files to include in the corpus.
+
+    directories_to_skip : list[Path], default=global `directories-to-skip`
+        Paths or glob patterns of directories to not include in the corpus.
+
+    files_to_skip : list[Path], default=global `files-to-skip`
+        Paths or glob patterns of files to not include in the corpus.
+
+    respect_gitignore : bool, default=global `respect-gitignore`
+        Whether to not include the files and directories that .gitignore files ignore.
+    """
+
+    def __init__(
+        self,
+        file_types_to_check: list[str] = config_file_types_to_check,
+        directories_to_skip: list[Path] = config_global_directories_to_skip,
+        files_to_skip: list[Path] = config_global_files_to_skip,
+        respect_gitignore: bool = config_global_respect_gitignore,
+    ) -> None:
+        self.file_types_to_check = list(file_types_to_check)
+        self.directories_to_skip = list(directories_to_skip)
+        self.files_to_skip = list(files_to_skip)
+        self.respect_gitignore = respect_gitignore
+
+        self._files_by_directory: dict[str, list[str]] = {}
+        # Note: File stats are stored with contents so edits from fixes are picked up.
+        self._contents: dict[str, tuple[tuple[int, int], str]] = {}
+        # Note: Intermediates are computed in threads that share the corpus.
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Get the state of the corpus for pickling it to worker processes without its lock.
+
+        Returns
+        -------
+        dict[str, Any]
+            The attributes of the corpus other than its lock.
+        """
+        return {k: v for k, v in self.__dict__.items() if k != "_lock"}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """
+        Restore the state of a pickled corpus with a new lock.
+
+        Parameters
+        ----------
+        state : dict[str, Any]
+            The attributes of the corpus other than its lock.
+        """
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def files(
+        self,
+        directory: str | Path,
+        directories_to_skip: list[Path] | None = None,
+        files_to_skip: list[Path] | None = None,
+    ) -> list[str]:
+        """
+        Get the files of the corpus within a directory.
+
+        Parameters
+        ----------
+        directory : str | Path
+            The directory to get the files of.
+
+        directories_to_skip : list[Path], optional
+            Additional paths or glob patterns of directories to exclude from the returned files.
+
+        files_to_skip : list[Path], optional
+            Additional paths or glob patterns of files to exclude from the returned files.
+
+        Returns
+        -------
+        list[str]
+            The resolved paths of the files within the directory.
+        """
+        directory_str = str(Path(directory).resolve())
+        # Note: Walks happen within the lock so that a directory is never walked by two threads at once.
+        with self._lock:
+            if directory_str not in self._files_by_directory:
+                self._files_by_directory[directory_str] = collect_files_to_check(
+                    directory=directory_str,
+                    file_types_to_check=self.file_types_to_check,
+                    directories_to_skip=self.directories_to_skip,
+                    files_to_skip=self.files_to_skip,
+                    respect_gitignore=self.respect_gitignore,
+                )
+
+            directory_files = self._files_by_directory[directory_str]
+        if not directories_to_skip and not files_to_skip:
+            return list(directory_files)
+
+        skip_rules = SkipRules(
+            directories_to_skip=directories_to_skip or [],
+            files_to_skip=files_to_skip or [],
+        )
+
+        return [
+            f
+            for f in directory_files
+            if not skip_rules.skips_file_or_directory(file_path=f)
+        ]
+
+    def clear_files(self) -> None:
+        """
+        Forget the files that were found in directories so that added and removed files are picked up.
+
+        The contents of files that still exist are kept as these are validated when read.
+        """
+        with self._lock:
+            clear_collected_files_caches()
+            self._files_by_directory.clear()
+            self._contents = {
+                f: contents
+                for f, contents in self._contents.items()
+                if os.path.isfile(f)
+            }
+
+    def read(self, file_path: str) -> str:
+        """
+        Get the decoded contents of a file, reading it only if it's new or has changed.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the file to read.
+
+        Returns
+        -------
+        str
+            The contents of the file.
+        """
+        file_stat = os.stat(file_path)
+        stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        cached = self._contents.get(file_path)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            contents = f.read()
+
+        # Note: Files are read outside of the lock so that threads can read different files at once.
+        with self._lock:
+            self._contents[file_path] = (stat_key, contents)
+
+        return contents
+
+    def view(
+        self,
+        directory: str | Path,
+        directories_to_skip: list[Path] | None = None,
+        files_to_skip: list[Path] | None = None,
+    ) -> dict[str, str]:
+        """
+        Get the contents of the files of the corpus within a directory.
+
+        Parameters
+        ----------
+        directory : str | Path
+            The directory to get the file contents of.
+
+        directories_to_skip : list[Path], optional
+            Additional paths or glob patterns of directories to exclude from the view.
+
+        files_to_skip : list[Path], optional
+            Additional paths or glob patterns of files to exclude from the view.
+
+        Returns
+        -------
+        dict[str, str]
+            A dictionary where keys are file paths and values are file contents.
+        """
+        return {
+            f: self.read(f)
+            for f in self.files(
+                directory=directory,
+                directories_to_skip=directories_to_skip,
+                files_to_skip=files_to_skip,
+            )
+        }
+
+
+# MARK: File Bytes
+
+
+@contextmanager
+def open_file_bytes(
+    file_path: str | Path, mmap_min_file_size: int = MMAP_MIN_FILE_SIZE
+) -> Iterator[bytes | mmap.mmap]:
+    """
+    Open the undecoded contents of a file without keeping them, memory-mapping large files.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the file to open.
+
+    mmap_min_file_size : int, default=MMAP_MIN_FILE_SIZE
+        The size in bytes from which files are memory-mapped rather than read.
+
+    Returns
+    -------
+    Iterator[bytes | mmap.mmap]
+        The contents of the file, which are only valid within the context.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < max(mmap_min_file_size, 1):
+            yield f.read()
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as contents:
+            yield contents
+
+
+# MARK: Shared Corpus
+
+_source_corpus: SourceCorpus | None = None
+
+
+def get_source_corpus() -> SourceCorpus:
+    """
+    Get the source corpus that is shared by all checks in the current process.
+
+    Returns
+    -------
+    SourceCorpus
+        The shared source corpus, which is created on first use.
+    """
+    global _source_corpus
+
+    if _source_corpus is None:
+        _source_corpus = SourceCorpus()
+
+    return _source_corpus
+
+
+def set_source_corpus(corpus: SourceCorpus | None) -> None:
+    """
+    Set the source corpus that is shared by all checks in the current process.
+
+    Parameters
+    ----------
+    corpus : SourceCorpus | None
+        The corpus to share, or None to have a new corpus created on next use.
+    """
+    global _source_corpus
+
+    _source_corpus = corpus
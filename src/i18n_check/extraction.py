@@ -0,0 +1,286 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Sharded extraction of results from source files across processes for very large projects.
+
+Files are split into shards of similar total size that worker processes work through,
+with each worker returning compact results such as the keys of each file that are merged in the main process.
+
+Examples
+--------
+Run the following script in terminal:
+
+>>> i18n-check -nk --jobs 8
+"""
+
+import heapq
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.context import BaseContext
+from typing import Any, TypeVar
+
+from i18n_check.cache import get_result_cache, hash_text
+from i18n_check.corpus import open_file_bytes
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Note: Each job gets several shards so that workers that finish early take on remaining ones.
+SHARDS_PER_JOB = 4
+# Note: Starting worker processes costs more than extracting from less than this many bytes.
+PARALLEL_MIN_TOTAL_SIZE = 1 << 22
+
+_jobs = 1
+
+# MARK: Jobs
+
+
+def set_jobs(jobs: int) -> None:
+    """
+    Set the number of processes that results are extracted from source files with in the current process.
+
+    Parameters
+    ----------
+    jobs : int
+        The number of processes, with 0 or less using one process per CPU.
+    """
+    global _jobs
+
+    _jobs = jobs if jobs > 0 else os.cpu_count() or 1
+
+
+def get_jobs() -> int:
+    """
+    Get the number of processes that results are extracted from source files with in the current process.
+
+    Returns
+    -------
+    int
+        The number of processes, with 1 meaning that results are extracted in the current process.
+    """
+    return _jobs
+
+
+def get_pool_context() -> BaseContext:
+    """
+    Get the multiprocessing context for the processes that extract results from shards.
+
+    Returns
+    -------
+    BaseContext
+        The forkserver context where it's available and the spawn context otherwise.
+    """
+    # Note: Extraction can run while other threads compute intermediates, so the process isn't forked.
+    if "forkserver" in get_all_start_methods():
+        return get_context("forkserver")
+
+    return get_context("spawn")
+
+
+# MARK: Shards
+
+
+def shard_items(items: list[T], sizes: list[int], shard_count: int) -> list[list[T]]:
+    """
+    Split items into shards of similar total size.
+
+    The largest items are assigned first, each to the shard that is smallest at that point.
+
+    Parameters
+    ----------
+    items : list[T]
+        The items to split, such as file paths.
+
+    sizes : list[int]
+        The size of each item, such as the size of the file in bytes.
+
+    shard_count : int
+        The maximum number of shards.
+
+    Returns
+    -------
+    list[list[T]]
+        The non-empty shards from the largest to the smallest with the items of each in their original order.
+    """
+    shard_count = max(1, min(shard_count, len(items)))
+    shard_heap = [(0, shard) for shard in range(shard_count)]
+    shard_indexes: list[list[int]] = [[] for _ in range(shard_count)]
+    shard_sizes = [0] * shard_count
+
+    for index in sorted(range(len(items)), key=lambda i: -sizes[i]):
+        shard_size, shard = heapq.heappop(shard_heap)
+        shard_indexes[shard].append(index)
+        shard_sizes[shard] = shard_size + sizes[index]
+        heapq.heappush(shard_heap, (shard_sizes[shard], shard))
+
+    return [
+        [items[i] for i in sorted(shard_indexes[shard])]
+        for shard in sorted(range(shard_count), key=lambda s: -shard_sizes[s])
+        if shard_indexes[shard]
+    ]
+
+
+def map_shards(
+    function: Callable[[list[T]], R],
+    items: list[T],
+    sizes: list[int],
+    jobs: int | None = None,
+    parallel_min_total_size: int | None = None,
+) -> list[R]:
+    """
+    Apply a function to shards of items, with the shards processed in parallel by worker processes.
+
+    Parameters
+    ----------
+    function : Callable[[list[T]], R]
+        A function that can be pickled that derives a result from a shard of items.
+
+    items : list[T]
+        The items to split into shards.
+
+    sizes : list[int]
+        The size of each item, which shards are balanced by.
+
+    jobs : int, optional
+        The number of worker processes, defaulting to the number that's set by --jobs.
+
+    parallel_min_total_size : int, optional
+        The total size of the items from which they are processed by worker processes, defaulting to PARALLEL_MIN_TOTAL_SIZE.
+
+    Returns
+    -------
+    list[R]
+        The result of each shard, or the result of all items as one shard if they aren't processed in parallel.
+    """
+    if jobs is None:
+        jobs = _jobs
+
+    if parallel_min_total_size is None:
+        parallel_min_total_size = PARALLEL_MIN_TOTAL_SIZE
+
+    if jobs <= 1 or len(items) < 2 or sum(sizes) < parallel_min_total_size:
+        return [function(items)]
+
+    shards = shard_items(items=items, sizes=sizes, shard_count=jobs * SHARDS_PER_JOB)
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(shards)), mp_context=get_pool_context()
+    ) as executor:
+        return list(executor.map(function, shards))
+
+
+# MARK: File Results
+
+
+class FileExtractor:
+    """
+    Extract the results of a shard of files from their contents.
+
+    Instances are passed to worker processes, so the extract function needs to be able to be pickled.
+
+    Parameters
+    ----------
+    extract : Callable[[bytes], Any]
+        A function that derives a JSON serializable result from the undecoded contents of a file.
+    """
+
+    def __init__(self, extract: Callable[[bytes], Any]) -> None:
+        self.extract = extract
+
+    def __call__(
+        self, shard: list[tuple[str, str | None]]
+    ) -> dict[str, tuple[str, Any]]:
+        """
+        Extract the results of the files of a shard whose contents have changed.
+
+        Parameters
+        ----------
+        shard : list[tuple[str, str | None]]
+            The paths of the files with the hashes of their cached contents.
+
+        Returns
+        -------
+        dict[str, tuple[str, Any]]
+            A dictionary where keys are file paths and values are the hashes of their contents and their results,
+            with the result being None if the contents haven't changed.
+        """
+        results: dict[str, tuple[str, Any]] = {}
+        for file_path, cached_hash in shard:
+            # Note: Files are opened one at a time and their contents aren't kept.
+            with open_file_bytes(file_path=file_path) as contents:
+                contents_hash = hash_text(contents)
+                results[file_path] = (
+                    contents_hash,
+                    None if contents_hash == cached_hash else self.extract(contents),
+                )
+
+        return results
+
+
+def get_file_results(
+    namespace: str,
+    file_paths: list[str],
+    extract: Callable[[bytes], Any],
+    fingerprint: str = "",
+    jobs: int | None = None,
+) -> dict[str, Any]:
+    """
+    Get the results of files from the result cache, extracting those of changed files in parallel.
+
+    Parameters
+    ----------
+    namespace : str
+        The name of the group of results in the result cache.
+
+    file_paths : list[str]
+        The paths to the files to get the results of.
+
+    extract : Callable[[bytes], Any]
+        A function that can be pickled that derives a JSON serializable result from the undecoded contents of a file.
+
+    fingerprint : str, default=""
+        A hash of any inputs other than the file contents that the results depend on.
+
+    jobs : int, optional
+        The number of worker processes, defaulting to the number that's set by --jobs.
+
+    Returns
+    -------
+    dict[str, Any]
+        A dictionary where keys are file paths and values are their results.
+    """
+    file_extractor = FileExtractor(extract=extract)
+
+    def compute_missing(
+        missing: list[tuple[str, str | None]],
+    ) -> dict[str, tuple[str, Any]]:
+        """
+        Extract the results of the files that aren't cached.
+
+        Parameters
+        ----------
+        missing : list[tuple[str, str | None]]
+            The paths of the files with the hashes of their cached contents.
+
+        Returns
+        -------
+        dict[str, tuple[str, Any]]
+            A dictionary where keys are file paths and values are the hashes of their contents and their results.
+        """
+        computed: dict[str, tuple[str, Any]] = {}
+        for shard_results in map_shards(
+            function=file_extractor,
+            items=missing,
+            sizes=[os.path.getsize(f) for f, _ in missing],
+            jobs=jobs,
+        ):
+            computed.update(shard_results)
+
+        return computed
+
+    return get_result_cache().get_many(
+        namespace=namespace,
+        file_paths=list(dict.fromkeys(file_paths)),
+        compute_missing=compute_missing,
+        fingerprint=fingerprint,
+    )
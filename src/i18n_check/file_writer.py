@@ -0,0 +1,277 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Writes the files that are changed when fixing or deleting keys.
+
+Files are written to a temporary file that is flushed to disk and renamed into place so that an interrupted fix or a crash never leaves a partial file.
+Files whose contents wouldn't change aren't written, and for a dry run the changes are printed as diffs instead.
+
+Examples
+--------
+Run the following script in terminal:
+
+>>> i18n-check -kn -f --dry-run
+"""
+
+import difflib
+import json
+import os
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from rich import print as rprint
+
+_dry_run = False
+
+# MARK: Dry Run
+
+
+def set_dry_run(dry_run: bool) -> None:
+    """
+    Set whether changes to files are printed as diffs rather than written in the current process.
+
+    Parameters
+    ----------
+    dry_run : bool
+        Whether changes to files should only be printed.
+    """
+    global _dry_run
+
+    _dry_run = dry_run
+
+
+def is_dry_run() -> bool:
+    """
+    Check whether changes to files are printed as diffs rather than written in the current process.
+
+    Returns
+    -------
+    bool
+        True if changes to files are only printed.
+    """
+    return _dry_run
+
+
+def get_file_diff(file_path: str | Path, old_content: str, new_content: str) -> str:
+    """
+    Get the unified diff of the changes to a file.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the file that is changed.
+
+    old_content : str
+        The current contents of the file.
+
+    new_content : str
+        The contents that the file would be changed to.
+
+    Returns
+    -------
+    str
+        The unified diff of the file.
+    """
+    return "".join(
+        difflib.unified_diff(
+            old_content.splitlines(keepends=True),
+            new_content.splitlines(keepends=True),
+            fromfile=f"a/{file_path}",
+            tofile=f"b/{file_path}",
+        )
+    )
+
+
+# MARK: Writing
+
+
+def get_json_text(data: Any) -> str:
+    """
+    Format data as the contents of a JSON file of the project.
+
+    Parameters
+    ----------
+    data : Any
+        The data to format.
+
+    Returns
+    -------
+    str
+        The JSON with an indentation of two spaces and a trailing newline.
+    """
+    return json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+
+
+def write_file(
+    file_path: str | Path, content: str, old_content: str | None = None
+) -> bool:
+    """
+    Write contents to a file atomically if they differ from its current contents.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the file to write.
+
+    content : str
+        The contents to write to the file.
+
+    old_content : str, optional
+        The current contents of the file if the caller has already read them, with the file being read if not passed.
+
+    Returns
+    -------
+    bool
+        True if the file was changed, or would have been changed for a dry run.
+    """
+    if old_content is None:
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                old_content = f.read()
+
+        except (OSError, UnicodeDecodeError):
+            old_content = None
+
+    if content == old_content:
+        return False
+
+    if _dry_run:
+        rprint(f"\n[yellow]📝 Dry run: {file_path} would be changed.[/yellow]")
+        print(
+            get_file_diff(
+                file_path=file_path, old_content=old_content or "", new_content=content
+            ),
+            end="",
+        )
+        return True
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    # Note: Written next to the file so the rename is atomic and doesn't cross file systems.
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=directory,
+        prefix=f".{os.path.basename(file_path)}.",
+        suffix=".tmp",
+        delete=False,
+    ) as f:
+        f.write(content)
+        # Note: Flushed to disk before the rename so a crash can't leave the file renamed but empty.
+        f.flush()
+        os.fsync(f.fileno())
+
+    try:
+        if old_content is not None:
+            # Note: Temporary files are only readable by their owner, so the permissions of the file are kept.
+            os.chmod(f.name, stat.S_IMODE(os.stat(file_path).st_mode))
+
+        os.replace(f.name, file_path)
+
+    except OSError:
+        os.remove(f.name)
+        raise
+
+    _fsync_directory(directory=directory)
+
+    return True
+
+
+def _fsync_directory(directory: str) -> None:
+    """
+    Flush the entries of a directory to disk so that a file renamed into it persists after a crash.
+
+    Errors are ignored as the file has already been written, and directories can't be opened on Windows.
+
+    Parameters
+    ----------
+    directory : str
+        The path to the directory to flush.
+    """
+    if os.name == "nt":
+        return
+
+    try:
+        directory_fd = os.open(directory, os.O_RDONLY)
+
+    except OSError:
+        return
+
+    try:
+        os.fsync(directory_fd)
+
+    except OSError:
+        pass
+
+    finally:
+        os.close(directory_fd)
+
+
+def write_json_file(file_path: str | Path, data: Any) -> bool:
+    """
+    Write data to a JSON file atomically if it differs from its current contents.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the JSON file to write.
+
+    data : Any
+        The data to write to the file.
+
+    Returns
+    -------
+    bool
+        True if the file was changed, or would have been changed for a dry run.
+    """
+    return write_file(file_path=file_path, content=get_json_text(data=data))
+
+
+def write_files(
+    file_contents: dict[str, str],
+    max_workers: int | None = None,
+    old_contents: dict[str, str] | None = None,
+) -> list[str]:
+    """
+    Write contents to many files, with the files written in parallel as writing is bound by I/O.
+
+    Parameters
+    ----------
+    file_contents : dict[str, str]
+        A dictionary where keys are paths of files and values are the contents to write to them.
+
+    max_workers : int, optional
+        The maximum number of threads used to write files.
+
+    old_contents : dict[str, str], optional
+        A dictionary where keys are paths of files and values are their current contents if the caller has already read them,
+        with files that aren't included being read.
+
+    Returns
+    -------
+    list[str]
+        The paths of the files that were changed, or would have been changed for a dry run.
+    """
+    if old_contents is None:
+        old_contents = {}
+
+    # Note: Diffs are printed in order for a dry run.
+    if _dry_run or len(file_contents) < 2:
+        return [
+            f
+            for f, c in file_contents.items()
+            if write_file(file_path=f, content=c, old_content=old_contents.get(f))
+        ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        changed = list(
+            executor.map(
+                write_file,
+                file_contents,
+                file_contents.values(),
+                [old_contents.get(f) for f in file_contents],
+            )
+        )
+
+    return [f for f, file_changed in zip(file_contents, changed) if file_changed]
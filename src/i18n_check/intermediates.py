@@ -0,0 +1,396 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Graph of the intermediate results that are shared between checks.
+
+Each intermediate is computed once per process after the intermediates it depends on.
+When all checks are ran, the intermediates they need are computed in the main process with independent ones in parallel.
+"""
+
+import re
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+from i18n_check.cache import hash_text
+from i18n_check.corpus import SourceCorpus, get_source_corpus
+from i18n_check.extraction import get_file_results
+from i18n_check.key_matcher import KeyMatcher, SourceKeyExtractor, get_i18n_key_pattern
+from i18n_check.locale_store import (
+    LocaleScan,
+    LocaleStore,
+    get_locale_scan,
+    get_locale_store,
+)
+from i18n_check.utils import (
+    config_i18n_directory,
+    config_i18n_src_file,
+    config_nonexistent_keys_key_prefixes,
+    config_nonexistent_keys_key_quotes,
+    config_nonexistent_keys_search_dirs,
+    config_src_directory,
+    get_all_json_files,
+    read_json_file,
+)
+
+# MARK: Compute
+
+
+def _compute_i18n_src_dict() -> dict[str, str]:
+    """
+    Read the i18n-src file.
+
+    Returns
+    -------
+    dict[str, str]
+        The dictionary of i18n source keys and their associated values.
+    """
+    return read_json_file(file_path=config_i18n_src_file)
+
+
+def _compute_locale_files() -> LocaleStore:
+    """
+    Parse all JSON files in the i18n-dir.
+
+    Returns
+    -------
+    LocaleStore
+        The shared locale store with the JSON files parsed.
+    """
+    locale_store = get_locale_store()
+    locale_store.load(directory=config_i18n_directory)
+
+    return locale_store
+
+
+def _compute_locale_scans() -> dict[str, LocaleScan]:
+    """
+    Scan all JSON files in the i18n-dir for repeat keys, unsorted keys and nesting.
+
+    Returns
+    -------
+    dict[str, LocaleScan]
+        A dictionary where keys are JSON file paths and values are their scans.
+    """
+    return {
+        json_file: get_locale_scan(file_path=json_file)
+        for json_file in get_all_json_files(directory=config_i18n_directory)
+    }
+
+
+def _compute_source_files() -> SourceCorpus:
+    """
+    Walk the source and search directories for the files of the source corpus.
+
+    Returns
+    -------
+    SourceCorpus
+        The shared source corpus with the files of the directories found.
+    """
+    source_corpus = get_source_corpus()
+    for directory in [config_src_directory, *config_nonexistent_keys_search_dirs]:
+        source_corpus.files(directory=directory)
+
+    return source_corpus
+
+
+def _compute_source_contents() -> SourceCorpus:
+    """
+    Read the files of the source and search directories.
+
+    Returns
+    -------
+    SourceCorpus
+        The shared source corpus with the contents of the files read.
+    """
+    source_corpus = get_source_corpus()
+    for directory in [config_src_directory, *config_nonexistent_keys_search_dirs]:
+        source_corpus.view(directory=directory)
+
+    return source_corpus
+
+
+def get_source_keys(
+    file_paths: list[str], i18n_src_dict: dict[str, str]
+) -> dict[str, dict[str, list[str]]]:
+    """
+    Find the keys of the i18n-src file and the used i18n keys of files in one pass over each file.
+
+    Parameters
+    ----------
+    file_paths : list[str]
+        The paths to the files to search for keys.
+
+    i18n_src_dict : dict[str, str]
+        The dictionary of i18n source keys and their associated values.
+
+    Returns
+    -------
+    dict[str, dict[str, list[str]]]
+        A dictionary where keys are file paths and values are the "src-keys" and "used-keys" of the files.
+    """
+    key_pattern = get_i18n_key_pattern(
+        key_prefixes=config_nonexistent_keys_key_prefixes,
+        key_quotes=config_nonexistent_keys_key_quotes,
+    )
+
+    # Note: Files are opened one at a time as undecoded and possibly memory-mapped contents that aren't kept, so only keys stay in memory.
+    # Cached results are only valid for the same keys and pattern.
+    return get_file_results(
+        namespace="source-keys",
+        file_paths=file_paths,
+        extract=SourceKeyExtractor(
+            key_matcher=KeyMatcher(keys=i18n_src_dict.keys()),
+            key_pattern=re.compile(key_pattern),
+        ),
+        fingerprint=hash_text("\n".join([key_pattern, *sorted(i18n_src_dict)])),
+    )
+
+
+def _compute_source_keys() -> dict[str, dict[str, list[str]]]:
+    """
+    Find the keys of the i18n-src file and the used i18n keys of the files of the source and search directories.
+
+    Returns
+    -------
+    dict[str, dict[str, list[str]]]
+        A dictionary where keys are file paths and values are the "src-keys" and "used-keys" of the files.
+    """
+    source_corpus = get_source_corpus()
+
+    return get_source_keys(
+        file_paths=[
+            f
+            for directory in [
+                config_src_directory,
+                *config_nonexistent_keys_search_dirs,
+            ]
+            for f in source_corpus.files(directory=directory)
+        ],
+        i18n_src_dict=get_intermediate("i18n-src-dict"),
+    )
+
+
+def _compute_key_files() -> dict[str, list[str]]:
+    """
+    Map the keys of the i18n-src file to the files they are used in.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        A dictionary where keys are i18n keys and values are lists of file paths where those keys are used.
+    """
+    from i18n_check.check.key_naming import map_keys_to_files
+
+    return map_keys_to_files(
+        i18n_src_dict=get_intermediate("i18n-src-dict"),
+        src_directory=config_src_directory,
+        file_keys={
+            f: keys["src-keys"] for f, keys in get_intermediate("source-keys").items()
+        },
+    )
+
+
+def _compute_used_keys() -> set[str]:
+    """
+    Find the i18n keys that are used in the source and search directories.
+
+    Returns
+    -------
+    set[str]
+        A set of all i18n keys that are used in the project.
+    """
+    from i18n_check.check.nonexistent_keys import get_all_used_i18n_keys
+
+    return get_all_used_i18n_keys(
+        i18n_src_dict=get_intermediate("i18n-src-dict"),
+        file_keys={
+            f: keys["used-keys"] for f, keys in get_intermediate("source-keys").items()
+        },
+    )
+
+
+# MARK: Graph
+
+
+@dataclass(frozen=True)
+class Intermediate:
+    """
+    An intermediate result that is shared between checks.
+
+    Parameters
+    ----------
+    name : str
+        The name of the intermediate.
+
+    compute : Callable[[], Any]
+        The function that computes the intermediate once its dependencies are available.
+
+    dependencies : tuple[str, ...], default=()
+        The names of the intermediates that need to be computed first.
+    """
+
+    name: str
+    compute: Callable[[], Any]
+    dependencies: tuple[str, ...] = ()
+
+
+INTERMEDIATES: dict[str, Intermediate] = {
+    i.name: i
+    for i in [
+        Intermediate("i18n-src-dict", _compute_i18n_src_dict),
+        Intermediate("locale-files", _compute_locale_files),
+        Intermediate("locale-scans", _compute_locale_scans),
+        Intermediate("source-files", _compute_source_files),
+        Intermediate(
+            "source-contents", _compute_source_contents, dependencies=("source-files",)
+        ),
+        Intermediate(
+            "source-keys",
+            _compute_source_keys,
+            dependencies=("i18n-src-dict", "source-files"),
+        ),
+        Intermediate(
+            "key-files",
+            _compute_key_files,
+            dependencies=("i18n-src-dict", "source-keys"),
+        ),
+        Intermediate("used-keys", _compute_used_keys, dependencies=("source-keys",)),
+    ]
+}
+
+_intermediate_values: dict[str, Any] = {}
+
+
+def get_intermediate(name: str) -> Any:
+    """
+    Get an intermediate result, computing it and its dependencies if they haven't been.
+
+    Parameters
+    ----------
+    name : str
+        The name of the intermediate.
+
+    Returns
+    -------
+    Any
+        The value of the intermediate.
+
+    Raises
+    ------
+    KeyError
+        If there is no intermediate with the given name.
+    """
+    if name not in INTERMEDIATES:
+        raise KeyError(f"There is no intermediate named '{name}'.")
+
+    if name not in _intermediate_values:
+        for dependency in INTERMEDIATES[name].dependencies:
+            get_intermediate(dependency)
+
+        _intermediate_values[name] = INTERMEDIATES[name].compute()
+
+    return _intermediate_values[name]
+
+
+def get_required_intermediates(names: list[str]) -> list[str]:
+    """
+    Get intermediates and all of their dependencies in an order in which they can be computed.
+
+    Parameters
+    ----------
+    names : list[str]
+        The names of the intermediates that are needed.
+
+    Returns
+    -------
+    list[str]
+        The names of the needed intermediates with dependencies before their dependents.
+    """
+    required: list[str] = []
+
+    def add_intermediate(name: str) -> None:
+        """
+        Add an intermediate to the required intermediates after its dependencies.
+
+        Parameters
+        ----------
+        name : str
+            The name of the intermediate to add.
+        """
+        if name in required:
+            return
+
+        for dependency in INTERMEDIATES[name].dependencies:
+            add_intermediate(dependency)
+
+        required.append(name)
+
+    for name in names:
+        add_intermediate(name)
+
+    return required
+
+
+def compute_intermediates(names: list[str], max_workers: int | None = None) -> None:
+    """
+    Compute intermediates and their dependencies, with those that are independent computed in parallel.
+
+    Parameters
+    ----------
+    names : list[str]
+        The names of the intermediates to compute.
+
+    max_workers : int, optional
+        The maximum number of threads used to compute intermediates.
+    """
+    pending = [
+        n for n in get_required_intermediates(names) if n not in _intermediate_values
+    ]
+    running: dict[Future[Any], str] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            for name in [
+                n
+                for n in pending
+                if all(d in _intermediate_values for d in INTERMEDIATES[n].dependencies)
+            ]:
+                pending.remove(name)
+                running[executor.submit(INTERMEDIATES[name].compute)] = name
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                _intermediate_values[running.pop(future)] = future.result()
+
+
+def set_intermediates(values: dict[str, Any]) -> None:
+    """
+    Set the intermediates of the current process, such as those computed by the main process.
+
+    Parameters
+    ----------
+    values : dict[str, Any]
+        A dictionary where keys are names of intermediates and values are their values.
+    """
+    _intermediate_values.clear()
+    _intermediate_values.update(values)
+
+
+def get_intermediates() -> dict[str, Any]:
+    """
+    Get the intermediates that have been computed in the current process.
+
+    Returns
+    -------
+    dict[str, Any]
+        A dictionary where keys are names of intermediates and values are their values.
+    """
+    return dict(_intermediate_values)
+
+
+def clear_intermediates() -> None:
+    """
+    Clear the computed intermediates so that they are recomputed from the current files.
+    """
+    _intermediate_values.clear()
@@ -0,0 +1,203 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Streaming of the key-value pairs of JSON files so that very large locale files can be checked in bounded memory.
+
+The file is read in chunks and each value is decoded with the standard library decoder,
+so only the current chunk and value are held in memory rather than the whole text and object.
+"""
+
+import json
+from collections.abc import Callable, Iterator
+from json.decoder import scanstring
+from pathlib import Path
+from typing import Any, TextIO
+
+JSON_STREAM_CHUNK_SIZE = 1 << 20
+_WHITESPACE = " \t\n\r"
+_VALUE_END_CHARS = _WHITESPACE + ",:]}"
+
+# MARK: Reader
+
+
+class _JsonChunkReader:
+    """
+    A buffer over a JSON file that is filled with chunks of the file as they're needed.
+
+    Parameters
+    ----------
+    file : TextIO
+        The open JSON file.
+
+    chunk_size : int
+        The number of characters to read at a time.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int) -> None:
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.position = 0
+        self.at_end = False
+
+    def read_chunk(self) -> bool:
+        """
+        Add the next chunk of the file to the buffer, dropping what has already been decoded.
+
+        Returns
+        -------
+        bool
+            True if more of the file was read.
+        """
+        if self.at_end:
+            return False
+
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.at_end = True
+            return False
+
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+
+        return True
+
+    def next_char(self) -> str:
+        """
+        Skip whitespace and get the next character without consuming it.
+
+        Returns
+        -------
+        str
+            The next character, or an empty string at the end of the file.
+        """
+        while True:
+            while (
+                self.position < len(self.buffer)
+                and self.buffer[self.position] in _WHITESPACE
+            ):
+                self.position += 1
+
+            if self.position < len(self.buffer) or not self.read_chunk():
+                return self.buffer[self.position : self.position + 1]
+
+    def expect(self, chars: str) -> str:
+        """
+        Consume the next character, checking that it's one of the expected characters.
+
+        Parameters
+        ----------
+        chars : str
+            The characters that are valid at this position.
+
+        Returns
+        -------
+        str
+            The consumed character.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the next character isn't one of the expected characters.
+        """
+        char = self.next_char()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(
+                f"Expecting one of {chars!r}", self.buffer, self.position
+            )
+
+        self.position += 1
+
+        return char
+
+    def decode(self, decode_at: Callable[[str, int], tuple[Any, int]]) -> Any:
+        """
+        Decode the value at the current position, reading more of the file until the value is complete.
+
+        Parameters
+        ----------
+        decode_at : Callable[[str, int], tuple[Any, int]]
+            A function that decodes a value from a string at an index and returns the value and the index after it.
+
+        Returns
+        -------
+        Any
+            The decoded value.
+        """
+        while True:
+            try:
+                value, end = decode_at(self.buffer, self.position)
+
+                # Note: A number that isn't followed by a delimiter may continue in the next chunk.
+                if self.at_end or (
+                    end < len(self.buffer) and self.buffer[end] in _VALUE_END_CHARS
+                ):
+                    self.position = end
+                    return value
+
+            except json.JSONDecodeError:
+                if self.at_end:
+                    raise
+
+            self.read_chunk()
+
+
+# MARK: Stream Pairs
+
+
+def iter_json_pairs(
+    file_path: str | Path, chunk_size: int = JSON_STREAM_CHUNK_SIZE
+) -> Iterator[tuple[str, Any]]:
+    """
+    Stream the key-value pairs of the top level object of a JSON file in the order they appear.
+
+    Duplicate keys are yielded each time they appear. Nothing is yielded if the top level value isn't an object.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the JSON file.
+
+    chunk_size : int, default=JSON_STREAM_CHUNK_SIZE
+        The number of characters to read from the file at a time.
+
+    Returns
+    -------
+    Iterator[tuple[str, Any]]
+        The keys and decoded values of the top level object.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the file isn't valid JSON.
+    """
+    decoder = json.JSONDecoder()
+
+    with open(file_path, "r", encoding="utf-8") as file:
+        reader = _JsonChunkReader(file=file, chunk_size=chunk_size)
+
+        if reader.next_char() != "{":
+            reader.decode(decoder.raw_decode)
+            if reader.next_char():
+                raise json.JSONDecodeError("Extra data", reader.buffer, reader.position)
+
+            return
+
+        reader.expect("{")
+        if reader.next_char() == "}":
+            reader.expect("}")
+
+        else:
+            while True:
+                reader.expect('"')
+                key = reader.decode(scanstring)
+                reader.expect(":")
+                reader.next_char()
+                value = reader.decode(decoder.raw_decode)
+
+                yield key, value
+
+                if reader.expect(",}") == "}":
+                    break
+
+        if reader.next_char():
+            raise json.JSONDecodeError("Extra data", reader.buffer, reader.position)
@@ -0,0 +1,182 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Coverage of the keys of the i18n-src file by locale files as bitsets so that many locales can be compared at once.
+
+Each source key is given an integer id once, and each locale becomes a Python int with the bits of the keys that it translates set.
+Missing keys and percentages are derived with bitwise operations over whole locales,
+and the number of locales that miss each key is counted with bit-sliced addition rather than per key.
+
+Examples
+--------
+Run the following script in terminal:
+
+>>> i18n-check -mk
+"""
+
+import itertools
+from collections.abc import Collection, Iterable
+
+# Note: Bitsets are converted from and to binary digits at once, with bytes of zero and one being the flags of keys.
+_FLAG_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_DIGIT_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+
+# MARK: Key Coverage
+
+
+class KeyCoverage:
+    """
+    The keys of the i18n-src file that each locale translates as bitsets.
+
+    Parameters
+    ----------
+    keys : Iterable[str]
+        The keys of the i18n-src file, which are given ids in the order that they're passed.
+    """
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        # Note: Ids follow the order of the i18n-src file as locale files are mostly in the same order, which keeps lookups local in memory.
+        self.key_ids = {k: i for i, k in enumerate(dict.fromkeys(keys))}
+        self.keys = list(self.key_ids)
+        self.all_keys_mask = (1 << len(self.keys)) - 1
+        self.locale_masks: dict[str, int] = {}
+
+    def add_locale(self, locale: str, translated_keys: Collection[str]) -> None:
+        """
+        Add the bitset of the source keys that a locale translates.
+
+        Parameters
+        ----------
+        locale : str
+            The name of the locale.
+
+        translated_keys : Collection[str]
+            The keys of the locale that have non-empty values, with keys that aren't source keys being ignored.
+        """
+        # Note: Only the bits of missing keys are set one at a time, as they're found with a set difference of all keys at once.
+        missing_flags = bytearray(len(self.keys))
+        for i in map(self.key_ids.__getitem__, self.key_ids.keys() - translated_keys):
+            missing_flags[i] = 1
+
+        # Note: The flags are converted to binary digits with the last key as the most significant digit.
+        missing_mask = (
+            int(missing_flags[::-1].translate(_FLAG_DIGITS), 2) if missing_flags else 0
+        )
+        self.locale_masks[locale] = self.all_keys_mask & ~missing_mask
+
+    def get_keys(self, mask: int) -> list[str]:
+        """
+        Get the keys whose bits are set in a bitset.
+
+        Parameters
+        ----------
+        mask : int
+            The bitset of keys.
+
+        Returns
+        -------
+        list[str]
+            The keys in sorted order.
+        """
+        flags = (
+            format(mask, f"0{len(self.keys)}b")[::-1]
+            .encode("ascii")
+            .translate(_DIGIT_FLAGS)
+        )
+
+        return sorted(itertools.compress(self.keys, flags))
+
+    def get_missing_mask(self, locale: str) -> int:
+        """
+        Get the bitset of the source keys that a locale doesn't translate.
+
+        Parameters
+        ----------
+        locale : str
+            The name of the locale.
+
+        Returns
+        -------
+        int
+            The bitset of the missing keys.
+        """
+        return self.all_keys_mask & ~self.locale_masks[locale]
+
+    # MARK: Locales
+
+    def get_missing_keys_by_locale(self) -> dict[str, tuple[list[str], float]]:
+        """
+        Get the missing keys of each locale and the percentage of source keys that they are.
+
+        Returns
+        -------
+        dict[str, tuple[list[str], float]]
+            A dictionary where keys are the names of locales with missing keys and values are their sorted missing keys
+            and the percentage of missing keys (0-100).
+        """
+        missing_keys_by_locale: dict[str, tuple[list[str], float]] = {}
+        for locale in self.locale_masks:
+            missing_mask = self.get_missing_mask(locale)
+            if missing_mask:
+                missing_keys_by_locale[locale] = (
+                    self.get_keys(missing_mask),
+                    missing_mask.bit_count() / len(self.keys) * 100,
+                )
+
+        return missing_keys_by_locale
+
+    # MARK: Keys
+
+    def get_missing_count_masks(self) -> list[int]:
+        """
+        Count the locales that miss each key with bit-sliced addition of the bitsets of missing keys.
+
+        Returns
+        -------
+        list[int]
+            Bitsets where the bit of a key in the bitset at index p is bit p of the number of locales that miss the key.
+        """
+        count_masks: list[int] = []
+        for locale in self.locale_masks:
+            carry = self.get_missing_mask(locale)
+            for p, count_mask in enumerate(count_masks):
+                if not carry:
+                    break
+
+                count_masks[p], carry = count_mask ^ carry, count_mask & carry
+
+            if carry:
+                count_masks.append(carry)
+
+        return count_masks
+
+    def get_keys_by_missing_count(self, min_count: int = 1) -> dict[int, list[str]]:
+        """
+        Group the source keys by the number of locales that miss them.
+
+        Parameters
+        ----------
+        min_count : int, default=1
+            The number of locales that keys need to be missing in to be included.
+
+        Returns
+        -------
+        dict[int, list[str]]
+            A dictionary where keys are numbers of locales from the largest and values are the sorted keys that are missing in that many locales.
+        """
+        count_masks = self.get_missing_count_masks()
+
+        keys_by_missing_count: dict[int, list[str]] = {}
+        for count in range(len(self.locale_masks), min_count - 1, -1):
+            # Note: No key is missing in more locales than the count bitsets can represent.
+            if count >> len(count_masks):
+                continue
+
+            # Note: Keys are missing in a number of locales if their bits match the bits of the number in all count bitsets.
+            keys_mask = self.all_keys_mask
+            for p, count_mask in enumerate(count_masks):
+                keys_mask &= count_mask if count >> p & 1 else ~count_mask
+
+            if keys_mask:
+                keys_by_missing_count[count] = self.get_keys(keys_mask)
+
+        return keys_by_missing_count
@@ -0,0 +1,609 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Multi-pattern matching of i18n keys within source files.
+"""
+
+import mmap
+import re
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from typing import AnyStr
+
+# MARK: Key Matcher
+
+
+def get_key_run_pattern(keys: Iterable[str]) -> re.Pattern[str] | None:
+    """
+    Get the pattern of runs of the characters that appear in keys, within which keys can only occur.
+
+    Parameters
+    ----------
+    keys : Iterable[str]
+        The keys whose characters make up runs.
+
+    Returns
+    -------
+    re.Pattern[str] | None
+        The pattern of runs of key characters, or None if the keys have no characters.
+    """
+    key_chars = sorted({c for k in keys for c in k})
+    if not key_chars:
+        return None
+
+    return re.compile(f"[{''.join(re.escape(c) for c in key_chars)}]+")
+
+
+class KeyMatcher:
+    """
+    Find all i18n keys that are substrings of a text in one pass over the text.
+
+    An Aho-Corasick automaton of the keys is ran over the runs of characters that appear in keys.
+    As a key can only occur within such a run, and the same runs repeat across files,
+    the matches for each distinct run are computed once and reused.
+
+    Parameters
+    ----------
+    keys : Iterable[str]
+        The keys to search for.
+    """
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        self.keys = list(dict.fromkeys(keys))
+
+        # Note: An empty key is a substring of any text, as with the `in` operator.
+        self._always_matched = frozenset(k for k in self.keys if k == "")
+
+        self._goto: list[dict[str, int]] = [{}]
+        self._outputs: list[tuple[str, ...]] = [()]
+        self._fail: list[int] = [0]
+        self._build_automaton(keys=[k for k in self.keys if k])
+
+        self._run_pattern = get_key_run_pattern(keys=self.keys)
+        self._run_matches: dict[str, frozenset[str]] = {}
+
+        # Note: Runs of undecoded contents contain the bytes of the UTF-8 encoded key characters.
+        key_bytes = sorted({b for k in self.keys for b in k.encode("utf-8")})
+        self._run_bytes_pattern = (
+            re.compile(
+                b"[" + b"".join(re.escape(bytes([b])) for b in key_bytes) + b"]+"
+            )
+            if key_bytes
+            else None
+        )
+        self._keys_are_ascii = all(k.isascii() for k in self.keys)
+
+    def _build_automaton(self, keys: list[str]) -> None:
+        """
+        Build the trie of the keys and derive the failure links and outputs of its nodes.
+
+        Parameters
+        ----------
+        keys : list[str]
+            The non-empty keys to add to the automaton.
+        """
+        node_outputs: list[list[str]] = [[]]
+        for key in keys:
+            node = 0
+            for char in key:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    self._goto.append({})
+                    node_outputs.append([])
+                    next_node = len(self._goto) - 1
+                    self._goto[node][char] = next_node
+
+                node = next_node
+
+            node_outputs[node].append(key)
+
+        self._fail = [0] * len(self._goto)
+
+        # Breadth first so that the failure link of each node is derived before its children.
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                queue.append(child)
+
+                fail_node = self._fail[node]
+                while fail_node and char not in self._goto[fail_node]:
+                    fail_node = self._fail[fail_node]
+
+                fail_child = self._goto[fail_node].get(char, 0)
+                self._fail[child] = fail_child if fail_child != child else 0
+                node_outputs[child].extend(node_outputs[self._fail[child]])
+
+        self._outputs = [tuple(outputs) for outputs in node_outputs]
+
+    def match_run(self, run: str) -> frozenset[str]:
+        """
+        Find the keys that are substrings of a run of key characters, reusing the keys found in the run before.
+
+        Parameters
+        ----------
+        run : str
+            A run of characters that appear in keys.
+
+        Returns
+        -------
+        frozenset[str]
+            The keys found within the run.
+        """
+        if (cached := self._run_matches.get(run)) is not None:
+            return cached
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        found: set[str] = set()
+        node = 0
+        for char in run:
+            while node and char not in goto[node]:
+                node = fail[node]
+
+            node = goto[node].get(char, 0)
+            if outputs[node]:
+                found.update(outputs[node])
+
+        self._run_matches[run] = frozenset(found)
+
+        return self._run_matches[run]
+
+    def find_keys(self, text: str) -> set[str]:
+        """
+        Find all keys that are substrings of the given text.
+
+        Parameters
+        ----------
+        text : str
+            The text to search for keys.
+
+        Returns
+        -------
+        set[str]
+            The keys that occur in the text.
+        """
+        found = set(self._always_matched)
+        if self._run_pattern is None:
+            return found
+
+        for run in set(self._run_pattern.findall(text)):
+            found.update(self.match_run(run))
+
+        return found
+
+    def find_keys_in_bytes(self, contents: bytes | mmap.mmap) -> set[str]:
+        """
+        Find all keys that are substrings of the undecoded contents of a file.
+
+        Only the distinct runs of key characters are decoded so that the contents of large files can be memory-mapped rather than read.
+
+        Parameters
+        ----------
+        contents : bytes | mmap.mmap
+            The UTF-8 encoded contents to search for keys.
+
+        Returns
+        -------
+        set[str]
+            The keys that occur in the contents.
+        """
+        found = set(self._always_matched)
+        if self._run_bytes_pattern is None or self._run_pattern is None:
+            return found
+
+        for run in {m[0] for m in self._run_bytes_pattern.finditer(contents)}:
+            if self._keys_are_ascii:
+                found.update(self.match_run(run.decode("ascii")))
+                continue
+
+            # Note: Runs of bytes can include parts of other characters, which are replaced and then split off by the text pattern.
+            for text_run in self._run_pattern.findall(run.decode("utf-8", "replace")):
+                found.update(self.match_run(text_run))
+
+        return found
+
+
+# MARK: Key Segment Index
+
+# Note: Key segments are used as regex patterns, so these can't be looked up as literal text.
+_REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+class KeySegmentIndex:
+    """
+    Inverted index of the text segments that directly follow a period in source files.
+
+    The unused keys check searches for keys with the pattern `segment[\\S]*\\.segment...`,
+    so every segment after the first has to be the start of a token that directly follows a period.
+    Intersecting the files of these tokens narrows the files that the pattern needs to be searched in.
+
+    Parameters
+    ----------
+    files_to_check_contents : dict[str, str]
+        A mapping of filenames to their contents.
+    """
+
+    def __init__(self, files_to_check_contents: dict[str, str]) -> None:
+        self.files = list(files_to_check_contents)
+
+        token_files: dict[str, set[int]] = {}
+        for file_index, contents in enumerate(files_to_check_contents.values()):
+            for token in set(re.findall(r"\.([^\s.]+)", contents)):
+                token_files.setdefault(token, set()).add(file_index)
+
+        self._token_files = token_files
+        self._sorted_tokens = sorted(token_files)
+        self._segment_files: dict[str, frozenset[int]] = {}
+
+    def _get_segment_files(self, segment: str) -> frozenset[int]:
+        """
+        Get the indexes of the files with a token that starts with the segment.
+
+        Parameters
+        ----------
+        segment : str
+            The key segment to look up.
+
+        Returns
+        -------
+        frozenset[int]
+            The indexes of the files in which the segment directly follows a period.
+        """
+        if (cached := self._segment_files.get(segment)) is not None:
+            return cached
+
+        segment_files: set[int] = set()
+        token_index = bisect_left(self._sorted_tokens, segment)
+        while token_index < len(self._sorted_tokens) and self._sorted_tokens[
+            token_index
+        ].startswith(segment):
+            segment_files |= self._token_files[self._sorted_tokens[token_index]]
+            token_index += 1
+
+        self._segment_files[segment] = frozenset(segment_files)
+
+        return self._segment_files[segment]
+
+    def candidate_files(self, key: str) -> list[str]:
+        """
+        Get the files that could contain a usage of the key.
+
+        Parameters
+        ----------
+        key : str
+            The key that's being searched for.
+
+        Returns
+        -------
+        list[str]
+            The files that the key pattern needs to be searched in.
+        """
+        segments = [
+            s
+            for s in key.split(".")[1:]
+            # Note: Empty segments don't narrow the search.
+            if s
+        ]
+        if not segments or any(
+            c.isspace() or c in _REGEX_SPECIAL_CHARS for s in segments for c in s
+        ):
+            return self.files
+
+        segment_files = sorted(
+            (self._get_segment_files(segment=s) for s in segments), key=len
+        )
+        candidates = set(segment_files[0]).intersection(*segment_files[1:])
+
+        return [self.files[i] for i in sorted(candidates)]
+
+
+# MARK: Key Replacer
+
+
+def get_replacement_pattern(olds: Iterable[str]) -> re.Pattern[str]:
+    """
+    Compile a pattern that matches any of the given substrings.
+
+    Longer substrings are tried first so that a substring isn't replaced within a longer one that is also replaced.
+
+    Parameters
+    ----------
+    olds : Iterable[str]
+        The substrings to match.
+
+    Returns
+    -------
+    re.Pattern[str]
+        The pattern matching the longest of the substrings at each position.
+    """
+    return re.compile(
+        "|".join(re.escape(o) for o in sorted(set(olds), key=len, reverse=True))
+    )
+
+
+class KeyReplacer:
+    """
+    Replace many i18n keys within texts in one pass over each text.
+
+    As with the key matcher, keys can only occur within runs of key characters,
+    so each distinct run is rewritten once with the longest key replaced at each position and then reused.
+
+    Parameters
+    ----------
+    replacements : dict[str, str]
+        A dictionary where keys are the keys to be replaced and values are the keys to replace them with.
+    """
+
+    def __init__(self, replacements: dict[str, str]) -> None:
+        self.replacements = {k: v for k, v in replacements.items() if k}
+        self._key_matcher = KeyMatcher(keys=self.replacements)
+        self._run_replacements: dict[str, tuple[str, dict[str, int]]] = {}
+
+        run_pattern = get_key_run_pattern(keys=self.replacements)
+        self._split_pattern = (
+            re.compile(f"({run_pattern.pattern})") if run_pattern is not None else None
+        )
+
+    def _replace_run(self, run: str) -> tuple[str, dict[str, int]]:
+        """
+        Replace the keys within a run of key characters.
+
+        Parameters
+        ----------
+        run : str
+            A run of characters that appear in keys.
+
+        Returns
+        -------
+        tuple[str, dict[str, int]]
+            The run with keys replaced and the number of times each key was replaced.
+        """
+        if (cached := self._run_replacements.get(run)) is not None:
+            return cached
+
+        if run in self.replacements:
+            replaced_run = (self.replacements[run], {run: 1})
+
+        elif run_keys := self._key_matcher.match_run(run=run):
+            replaced_count: dict[str, int] = {}
+
+            def replace(match: re.Match[str]) -> str:
+                """
+                Get the replacement of a matched key and count it.
+
+                Parameters
+                ----------
+                match : re.Match[str]
+                    The match of a key to be replaced.
+
+                Returns
+                -------
+                str
+                    The key that replaces the matched key.
+                """
+                replaced_count[match.group()] = replaced_count.get(match.group(), 0) + 1
+                return self.replacements[match.group()]
+
+            replaced_run = (
+                get_replacement_pattern(olds=run_keys).sub(replace, run),
+                replaced_count,
+            )
+
+        else:
+            replaced_run = (run, {})
+
+        self._run_replacements[run] = replaced_run
+
+        return replaced_run
+
+    def replace_keys(self, text: str) -> tuple[str, dict[str, int]]:
+        """
+        Replace all keys within the given text.
+
+        Parameters
+        ----------
+        text : str
+            The text in which to replace keys.
+
+        Returns
+        -------
+        tuple[str, dict[str, int]]
+            The text with keys replaced and the number of times each key was replaced.
+        """
+        replaced_count: dict[str, int] = {}
+        if self._split_pattern is None:
+            return text, replaced_count
+
+        # Note: Splitting keeps runs at odd indexes so they can be replaced without a callback per run.
+        parts = self._split_pattern.split(text)
+        run_counts = Counter(parts[1::2])
+
+        replaced_runs: dict[str, str] = {}
+        for run, run_count in run_counts.items():
+            replaced_run, run_replaced_count = self._replace_run(run=run)
+            if replaced_run == run:
+                continue
+
+            replaced_runs[run] = replaced_run
+            for key, count in run_replaced_count.items():
+                replaced_count[key] = replaced_count.get(key, 0) + count * run_count
+
+        if not replaced_runs:
+            return text, replaced_count
+
+        parts[1::2] = [replaced_runs.get(run, run) for run in parts[1::2]]
+
+        return "".join(parts), replaced_count
+
+
+# MARK: Key Usage Pattern
+
+
+def get_i18n_key_pattern(
+    key_prefixes: Iterable[str] | None = None,
+    key_quotes: Iterable[str] | None = None,
+) -> str:
+    """
+    Get a pattern that matches i18n keys used within any of the quotes in one pass over a text.
+
+    The quote that opens a key is captured so that a backreference closes the key with the same quote.
+    Keys are found with iter_i18n_keys so that a quote that closes a key doesn't also open the next one.
+
+    Parameters
+    ----------
+    key_prefixes : Iterable[str], default=nonexistent-keys `key-prefixes`
+        The prefixes that used i18n keys start with.
+
+    key_quotes : Iterable[str], default=nonexistent-keys `key-quotes`
+        The quotes that used i18n keys are within.
+
+    Returns
+    -------
+    str
+        A pattern where the group "key" is the i18n key and the group "quote" is the quote around it.
+
+    Raises
+    ------
+    ValueError
+        If no prefixes or quotes are passed.
+    """
+    # Note: Imported here as the utils import the key replacer of this module.
+    from i18n_check.utils import (
+        config_nonexistent_keys_key_prefixes,
+        config_nonexistent_keys_key_quotes,
+    )
+
+    if key_prefixes is None:
+        key_prefixes = config_nonexistent_keys_key_prefixes
+
+    if key_quotes is None:
+        key_quotes = config_nonexistent_keys_key_quotes
+
+    # Note: Longer alternatives are tried first so a prefix or quote isn't cut short by another.
+    prefixes = sorted(set(key_prefixes), key=lambda p: (-len(p), p))
+    quotes = sorted({q for q in key_quotes if q}, key=lambda q: (-len(q), q))
+    if not prefixes or not quotes:
+        raise ValueError("At least one key prefix and one key quote are required.")
+
+    prefix_pattern = "|".join(re.escape(p) for p in prefixes)
+    quote_pattern = "|".join(re.escape(q) for q in quotes)
+    # Note: Keys stop at any quote character so that a key never runs over its closing quote into the next one.
+    quote_chars = "".join(re.escape(c) for c in sorted(set("".join(quotes))))
+    key_chars_pattern = rf"[^\s{quote_chars}]+"
+
+    # Note: Starting with the prefix lets the search skip ahead to it rather than stopping at every quote.
+    # The quote before the prefix is then checked by a lookbehind, which needs alternatives of one width.
+    if len({len(p) for p in prefixes}) == 1 and len({len(q) for q in quotes}) == 1:
+        return (
+            rf"(?P<key>(?:{prefix_pattern})"
+            rf"(?<=(?P<quote>{quote_pattern})(?:{prefix_pattern})){key_chars_pattern})(?P=quote)"
+        )
+
+    return rf"(?P<quote>{quote_pattern})(?P<key>(?:{prefix_pattern}){key_chars_pattern})(?P=quote)"
+
+
+def iter_i18n_keys(
+    key_pattern: re.Pattern[AnyStr], text: AnyStr | mmap.mmap
+) -> Iterator[AnyStr]:
+    """
+    Find the i18n keys that are used within quotes in a text in order.
+
+    A quote that closes a key doesn't open another, as when the text is read from the start.
+    Matches of patterns that start with the prefix can otherwise reuse the closing quote of the previous key through their lookbehind.
+
+    Parameters
+    ----------
+    key_pattern : re.Pattern[AnyStr]
+        A pattern from get_i18n_key_pattern for the prefixes and quotes of keys, or the pattern encoded to match bytes.
+
+    text : AnyStr | mmap.mmap
+        The text to search for i18n keys.
+
+    Returns
+    -------
+    Iterator[AnyStr]
+        The i18n keys in the order that they're used, including repeated keys.
+    """
+    previous_end = 0
+    for m in key_pattern.finditer(text):
+        if m.start("quote") < previous_end:
+            continue
+
+        previous_end = m.end()
+        yield m["key"]
+
+
+# MARK: Source Keys
+
+
+class SourceKeyExtractor:
+    """
+    Find the keys of the i18n-src file and the i18n keys within quotes that a file uses with one read of the file.
+
+    Instances are passed to worker processes, so the matcher and patterns are built before.
+    The undecoded contents are searched so that large files can be memory-mapped, with only the found keys being decoded.
+
+    Parameters
+    ----------
+    key_matcher : KeyMatcher
+        The matcher of the keys of the i18n-src file.
+
+    key_pattern : re.Pattern[str]
+        A pattern from get_i18n_key_pattern for the prefixes and quotes of used keys.
+    """
+
+    def __init__(self, key_matcher: KeyMatcher, key_pattern: re.Pattern[str]) -> None:
+        self.key_matcher = key_matcher
+        self.key_pattern = key_pattern
+        self.key_bytes_pattern = re.compile(key_pattern.pattern.encode("utf-8"))
+
+    def find_used_keys(self, contents: bytes | mmap.mmap) -> set[str]:
+        """
+        Find the i18n keys that are used within quotes in the undecoded contents of a file.
+
+        Parameters
+        ----------
+        contents : bytes | mmap.mmap
+            The UTF-8 encoded contents of a file.
+
+        Returns
+        -------
+        set[str]
+            The unique i18n keys used in the contents.
+        """
+        # Note: Keys are deduplicated before they're decoded as they're often repeated.
+        used_keys = {
+            k.decode("utf-8")
+            for k in set(
+                iter_i18n_keys(key_pattern=self.key_bytes_pattern, text=contents)
+            )
+        }
+
+        # Note: Bytes patterns only match ASCII whitespace, so keys with other whitespace need the decoded contents.
+        if any(c.isspace() for k in used_keys if not k.isascii() for c in k):
+            return set(
+                iter_i18n_keys(
+                    key_pattern=self.key_pattern, text=str(contents, "utf-8")
+                )
+            )
+
+        return used_keys
+
+    def __call__(self, contents: bytes | mmap.mmap) -> dict[str, list[str]]:
+        """
+        Find the keys in the undecoded contents of a file.
+
+        Parameters
+        ----------
+        contents : bytes | mmap.mmap
+            The UTF-8 encoded contents of a file.
+
+        Returns
+        -------
+        dict[str, list[str]]
+            The sorted keys of the i18n-src file that are substrings of the contents as "src-keys"
+            and the sorted unique keys that are used within quotes as "used-keys".
+        """
+        return {
+            "src-keys": sorted(self.key_matcher.find_keys_in_bytes(contents=contents)),
+            "used-keys": sorted(self.find_used_keys(contents=contents)),
+        }
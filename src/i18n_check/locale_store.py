@@ -0,0 +1,353 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Locale store that parses the JSON files of the project once for all checks.
+
+For very large locale files the key-value pairs can instead be streamed so that checks that allow it run in bounded memory.
+"""
+
+import json
+import os
+from collections.abc import Iterator, Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+from i18n_check.cache import get_result_cache
+from i18n_check.json_stream import iter_json_pairs
+from i18n_check.utils import config_i18n_directory, get_all_json_files
+
+# MARK: Locale File
+
+
+@dataclass(frozen=True)
+class LocaleScan:
+    """
+    The results of scanning the key-value pairs of a JSON file once.
+
+    Parameters
+    ----------
+    repeat_keys : dict[str, list[str]]
+        A dictionary where keys are duplicate keys and values are sorted string representations of their values.
+
+    first_unsorted_index : int | None
+        The index of the first key that is out of alphabetical order, or None if the keys are sorted.
+
+    is_nested : bool
+        Whether any value of the file is an object.
+    """
+
+    repeat_keys: dict[str, list[str]]
+    first_unsorted_index: int | None
+    is_nested: bool
+
+
+class LocaleFile:
+    """
+    A parsed JSON file of the project with the key-value pairs in the order they appear.
+
+    Duplicate keys, the order of keys and nesting can all be derived from the pairs,
+    so checks don't need to parse the file again.
+
+    Parameters
+    ----------
+    path : str
+        The path to the JSON file.
+
+    contents : str
+        The contents of the JSON file.
+    """
+
+    __slots__ = ("path", "pairs", "_object_pairs", "_data", "_scan")
+
+    def __init__(self, path: str, contents: str) -> None:
+        self.path = path
+
+        object_pairs: list[list[tuple[str, Any]]] = []
+
+        def keep_pairs(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+            """
+            Keep the pairs of each object as they're parsed, including those of duplicate keys.
+
+            Parameters
+            ----------
+            pairs : list[tuple[str, Any]]
+                List of key-value pairs from the JSON parser.
+
+            Returns
+            -------
+            dict[str, Any]
+                A standard dictionary constructed from the pairs (last value wins for duplicates).
+            """
+            object_pairs.append(pairs)
+            return dict(pairs)
+
+        data = json.loads(contents, object_pairs_hook=keep_pairs)
+
+        # Note: The top level object is closed last, so its pairs are the last that are parsed.
+        self.pairs: tuple[tuple[str, Any], ...] = (
+            tuple(object_pairs[-1]) if isinstance(data, dict) else ()
+        )
+        self._object_pairs = object_pairs
+        self._data = data if isinstance(data, dict) else {}
+        self._scan: LocaleScan | None = None
+
+    @property
+    def data(self) -> Mapping[str, Any]:
+        """
+        A read-only view of the parsed JSON object.
+        """
+        return MappingProxyType(self._data)
+
+    def scan(self) -> LocaleScan:
+        """
+        Derive the results of the repeat-keys, sorted-keys and nested-files checks from the parsed pairs in linear time.
+
+        Returns
+        -------
+        LocaleScan
+            The duplicate keys, the first key that's out of order and whether the file is nested.
+        """
+        if self._scan is not None:
+            return self._scan
+
+        key_values: dict[str, list[Any]] = {}
+        for pairs in self._object_pairs:
+            for key, value in pairs:
+                if key in key_values:
+                    key_values[key].append(value)
+
+                else:
+                    key_values[key] = [value]
+
+        first_unsorted_index = None
+        is_nested = False
+        previous_key = None
+        # Note: Adjacent keys are compared rather than sorting all keys to check the order.
+        for index, (key, value) in enumerate(self._data.items()):
+            if (
+                first_unsorted_index is None
+                and previous_key is not None
+                and previous_key > key
+            ):
+                first_unsorted_index = index
+
+            if isinstance(value, dict):
+                is_nested = True
+
+            previous_key = key
+
+        self._scan = LocaleScan(
+            repeat_keys={
+                k: sorted(str(v) for v in values)
+                for k, values in key_values.items()
+                if len(values) > 1
+            },
+            first_unsorted_index=first_unsorted_index,
+            is_nested=is_nested,
+        )
+
+        return self._scan
+
+
+# MARK: Locale Store
+
+
+class LocaleStore:
+    """
+    The parsed JSON files of the project that are shared between checks.
+
+    Each file is parsed once and parsed again only if it changes, such as after a fix.
+    """
+
+    def __init__(self) -> None:
+        # Note: File stats are stored with parsed files so edits from fixes are picked up.
+        self._files: dict[str, tuple[tuple[int, int], LocaleFile]] = {}
+
+    def get(self, file_path: str | Path, contents: str | None = None) -> LocaleFile:
+        """
+        Get a parsed JSON file, parsing it only if it's new or has changed.
+
+        Parameters
+        ----------
+        file_path : str | Path
+            The path to the JSON file.
+
+        contents : str, optional
+            The current contents of the file if they have already been read.
+
+        Returns
+        -------
+        LocaleFile
+            The parsed file.
+        """
+        file_path = os.path.abspath(file_path)
+        file_stat = os.stat(file_path)
+        stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        cached = self._files.get(file_path)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+
+        if contents is None:
+            with open(file_path, "r", encoding="utf-8") as f:
+                contents = f.read()
+
+        locale_file = LocaleFile(path=file_path, contents=contents)
+        # Note: Parsed files aren't kept when streaming so that only one is held in memory at a time.
+        if not _stream_json:
+            self._files[file_path] = (stat_key, locale_file)
+
+        return locale_file
+
+    def load(self, directory: str | Path = config_i18n_directory) -> list[LocaleFile]:
+        """
+        Parse all JSON files within a directory.
+
+        Parameters
+        ----------
+        directory : str | Path, default=config_i18n_directory
+            The directory to parse the JSON files of.
+
+        Returns
+        -------
+        list[LocaleFile]
+            The parsed files, or no files when streaming as they would all be held in memory.
+        """
+        if _stream_json:
+            return []
+
+        return [self.get(file_path=f) for f in get_all_json_files(directory=directory)]
+
+    def clear(self) -> None:
+        """
+        Forget all parsed files.
+        """
+        self._files.clear()
+
+
+# MARK: Shared Store
+
+_locale_store: LocaleStore | None = None
+_stream_json = False
+
+
+def set_stream_json(stream_json: bool) -> None:
+    """
+    Set whether the key-value pairs of JSON files are streamed rather than loaded in the current process.
+
+    Parameters
+    ----------
+    stream_json : bool
+        Whether JSON files should be streamed.
+    """
+    global _stream_json
+
+    _stream_json = stream_json
+
+
+def is_stream_json() -> bool:
+    """
+    Check whether the key-value pairs of JSON files are streamed rather than loaded in the current process.
+
+    Returns
+    -------
+    bool
+        True if JSON files are streamed.
+    """
+    return _stream_json
+
+
+def get_locale_store() -> LocaleStore:
+    """
+    Get the locale store that is shared by all checks in the current process.
+
+    Returns
+    -------
+    LocaleStore
+        The shared locale store, which is created on first use.
+    """
+    global _locale_store
+
+    if _locale_store is None:
+        _locale_store = LocaleStore()
+
+    return _locale_store
+
+
+def set_locale_store(store: LocaleStore | None) -> None:
+    """
+    Set the locale store that is shared by all checks in the current process.
+
+    Parameters
+    ----------
+    store : LocaleStore | None
+        The store to share, or None to have a new store created on next use.
+    """
+    global _locale_store
+
+    _locale_store = store
+
+
+def get_locale_dict(file_path: str | Path) -> Mapping[str, Any]:
+    """
+    Get a read-only view of the contents of a JSON file from the shared locale store.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the JSON file.
+
+    Returns
+    -------
+    Mapping[str, Any]
+        The contents of the JSON file.
+    """
+    return get_locale_store().get(file_path=file_path).data
+
+
+def iter_locale_pairs(file_path: str | Path) -> Iterator[tuple[str, Any]]:
+    """
+    Iterate over the key-value pairs of a JSON file in the order they appear, streaming them if set.
+
+    Duplicate keys are included each time they appear, so the last value of a key is the one that's loaded.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the JSON file.
+
+    Returns
+    -------
+    Iterator[tuple[str, Any]]
+        The keys and values of the top level object of the file.
+    """
+    if _stream_json:
+        return iter_json_pairs(file_path=file_path)
+
+    return iter(get_locale_store().get(file_path=file_path).pairs)
+
+
+def get_locale_scan(file_path: str | Path) -> LocaleScan:
+    """
+    Get the scan of a JSON file, reusing the cached scan if the file hasn't changed.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the JSON file.
+
+    Returns
+    -------
+    LocaleScan
+        The duplicate keys, the first key that's out of order and whether the file is nested.
+    """
+    scan = get_result_cache().get(
+        namespace="locale-scan",
+        file_path=file_path,
+        compute=lambda contents: asdict(
+            get_locale_store().get(file_path=file_path, contents=contents).scan()
+        ),
+    )
+
+    return LocaleScan(**scan)
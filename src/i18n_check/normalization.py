@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Normalization of i18n values so that values that differ only in case or punctuation are compared as equal.
+
+Values are lowercased and ASCII punctuation other than `!` is removed with a translate table that's built once.
+The Unicode-aware mode also applies NFKC normalization and case folding and removes the punctuation of all scripts such as `。` and `،`.
+"""
+
+import string
+import unicodedata
+from collections.abc import Iterable
+from typing import Any
+
+# Note: Exclamation marks are kept as they change the meaning of values.
+PUNCTUATION_TO_REMOVE = string.punctuation.replace("!", "")
+_ASCII_PUNCTUATION_TABLE = str.maketrans("", "", PUNCTUATION_TO_REMOVE)
+
+# Note: Values are joined with a control character that normalization doesn't change to normalize them at once.
+_BATCH_SEPARATOR = "\x00"
+
+# MARK: Unicode Table
+
+
+class _UnicodePunctuationTable(dict[int, int | None]):
+    """
+    A translate table that removes ASCII punctuation and the characters of all Unicode punctuation categories.
+
+    Entries are derived as characters are first looked up, as a table of all code points would take long to build.
+    """
+
+    def __missing__(self, code_point: int) -> int | None:
+        """
+        Derive whether a character is removed the first time that it's translated.
+
+        Parameters
+        ----------
+        code_point : int
+            The code point of the character.
+
+        Returns
+        -------
+        int | None
+            None if the character is removed and the code point itself if it's kept.
+        """
+        char = chr(code_point)
+        is_removed = char != "!" and (
+            char in PUNCTUATION_TO_REMOVE or unicodedata.category(char).startswith("P")
+        )
+        self[code_point] = None if is_removed else code_point
+
+        return self[code_point]
+
+
+_UNICODE_PUNCTUATION_TABLE = _UnicodePunctuationTable(_ASCII_PUNCTUATION_TABLE)
+
+# MARK: Normalize
+
+
+def _normalize_text(text: str, unicode_aware: bool) -> str:
+    """
+    Normalize text that's known to be a string.
+
+    Parameters
+    ----------
+    text : str
+        The text to normalize.
+
+    unicode_aware : bool
+        Whether to apply NFKC normalization and case folding and remove the punctuation of all scripts.
+
+    Returns
+    -------
+    str
+        The normalized text.
+    """
+    if not unicode_aware:
+        return text.lower().translate(_ASCII_PUNCTUATION_TABLE)
+
+    # Note: Case folding can produce text that isn't NFKC normalized, so it's normalized again after.
+    folded = unicodedata.normalize("NFKC", text).casefold()
+    if not unicodedata.is_normalized("NFKC", folded):
+        folded = unicodedata.normalize("NFKC", folded)
+
+    return folded.translate(_UNICODE_PUNCTUATION_TABLE)
+
+
+def normalize_value(value: Any, unicode_aware: bool = False) -> Any:
+    """
+    Lowercase a value and remove its punctuation so that it can be compared with other values.
+
+    Parameters
+    ----------
+    value : Any
+        The value to normalize, with values that aren't strings being returned unchanged.
+
+    unicode_aware : bool, default=False
+        Whether to apply NFKC normalization and case folding and remove the punctuation of all scripts.
+
+    Returns
+    -------
+    Any
+        The normalized value.
+    """
+    if isinstance(value, str):
+        return _normalize_text(text=value, unicode_aware=unicode_aware)
+
+    return value
+
+
+def normalize_values(values: Iterable[Any], unicode_aware: bool = False) -> list[Any]:
+    """
+    Normalize many values at once, which is faster than normalizing each of them.
+
+    Parameters
+    ----------
+    values : Iterable[Any]
+        The values to normalize, with values that aren't strings being returned unchanged.
+
+    unicode_aware : bool, default=False
+        Whether to apply NFKC normalization and case folding and remove the punctuation of all scripts.
+
+    Returns
+    -------
+    list[Any]
+        The normalized values in the order that they were passed.
+    """
+    normalized = list(values)
+    text_indexes = [i for i, v in enumerate(normalized) if isinstance(v, str)]
+    if not text_indexes:
+        return normalized
+
+    joined = _BATCH_SEPARATOR.join(normalized[i] for i in text_indexes)
+
+    # Note: Values that include the separator are normalized one at a time.
+    if joined.count(_BATCH_SEPARATOR) != len(text_indexes) - 1:
+        return [
+            normalize_value(value=v, unicode_aware=unicode_aware) for v in normalized
+        ]
+
+    for i, text in zip(
+        text_indexes,
+        _normalize_text(text=joined, unicode_aware=unicode_aware).split(
+            _BATCH_SEPARATOR
+        ),
+    ):
+        normalized[i] = text
+
+    return normalized
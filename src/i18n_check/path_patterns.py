@@ -0,0 +1,482 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Glob patterns and .gitignore rules for skipping paths when discovering the files of the project.
+
+Patterns are translated to regular expressions and compiled once so that checking a path is a single match.
+"""
+
+import os
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+
+_GLOB_MAGIC_PATTERN = re.compile(r"[*?[]")
+
+# MARK: Glob Patterns
+
+
+def has_glob_magic(path: str | Path) -> bool:
+    """
+    Check whether a path from the configuration is a glob pattern rather than a path.
+
+    Parameters
+    ----------
+    path : str | Path
+        The path or pattern to check.
+
+    Returns
+    -------
+    bool
+        True if the path includes any of the glob characters `*`, `?` or `[`.
+    """
+    return _GLOB_MAGIC_PATTERN.search(str(path)) is not None
+
+
+def is_glob(path: str | Path) -> bool:
+    """
+    Check whether a path from the configuration is used as a glob pattern.
+
+    Parameters
+    ----------
+    path : str | Path
+        The path or pattern to check.
+
+    Returns
+    -------
+    bool
+        True if the path includes glob characters and doesn't exist, as paths like "pages/[id].vue" are literal.
+    """
+    return has_glob_magic(path) and not os.path.lexists(path)
+
+
+def to_posix_path(path: str | Path) -> str:
+    """
+    Convert a path to use forward slashes as glob patterns do.
+
+    Parameters
+    ----------
+    path : str | Path
+        The path to convert.
+
+    Returns
+    -------
+    str
+        The path with the separators of the operating system replaced by forward slashes.
+    """
+    return str(path).replace(os.sep, "/")
+
+
+def resolve_glob(pattern: str | Path) -> str:
+    """
+    Resolve the directories of a glob pattern that come before its first glob character.
+
+    Parameters
+    ----------
+    pattern : str | Path
+        The glob pattern, which is made absolute if it's relative.
+
+    Returns
+    -------
+    str
+        The pattern with its literal leading directories resolved so that it matches resolved paths.
+    """
+    pattern = os.path.abspath(pattern)
+    parts = pattern.split(os.sep)
+    first_magic_index = next(i for i, part in enumerate(parts) if has_glob_magic(part))
+    literal_directory = os.sep.join(parts[:first_magic_index]) or os.sep
+
+    return os.path.join(os.path.realpath(literal_directory), *parts[first_magic_index:])
+
+
+def glob_to_regex(pattern: str) -> str:
+    """
+    Translate a glob pattern with forward slashes to a regular expression that matches whole paths.
+
+    A `*` matches within one path segment, a `**/` matches zero or more directories
+    and a trailing `/**` matches everything within a directory, as in .gitignore files.
+
+    Parameters
+    ----------
+    pattern : str
+        The glob pattern to translate.
+
+    Returns
+    -------
+    str
+        A regular expression for the pattern that should be used with fullmatch.
+    """
+    regex: list[str] = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        is_segment_start = i == 0 or pattern[i - 1] == "/"
+
+        if pattern.startswith("**/", i) and is_segment_start:
+            regex.append("(?:.*/)?")
+            i += 3
+
+        elif pattern.startswith("**", i) and is_segment_start and i + 2 == len(pattern):
+            regex.append(".*")
+            i += 2
+
+        elif char == "*":
+            # Note: Other runs of asterisks match within a segment like a single asterisk.
+            regex.append("[^/]*")
+            while i < len(pattern) and pattern[i] == "*":
+                i += 1
+
+        elif char == "?":
+            regex.append("[^/]")
+            i += 1
+
+        elif char == "[" and (end := _get_char_class_end(pattern, i)) != -1:
+            char_class = pattern[i + 1 : end].replace("\\", "\\\\")
+            if char_class[0] in "!^":
+                char_class = f"^{char_class[1:]}"
+
+            regex.append(f"[{char_class}]")
+            i = end + 1
+
+        elif char == "\\" and i + 1 < len(pattern):
+            regex.append(re.escape(pattern[i + 1]))
+            i += 2
+
+        else:
+            regex.append(re.escape(char))
+            i += 1
+
+    return "".join(regex)
+
+
+def _get_char_class_end(pattern: str, start: int) -> int:
+    """
+    Find the closing bracket of a character class in a glob pattern.
+
+    Parameters
+    ----------
+    pattern : str
+        The glob pattern.
+
+    start : int
+        The index of the opening bracket.
+
+    Returns
+    -------
+    int
+        The index of the closing bracket, or -1 if the bracket isn't closed and is a literal.
+    """
+    i = start + 1
+    if pattern[i : i + 1] in ("!", "^"):
+        i += 1
+
+    # Note: A bracket directly after the opening one is part of the class.
+    if pattern[i : i + 1] == "]":
+        i += 1
+
+    return pattern.find("]", i)
+
+
+def _compile_globs(patterns: Iterable[str], suffix: str = "") -> re.Pattern[str] | None:
+    """
+    Compile glob patterns into one regular expression that matches a path if any pattern does.
+
+    Parameters
+    ----------
+    patterns : Iterable[str]
+        The glob patterns with forward slashes.
+
+    suffix : str, default=""
+        A regular expression that's added after the alternatives of the patterns.
+
+    Returns
+    -------
+    re.Pattern[str] | None
+        The compiled pattern, or None if there are no patterns.
+    """
+    alternatives = [f"(?:{glob_to_regex(p)})" for p in dict.fromkeys(patterns)]
+    if not alternatives:
+        return None
+
+    return re.compile(f"(?:{'|'.join(alternatives)}){suffix}")
+
+
+# MARK: Skip Rules
+
+
+class SkipRules:
+    """
+    The directories and files to skip, each given as a path or a glob pattern.
+
+    Paths are compared with set lookups and all patterns are compiled into one expression for directories and one for files.
+
+    Parameters
+    ----------
+    directories_to_skip : Iterable[str | Path]
+        Paths or glob patterns of directories to skip, including everything within them.
+
+    files_to_skip : Iterable[str | Path]
+        Paths or glob patterns of files to skip.
+    """
+
+    def __init__(
+        self,
+        directories_to_skip: Iterable[str | Path],
+        files_to_skip: Iterable[str | Path],
+    ) -> None:
+        directories_to_skip = [str(d) for d in directories_to_skip]
+        files_to_skip = [str(f) for f in files_to_skip]
+
+        # Note: All entries are also literal paths so that paths with brackets like "pages/[id].vue" are still skipped.
+        self.directories = frozenset(os.path.realpath(d) for d in directories_to_skip)
+        self.files = frozenset(os.path.realpath(f) for f in files_to_skip)
+        self._directory_prefixes = tuple(f"{d}{os.sep}" for d in self.directories)
+
+        # Note: Directory paths are matched with a trailing slash so "dir" and "dir/**" patterns both skip them.
+        self._directory_pattern = _compile_globs(
+            (to_posix_path(resolve_glob(d)) for d in directories_to_skip if is_glob(d)),
+            suffix="(?:/.*)?",
+        )
+        self._file_pattern = _compile_globs(
+            to_posix_path(resolve_glob(f)) for f in files_to_skip if is_glob(f)
+        )
+
+    def skips_directory(self, directory: str) -> bool:
+        """
+        Check whether a directory is skipped so that it doesn't need to be walked.
+
+        Parameters
+        ----------
+        directory : str
+            The resolved path of the directory.
+
+        Returns
+        -------
+        bool
+            True if the directory is one of the directories to skip or matches one of their patterns.
+        """
+        return directory in self.directories or (
+            self._directory_pattern is not None
+            and self._directory_pattern.fullmatch(f"{to_posix_path(directory)}/")
+            is not None
+        )
+
+    def skips_file(self, file_path: str) -> bool:
+        """
+        Check whether a file is skipped, not including whether it's within a skipped directory.
+
+        Parameters
+        ----------
+        file_path : str
+            The resolved path of the file.
+
+        Returns
+        -------
+        bool
+            True if the file is one of the files to skip or matches one of their patterns.
+        """
+        return file_path in self.files or (
+            self._file_pattern is not None
+            and self._file_pattern.fullmatch(to_posix_path(file_path)) is not None
+        )
+
+    def skips_file_or_directory(self, file_path: str) -> bool:
+        """
+        Check whether a file is skipped, including whether it's within a skipped directory.
+
+        Parameters
+        ----------
+        file_path : str
+            The resolved path of the file.
+
+        Returns
+        -------
+        bool
+            True if the file or any of the directories that it's within are skipped.
+        """
+        return (
+            self.skips_file(file_path=file_path)
+            or file_path.startswith(self._directory_prefixes)
+            or (
+                self._directory_pattern is not None
+                and self._directory_pattern.fullmatch(
+                    f"{to_posix_path(os.path.dirname(file_path))}/"
+                )
+                is not None
+            )
+        )
+
+
+# MARK: Gitignore
+
+
+class GitignoreRules:
+    """
+    The rules of a .gitignore file, which apply to the paths within its directory.
+
+    Parameters
+    ----------
+    directory : str
+        The resolved path of the directory of the .gitignore file.
+
+    lines : Iterable[str]
+        The lines of the .gitignore file.
+    """
+
+    def __init__(self, directory: str, lines: Iterable[str]) -> None:
+        self.directory = directory
+
+        rules: list[tuple[bool, bool, str]] = []
+        for line in lines:
+            line = line.rstrip("\r\n")
+            if line.startswith("#"):
+                continue
+
+            # Note: Trailing spaces are ignored unless they're escaped.
+            if not line.endswith("\\ "):
+                line = line.rstrip(" ")
+
+            is_negated = line.startswith("!")
+            if is_negated:
+                line = line[1:]
+
+            is_directory_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+
+            # Note: Patterns with a slash before the end are relative to the directory, others match at any depth.
+            if "/" in line:
+                line = line.lstrip("/")
+
+            else:
+                line = f"**/{line}"
+
+            rules.append((is_negated, is_directory_only, glob_to_regex(line)))
+
+        self._rules = [
+            (is_negated, is_directory_only, re.compile(regex))
+            for is_negated, is_directory_only, regex in rules
+        ]
+        # Note: Most paths match no rule, which one expression of all rules checks at once.
+        self._any_rule = (
+            re.compile("|".join(f"(?:{r})" for _, _, r in rules)) if rules else None
+        )
+
+    def match(self, relative_path: str, is_directory: bool) -> bool | None:
+        """
+        Check whether a path is ignored by the rules, with the last rule that matches deciding.
+
+        Parameters
+        ----------
+        relative_path : str
+            The path relative to the directory of the .gitignore file with forward slashes.
+
+        is_directory : bool
+            Whether the path is a directory.
+
+        Returns
+        -------
+        bool | None
+            True if the path is ignored, False if it's included again by a negated rule and None if no rule matches.
+        """
+        if self._any_rule is None or self._any_rule.fullmatch(relative_path) is None:
+            return None
+
+        for is_negated, is_directory_only, pattern in reversed(self._rules):
+            if (is_directory or not is_directory_only) and pattern.fullmatch(
+                relative_path
+            ):
+                return not is_negated
+
+        return None
+
+
+def read_gitignore_rules(directory: str) -> GitignoreRules | None:
+    """
+    Read the rules of the .gitignore file of a directory.
+
+    Parameters
+    ----------
+    directory : str
+        The resolved path of the directory.
+
+    Returns
+    -------
+    GitignoreRules | None
+        The rules of the .gitignore file, or None if the directory doesn't have one.
+    """
+    try:
+        with open(
+            os.path.join(directory, ".gitignore"),
+            "r",
+            encoding="utf-8",
+            errors="replace",
+        ) as f:
+            return GitignoreRules(directory=directory, lines=f.readlines())
+
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def get_parent_gitignore_rules(directory: str) -> tuple[GitignoreRules, ...]:
+    """
+    Get the rules of the .gitignore files of the directories above a directory within its git repository.
+
+    Parameters
+    ----------
+    directory : str
+        The resolved path of the directory.
+
+    Returns
+    -------
+    tuple[GitignoreRules, ...]
+        The rules from the root of the repository down to the parent of the directory,
+        or no rules if the directory isn't within a git repository.
+    """
+    parents = list(Path(directory).parents)
+    for index, path in enumerate([Path(directory), *parents]):
+        if (path / ".git").exists():
+            repository_parents = [str(p) for p in parents[:index]]
+            break
+
+    else:
+        return ()
+
+    return tuple(
+        rules
+        for rules in map(read_gitignore_rules, reversed(repository_parents))
+        if rules is not None
+    )
+
+
+def is_gitignored(
+    path: str, is_directory: bool, gitignore_rules: Iterable[GitignoreRules]
+) -> bool:
+    """
+    Check whether a path is ignored by the .gitignore files of the directories it's within.
+
+    Parameters
+    ----------
+    path : str
+        The path to check.
+
+    is_directory : bool
+        Whether the path is a directory.
+
+    gitignore_rules : Iterable[GitignoreRules]
+        The rules of the .gitignore files from the outermost directory to the innermost.
+
+    Returns
+    -------
+    bool
+        True if the last rule that matches the path ignores it.
+    """
+    is_ignored = False
+    for rules in gitignore_rules:
+        relative_path = to_posix_path(path[len(rules.directory) + 1 :])
+        if (rule_match := rules.match(relative_path, is_directory)) is not None:
+            is_ignored = rule_match
+
+    return is_ignored
@@ -0,0 +1,273 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Detection of near-duplicate i18n values such as "sign in" and "sign-in now" without comparing all pairs of values.
+
+Values are split into character n-gram shingles and the Jaccard similarity of their shingles is compared to a threshold.
+Candidate pairs are found with an inverted index of only the rarest shingles of each value, as values that are
+at least as similar as the threshold always share several of these, so most pairs of values are never compared
+while no similar pairs are missed.
+
+Examples
+--------
+Run the following script in terminal:
+
+>>> i18n-check -rv --similarity-threshold 0.8
+"""
+
+import bisect
+import itertools
+import math
+from collections import Counter
+from collections.abc import Iterable
+
+# Note: Trigrams are long enough to be specific but short enough for short values to share several.
+NGRAM_SIZE = 3
+# Note: Requiring values to share more than one indexed shingle skips most values that only share a common one.
+MIN_SHARED_PREFIX = 3
+
+_similarity_threshold: float | None = None
+
+# MARK: Threshold
+
+
+def set_similarity_threshold(similarity_threshold: float | None) -> None:
+    """
+    Set the similarity from which values are reported as near-duplicates in the current process.
+
+    Parameters
+    ----------
+    similarity_threshold : float | None
+        The Jaccard similarity of the shingles of values from 0 to 1, or None to only report exact repeats.
+    """
+    global _similarity_threshold
+
+    _similarity_threshold = similarity_threshold
+
+
+def get_similarity_threshold() -> float | None:
+    """
+    Get the similarity from which values are reported as near-duplicates in the current process.
+
+    Returns
+    -------
+    float | None
+        The Jaccard similarity of the shingles of values from 0 to 1, or None if only exact repeats are reported.
+    """
+    return _similarity_threshold
+
+
+# MARK: Shingles
+
+
+def get_shingles(value: str, ngram_size: int = NGRAM_SIZE) -> frozenset[str]:
+    """
+    Split a value into its character n-grams with whitespace removed.
+
+    Parameters
+    ----------
+    value : str
+        The normalized value to split.
+
+    ngram_size : int, default=3
+        The number of characters of each shingle.
+
+    Returns
+    -------
+    frozenset[str]
+        The distinct shingles of the value, or the value itself if it's shorter than one shingle.
+    """
+    # Note: Whitespace is removed so that "sign in" and "signin" have the same shingles.
+    text = "".join(value.split())
+    if len(text) <= ngram_size:
+        return frozenset((text,))
+
+    return frozenset(map("".join, zip(*(text[i:] for i in range(ngram_size)))))
+
+
+def jaccard_similarity(
+    shingles: frozenset[str], other_shingles: frozenset[str]
+) -> float:
+    """
+    Derive the Jaccard similarity of two sets of shingles.
+
+    Parameters
+    ----------
+    shingles : frozenset[str]
+        The shingles of a value.
+
+    other_shingles : frozenset[str]
+        The shingles of the value to compare it to.
+
+    Returns
+    -------
+    float
+        The number of shared shingles divided by the number of distinct shingles of both values.
+    """
+    overlap = len(shingles & other_shingles)
+
+    return overlap / (len(shingles) + len(other_shingles) - overlap)
+
+
+# MARK: Similar Pairs
+
+
+def find_similar_pairs(
+    values: list[str],
+    similarity_threshold: float,
+    ngram_size: int = NGRAM_SIZE,
+    min_shared_prefix: int = MIN_SHARED_PREFIX,
+) -> list[tuple[int, int, float]]:
+    """
+    Find the pairs of values whose shingles are at least as similar as a threshold.
+
+    Shingles are ordered from the rarest to the most common and values are indexed by their first shingles.
+    Values that share at least a shingles have k of their shared shingles within their first n - a + k shingles,
+    so values are only compared if their prefixes share k shingles, and most pairs of values are never compared.
+
+    Parameters
+    ----------
+    values : list[str]
+        The distinct normalized values to compare.
+
+    similarity_threshold : float
+        The Jaccard similarity from 0 to 1 that pairs of values need to have.
+
+    ngram_size : int, default=3
+        The number of characters of each shingle.
+
+    min_shared_prefix : int, default=MIN_SHARED_PREFIX
+        The number of shingles k that the prefixes of values need to share for the values to be compared.
+
+    Returns
+    -------
+    list[tuple[int, int, float]]
+        The indexes of the values of each pair with the lower first and their similarity.
+    """
+    if not 0 < similarity_threshold <= 1:
+        raise ValueError(
+            "The similarity threshold needs to be greater than 0 and at most 1."
+        )
+
+    def get_min_overlap(size: float) -> int:
+        """
+        Get the number of shingles that a number of shingles times the threshold rounds up to.
+
+        Parameters
+        ----------
+        size : float
+            The number of shingles.
+
+        Returns
+        -------
+        int
+            The smallest whole number that's at least the number times the threshold.
+        """
+        # Note: The tolerance keeps products that are whole numbers from rounding up due to float errors.
+        return math.ceil(similarity_threshold * size - 1e-9)
+
+    shingles = [get_shingles(value=v, ngram_size=ngram_size) for v in values]
+    shingle_counts = Counter(itertools.chain.from_iterable(shingles))
+    shingle_ranks = {
+        s: rank
+        for rank, s in enumerate(
+            sorted(shingle_counts, key=lambda s: (shingle_counts[s], s))
+        )
+    }
+    ranked_shingles = [sorted(map(shingle_ranks.__getitem__, s)) for s in shingles]
+    sizes = list(map(len, shingles))
+
+    # Note: Values are indexed from the fewest shingles, so indexed values are never larger than the current one.
+    prefix_index: dict[int, list[int]] = {}
+    similar_pairs: list[tuple[int, int, float]] = []
+    for i in sorted(range(len(values)), key=sizes.__getitem__):
+        size = sizes[i]
+
+        # Note: Smaller values need at least the threshold times as many shingles, so others are skipped with a binary search.
+        min_overlap = get_min_overlap(size)
+        prefix_counts = Counter(
+            itertools.chain.from_iterable(
+                indexed[
+                    bisect.bisect_left(indexed, min_overlap, key=sizes.__getitem__) :
+                ]
+                for indexed in map(
+                    prefix_index.get,
+                    ranked_shingles[i][: size - min_overlap + min_shared_prefix],
+                    itertools.repeat(()),
+                )
+            )
+        )
+        min_prefix_count = min(min_shared_prefix, min_overlap)
+        for j, prefix_count in prefix_counts.items():
+            if prefix_count >= min_prefix_count:
+                similarity = jaccard_similarity(shingles[i], shingles[j])
+                if similarity >= similarity_threshold:
+                    similar_pairs.append((min(i, j), max(i, j), similarity))
+
+        # Note: Later values are at least as large, so values share more shingles with them and fewer are indexed.
+        index_overlap = get_min_overlap(2 * size / (1 + similarity_threshold))
+        for rank in ranked_shingles[i][: size - index_overlap + min_shared_prefix]:
+            prefix_index.setdefault(rank, []).append(i)
+
+    return sorted(similar_pairs)
+
+
+# MARK: Clusters
+
+
+def cluster_similar_values(
+    values: Iterable[str], similarity_threshold: float, ngram_size: int = NGRAM_SIZE
+) -> list[list[str]]:
+    """
+    Group values into clusters of near-duplicates, with values being in a cluster if they're similar to any of its values.
+
+    Parameters
+    ----------
+    values : Iterable[str]
+        The distinct normalized values to group.
+
+    similarity_threshold : float
+        The Jaccard similarity from 0 to 1 that values need to have with a value of a cluster.
+
+    ngram_size : int, default=3
+        The number of characters of each shingle.
+
+    Returns
+    -------
+    list[list[str]]
+        The clusters of more than one value, each with its values and ordered by its first value in the order that they were passed.
+    """
+    values = list(values)
+    parents = list(range(len(values)))
+
+    def find_root(i: int) -> int:
+        """
+        Find the value that represents the cluster of a value.
+
+        Parameters
+        ----------
+        i : int
+            The index of the value.
+
+        Returns
+        -------
+        int
+            The index of the first value of the cluster.
+        """
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+
+        return i
+
+    for i, j, _ in find_similar_pairs(
+        values=values, similarity_threshold=similarity_threshold, ngram_size=ngram_size
+    ):
+        root_i, root_j = find_root(i), find_root(j)
+        if root_i != root_j:
+            parents[max(root_i, root_j)] = min(root_i, root_j)
+
+    clusters: dict[int, list[str]] = {}
+    for i, value in enumerate(values):
+        clusters.setdefault(find_root(i), []).append(value)
+
+    return [cluster for cluster in clusters.values() if len(cluster) > 1]
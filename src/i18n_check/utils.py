@@ -9,6 +9,7 @@ import os
 import re
 import string
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
@@ -16,6 +17,18 @@ from typing import Any
 import yaml
 from rich import print as rprint
 
+from i18n_check.file_writer import write_file, write_files
+from i18n_check.key_matcher import KeyReplacer
+from i18n_check.normalization import normalize_value
+from i18n_check.path_patterns import (
+    GitignoreRules,
+    SkipRules,
+    get_parent_gitignore_rules,
+    has_glob_magic,
+    is_gitignored,
+    read_gitignore_rules,
+)
+
 # Check for Windows and derive directory path separator.
 PATH_SEPARATOR = "\\" if os.name == "nt" else "/"
 
@@ -100,6 +113,7 @@ config_file_types_to_check = config["file-types-to-check"]
 config_global_active = False
 config_global_directories_to_skip: list[Path] = []
 config_global_files_to_skip: list[Path] = []
+config_global_respect_gitignore = False
 
 if "global" in config["checks"]:
     if "active" in config["checks"]["global"]:
@@ -119,6 +133,11 @@ if "global" in config["checks"]:
             for f in config["checks"]["global"]["files-to-skip"]
         ]
 
+    if "respect-gitignore" in config["checks"]["global"]:
+        config_global_respect_gitignore = bool(
+            config["checks"]["global"]["respect-gitignore"]
+        )
+
 # MARK: Key Formatting
 
 # Note: We don't have skipped files or directories for non-source-keys.
@@ -182,6 +201,8 @@ config_nonexistent_keys_active = config_global_active
 config_nonexistent_keys_directories_to_skip = config_global_directories_to_skip.copy()
 config_nonexistent_keys_files_to_skip = config_global_files_to_skip.copy()
 config_nonexistent_keys_search_dirs = []
+config_nonexistent_keys_key_prefixes = ["i18n."]
+config_nonexistent_keys_key_quotes = ["'", '"', "`"]
 
 if "nonexistent-keys" in config["checks"]:
     if "active" in config["checks"]["nonexistent-keys"]:
@@ -208,6 +229,16 @@ if "nonexistent-keys" in config["checks"]:
             for d in config["checks"]["nonexistent-keys"]["search-dirs"]
         ]
 
+    if "key-prefixes" in config["checks"]["nonexistent-keys"]:
+        config_nonexistent_keys_key_prefixes = [
+            str(p) for p in config["checks"]["nonexistent-keys"]["key-prefixes"]
+        ]
+
+    if "key-quotes" in config["checks"]["nonexistent-keys"]:
+        config_nonexistent_keys_key_quotes = [
+            str(q) for q in config["checks"]["nonexistent-keys"]["key-quotes"]
+        ]
+
 # MARK: Non-Source Keys
 
 # Note: We don't have skipped files or directories for non-source-keys.
@@ -238,6 +269,26 @@ if (
 ):
     config_repeat_values_active = config["checks"]["repeat-values"]["active"]
 
+config_repeat_values_unicode_normalization = False
+
+if (
+    "repeat-values" in config["checks"]
+    and "unicode-normalization" in config["checks"]["repeat-values"]
+):
+    config_repeat_values_unicode_normalization = bool(
+        config["checks"]["repeat-values"]["unicode-normalization"]
+    )
+
+config_repeat_values_locale_values = False
+
+if (
+    "repeat-values" in config["checks"]
+    and "locale-values" in config["checks"]["repeat-values"]
+):
+    config_repeat_values_locale_values = bool(
+        config["checks"]["repeat-values"]["locale-values"]
+    )
+
 # MARK: Unused Keys
 
 config_unused_keys_active = config_global_active
@@ -343,12 +394,106 @@ def read_json_file(file_path: str | Path) -> Any:
 # MARK: Collect Files
 
 
+def _scan_files_to_check(
+    directory: str,
+    file_type_suffixes: frozenset[str],
+    skip_rules: SkipRules,
+    gitignore_rules: tuple[GitignoreRules, ...] | None,
+    files_to_check: list[str],
+) -> None:
+    """
+    Add the files with the given suffixes within a directory to a list, walking subdirectories that aren't skipped.
+
+    Files are added in the order of os.walk, with the files of a directory before those of its subdirectories.
+
+    Parameters
+    ----------
+    directory : str
+        The resolved path of the directory to scan.
+
+    file_type_suffixes : frozenset[str]
+        The suffixes of the files to add.
+
+    skip_rules : SkipRules
+        The directories to not walk and the files to not add.
+
+    gitignore_rules : tuple[GitignoreRules, ...] | None
+        The rules of the .gitignore files of the directories above, or None if .gitignore files aren't honored.
+
+    files_to_check : list[str]
+        The list that the resolved paths of files are added to.
+    """
+    try:
+        with os.scandir(directory) as scanned_entries:
+            entries = list(scanned_entries)
+
+    except OSError:
+        return
+
+    if gitignore_rules is not None and any(e.name == ".gitignore" for e in entries):
+        if (directory_rules := read_gitignore_rules(directory=directory)) is not None:
+            gitignore_rules = (*gitignore_rules, directory_rules)
+
+    subdirectories: list[str] = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+
+        except OSError:
+            is_dir = False
+
+        # Note: Paths within a resolved directory are resolved unless they're symlinks.
+        if is_dir:
+            # Note: Skipped and ignored directories are pruned and symlinks aren't followed, as with os.walk.
+            if (
+                not entry.is_symlink()
+                and not skip_rules.skips_directory(directory=entry.path)
+                and not (
+                    gitignore_rules is not None
+                    and (
+                        entry.name == ".git"
+                        or is_gitignored(
+                            path=entry.path,
+                            is_directory=True,
+                            gitignore_rules=gitignore_rules,
+                        )
+                    )
+                )
+            ):
+                subdirectories.append(entry.path)
+
+            continue
+
+        file_path = os.path.realpath(entry.path) if entry.is_symlink() else entry.path
+        if (
+            os.path.splitext(file_path)[1] in file_type_suffixes
+            and not skip_rules.skips_file(file_path=file_path)
+            and not (
+                gitignore_rules
+                and is_gitignored(
+                    path=entry.path, is_directory=False, gitignore_rules=gitignore_rules
+                )
+            )
+        ):
+            files_to_check.append(file_path)
+
+    for subdirectory in subdirectories:
+        _scan_files_to_check(
+            directory=subdirectory,
+            file_type_suffixes=file_type_suffixes,
+            skip_rules=skip_rules,
+            gitignore_rules=gitignore_rules,
+            files_to_check=files_to_check,
+        )
+
+
 @lru_cache(maxsize=128)
 def _collect_files_to_check_cached(
     directory: str,
     file_types_to_check: tuple[str, ...],
     directories_to_skip: tuple[str, ...],
     files_to_skip: tuple[str, ...],
+    respect_gitignore: bool = False,
 ) -> tuple[str, ...]:
     """
     Cached implementation of collect_files_to_check.
@@ -364,41 +509,43 @@ def _collect_files_to_check_cached(
         Tuple of file extensions to search for.
 
     directories_to_skip : tuple[str, ...]
-        Tuple of resolved directory paths to skip.
+        Tuple of resolved directory paths or glob patterns to skip.
 
     files_to_skip : tuple[str, ...]
-        Tuple of resolved file paths to skip.
+        Tuple of resolved file paths or glob patterns to skip.
+
+    respect_gitignore : bool, default=False
+        Whether to skip the files and directories that .gitignore files ignore.
 
     Returns
     -------
     tuple[str, ...]
         Tuple of file paths that match the given extensions.
     """
-    directory_path = Path(directory).resolve()
-    skip_dirs_resolved = [Path(d).resolve() for d in directories_to_skip]
-    skip_files_resolved = [Path(f).resolve() for f in files_to_skip]
+    directory_path = os.path.realpath(directory)
+    # Note: Suffixes and skipped paths are sets so each file is checked in constant time.
+    file_type_suffixes = frozenset(
+        f".{ftype.lstrip('.')}" for ftype in file_types_to_check
+    )
+    skip_rules = SkipRules(
+        directories_to_skip=directories_to_skip, files_to_skip=files_to_skip
+    )
     files_to_check: list[str] = []
 
-    for root, dirs, files in os.walk(directory_path):
-        root_path = Path(root).resolve()
-
-        # Skip directories in directories_to_skip and later files in files_to_skip.
-        if any(
-            root_path == skip_dir or root_path.is_relative_to(skip_dir)
-            for skip_dir in skip_dirs_resolved
-        ):
-            continue
-
-        for file in files:
-            file_path = (root_path / file).resolve()
-            if (
-                any(
-                    file_path.suffix == f".{ftype.lstrip('.')}"
-                    for ftype in file_types_to_check
-                )
-                and file_path not in skip_files_resolved
-            ):
-                files_to_check.append(str(file_path))
+    if not skip_rules.skips_file_or_directory(
+        file_path=os.path.join(directory_path, "")
+    ):
+        _scan_files_to_check(
+            directory=directory_path,
+            file_type_suffixes=file_type_suffixes,
+            skip_rules=skip_rules,
+            gitignore_rules=(
+                get_parent_gitignore_rules(directory=directory_path)
+                if respect_gitignore
+                else None
+            ),
+            files_to_check=files_to_check,
+        )
 
     return tuple(files_to_check)
 
@@ -408,6 +555,7 @@ def collect_files_to_check(
     file_types_to_check: list[str],
     directories_to_skip: list[Path],
     files_to_skip: list[Path],
+    respect_gitignore: bool = config_global_respect_gitignore,
 ) -> list[str]:
     """
     Collect all files with a given extension from a directory and its subdirectories.
@@ -424,10 +572,13 @@ def collect_files_to_check(
         The extensions for files to search in.
 
     directories_to_skip : list[Path]
-        Paths to directories to not include in the checks.
+        Paths or glob patterns of directories to not include in the checks.
 
     files_to_skip : list[Path]
-        Paths to files to not include in the checks.
+        Paths or glob patterns of files to not include in the checks.
+
+    respect_gitignore : bool, default=`respect-gitignore`
+        Whether to skip the files and directories that .gitignore files ignore.
 
     Returns
     -------
@@ -437,14 +588,21 @@ def collect_files_to_check(
     # Convert to hashable types and call cached implementation.
     directory_str = str(Path(directory).resolve())
     file_types_tuple = tuple(file_types_to_check)
-    directories_tuple = tuple(str(Path(d).resolve()) for d in directories_to_skip)
-    files_tuple = tuple(str(Path(f).resolve()) for f in files_to_skip)
+    # Note: Glob patterns aren't resolved as they aren't paths.
+    directories_tuple = tuple(
+        str(d) if has_glob_magic(d) else str(Path(d).resolve())
+        for d in directories_to_skip
+    )
+    files_tuple = tuple(
+        str(f) if has_glob_magic(f) else str(Path(f).resolve()) for f in files_to_skip
+    )
 
     result = _collect_files_to_check_cached(
         directory_str,
         file_types_tuple,
         directories_tuple,
         files_tuple,
+        respect_gitignore,
     )
 
     # Convert back to list for backward compatibility.
@@ -493,9 +651,9 @@ def collect_source_and_search_dir_files_to_fix(
             directories_to_skip=directories_to_skip,
             files_to_skip=files_to_skip,
         ):
-            resolved_file_path = str(Path(file_path).resolve())
-            if resolved_file_path not in seen_files:
-                seen_files.add(resolved_file_path)
+            # Note: Collected files are already resolved, so they can be compared directly.
+            if file_path not in seen_files:
+                seen_files.add(file_path)
                 files_to_fix.append(file_path)
 
     return files_to_fix
@@ -637,6 +795,15 @@ def get_all_json_files(directory: str | Path) -> list[str]:
     return list(result)
 
 
+def clear_collected_files_caches() -> None:
+    """
+    Clear the cached results of collecting files so that added and removed files are found.
+    """
+    _collect_files_to_check_cached.cache_clear()
+    _get_all_json_files_cached.cache_clear()
+    get_parent_gitignore_rules.cache_clear()
+
+
 # MARK: Lower and Remove Punctuation
 
 
@@ -654,13 +821,7 @@ def lower_and_remove_punctuation(text: str) -> str:
     str
         The processed text with lowercase letters and no punctuation.
     """
-    punctuation_no_exclamation = string.punctuation.replace("!", "")
-
-    if isinstance(text, str):
-        return text.lower().translate(str.maketrans("", "", punctuation_no_exclamation))
-
-    else:
-        return text
+    return normalize_value(value=text)
 
 
 # MARK: Reading to Dicts
@@ -709,14 +870,162 @@ def replace_text_in_file(path: str | Path, old: str, new: str) -> None:
     with open(path, "r", encoding="utf-8") as file:
         content = file.read()
 
-    if old in content:
-        content = content.replace(old, new)
-        with open(path, "w", encoding="utf-8") as file:
-            file.write(content)
-
+    if old in content and write_file(
+        file_path=path, content=content.replace(old, new), old_content=content
+    ):
         rprint(f"[yellow]\n✨ Replaced '{old}' with '{new}' in {path}[/yellow]")
 
 
+def _print_replacements(
+    path: str | Path, replacements: dict[str, str], replaced_count: dict[str, int]
+) -> None:
+    """
+    Print the replacements that were made in a file.
+
+    Parameters
+    ----------
+    path : str or Path
+        The path to the file in which the replacements were made.
+
+    replacements : dict[str, str]
+        A dictionary where keys are the substrings to be replaced and values are the strings to replace them with.
+
+    replaced_count : dict[str, int]
+        A dictionary where keys are the replaced substrings and values are the number of times they were replaced.
+    """
+    replacement_count = sum(replaced_count.values())
+    replacement_or_replacements = (
+        "replacement" if replacement_count == 1 else "replacements"
+    )
+    if len(replaced_count) == 1:
+        old = next(iter(replaced_count))
+        rprint(
+            f"[yellow]\n✨ Replaced '{old}' with '{replacements[old]}' in {path} ({replacement_count} {replacement_or_replacements})[/yellow]"
+        )
+
+    else:
+        rprint(
+            f"[yellow]\n✨ Replaced {len(replaced_count)} keys in {path} ({replacement_count} {replacement_or_replacements})[/yellow]"
+        )
+
+
+def replace_texts_in_file(
+    path: str | Path,
+    replacements: dict[str, str],
+    key_replacer: KeyReplacer | None = None,
+) -> int:
+    """
+    Replace all occurrences of many keys in a file in one pass, writing the file only if it changes.
+
+    Parameters
+    ----------
+    path : str or Path
+        The path to the file in which to perform the replacements.
+
+    replacements : dict[str, str]
+        A dictionary where keys are the substrings to be replaced and values are the strings to replace them with.
+
+    key_replacer : KeyReplacer, optional
+        A replacer for the given replacements that can be reused between files, which is built if not passed.
+
+    Returns
+    -------
+    int
+        The number of replacements that were made in the file.
+    """
+    if key_replacer is None:
+        key_replacer = KeyReplacer(replacements=replacements)
+
+    with open(path, "r", encoding="utf-8") as file:
+        content = file.read()
+
+    new_content, replaced_count = key_replacer.replace_keys(text=content)
+    if not write_file(file_path=path, content=new_content, old_content=content):
+        return 0
+
+    _print_replacements(
+        path=path, replacements=replacements, replaced_count=replaced_count
+    )
+
+    return sum(replaced_count.values())
+
+
+def replace_texts_in_files(
+    paths: list[str], replacements: dict[str, str], max_workers: int | None = None
+) -> dict[str, int]:
+    """
+    Replace all occurrences of many keys in files, reading each file once and writing only those that change.
+
+    Files are read and written in parallel as this is bound by I/O.
+
+    Parameters
+    ----------
+    paths : list[str]
+        The paths to the files in which to perform the replacements.
+
+    replacements : dict[str, str]
+        A dictionary where keys are the substrings to be replaced and values are the strings to replace them with.
+
+    max_workers : int, optional
+        The maximum number of threads used to read and write files.
+
+    Returns
+    -------
+    dict[str, int]
+        A dictionary where keys are paths of changed files and values are the number of replacements made in them.
+    """
+    key_replacer = KeyReplacer(replacements=replacements)
+    if not key_replacer.replacements:
+        return {}
+
+    def replace_keys_in_file(path: str) -> tuple[str, str, dict[str, int]]:
+        """
+        Replace the keys within the contents of a file without writing it.
+
+        Parameters
+        ----------
+        path : str
+            The path to the file in which to replace keys.
+
+        Returns
+        -------
+        tuple[str, str, dict[str, int]]
+            The contents of the file, the contents with keys replaced and the number of times each key was replaced.
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            content = file.read()
+
+        new_content, replaced_count = key_replacer.replace_keys(text=content)
+
+        return content, new_content, replaced_count
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        replaced_files = {
+            str(path): replaced
+            for path, replaced in zip(paths, executor.map(replace_keys_in_file, paths))
+            if replaced[2]
+        }
+
+    # Note: The contents that were read are passed so that files aren't read again to check whether they changed.
+    changed_files = write_files(
+        file_contents={
+            f: new_content for f, (_, new_content, _) in replaced_files.items()
+        },
+        max_workers=max_workers,
+        old_contents={f: content for f, (content, _, _) in replaced_files.items()},
+    )
+
+    replacement_counts: dict[str, int] = {}
+    for path in changed_files:
+        replaced_count = replaced_files[path][2]
+        _print_replacements(
+            path=path, replacements=replacements, replaced_count=replaced_count
+        )
+        replacement_counts[path] = sum(replaced_count.values())
+
+    return replacement_counts
+
+
 # MARK: Text Characteristics
 
 
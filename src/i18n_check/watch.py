@@ -0,0 +1,276 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Watches the project and reruns the affected i18n checks when files change.
+
+The process is kept alive so the source corpus, result cache and imports are reused between runs.
+
+Examples
+--------
+Run the following script in terminal:
+
+>>> i18n-check -w
+"""
+
+import os
+import time
+from pathlib import Path
+
+from rich import print as rprint
+
+from i18n_check.changed_files import get_affected_check_names
+from i18n_check.check.registry import CHECK_REGISTRY, run_check
+from i18n_check.corpus import get_source_corpus
+from i18n_check.intermediates import clear_intermediates
+from i18n_check.path_patterns import SkipRules
+from i18n_check.utils import (
+    YAML_CONFIG_FILE_PATH,
+    config_file_types_to_check,
+    config_global_directories_to_skip,
+    config_i18n_directory,
+    config_nonexistent_keys_search_dirs,
+    config_src_directory,
+)
+
+# Note: Polling is used as the standard library has no file system notifications.
+WATCH_POLL_INTERVAL = 0.5
+
+# MARK: File Stats
+
+
+def get_file_stats(
+    directories: list[Path],
+    file_types: list[str],
+    directories_to_skip: list[Path],
+) -> dict[str, tuple[int, int]]:
+    """
+    Get the modification times and sizes of the files that could affect the checks.
+
+    Parameters
+    ----------
+    directories : list[Path]
+        The directories to get the file stats of.
+
+    file_types : list[str]
+        The extensions of the files to include.
+
+    directories_to_skip : list[Path]
+        Paths or glob patterns of directories that are not walked.
+
+    Returns
+    -------
+    dict[str, tuple[int, int]]
+        A dictionary where keys are resolved file paths and values are their mtimes and sizes.
+    """
+    file_type_suffixes = tuple(file_types)
+    skip_rules = SkipRules(directories_to_skip=directories_to_skip, files_to_skip=[])
+
+    file_stats: dict[str, tuple[int, int]] = {}
+    for directory in dict.fromkeys(str(Path(d).resolve()) for d in directories):
+        for root, dirs, files in os.walk(directory):
+            # Note: Pruned in place so that skipped directories aren't walked.
+            dirs[:] = [
+                d
+                for d in dirs
+                if not skip_rules.skips_directory(directory=os.path.join(root, d))
+            ]
+
+            for file in files:
+                if not file.endswith(file_type_suffixes):
+                    continue
+
+                file_path = os.path.join(root, file)
+                try:
+                    file_stat = os.stat(file_path)
+
+                except OSError:
+                    continue
+
+                file_stats[file_path] = (file_stat.st_mtime_ns, file_stat.st_size)
+
+    return file_stats
+
+
+def get_changed_paths(
+    old_stats: dict[str, tuple[int, int]], new_stats: dict[str, tuple[int, int]]
+) -> list[Path]:
+    """
+    Get the files that were added, removed or modified between two sets of file stats.
+
+    Parameters
+    ----------
+    old_stats : dict[str, tuple[int, int]]
+        The previous file stats.
+
+    new_stats : dict[str, tuple[int, int]]
+        The current file stats.
+
+    Returns
+    -------
+    list[Path]
+        The paths of the files that have changed.
+    """
+    return [
+        Path(f)
+        for f in sorted(old_stats.keys() | new_stats.keys())
+        if old_stats.get(f) != new_stats.get(f)
+    ]
+
+
+# MARK: Watcher
+
+
+class CheckWatcher:
+    """
+    Reruns the active i18n checks that are affected by changes to the files of the project.
+
+    Parameters
+    ----------
+    poll_interval : float, default=WATCH_POLL_INTERVAL
+        The number of seconds between checking the files for changes.
+    """
+
+    def __init__(self, poll_interval: float = WATCH_POLL_INTERVAL) -> None:
+        self.poll_interval = poll_interval
+        self.check_names = [
+            name for name, check in CHECK_REGISTRY.items() if check.active
+        ]
+
+        self.directories = [
+            config_src_directory,
+            *config_nonexistent_keys_search_dirs,
+            config_i18n_directory,
+        ]
+        self.file_types = [*config_file_types_to_check, ".json"]
+        self.config_file = Path(YAML_CONFIG_FILE_PATH).resolve()
+
+        self._file_stats = self._get_file_stats()
+        self._known_files = set(self._file_stats)
+
+    def _get_file_stats(self) -> dict[str, tuple[int, int]]:
+        """
+        Get the stats of the watched files including the configuration file.
+
+        Returns
+        -------
+        dict[str, tuple[int, int]]
+            A dictionary where keys are resolved file paths and values are their mtimes and sizes.
+        """
+        file_stats = get_file_stats(
+            directories=self.directories,
+            file_types=self.file_types,
+            directories_to_skip=config_global_directories_to_skip,
+        )
+        if self.config_file.is_file():
+            config_stat = self.config_file.stat()
+            file_stats[str(self.config_file)] = (
+                config_stat.st_mtime_ns,
+                config_stat.st_size,
+            )
+
+        return file_stats
+
+    def poll(self) -> list[Path]:
+        """
+        Get the files that have changed since the last poll.
+
+        Returns
+        -------
+        list[Path]
+            The paths of the files that were added, removed or modified.
+        """
+        file_stats = self._get_file_stats()
+        changed_paths = get_changed_paths(
+            old_stats=self._file_stats, new_stats=file_stats
+        )
+        self._file_stats = file_stats
+
+        return changed_paths
+
+    def update(self, changed_paths: list[Path]) -> None:
+        """
+        Update the data that is kept in memory between runs given the changed files.
+
+        Parameters
+        ----------
+        changed_paths : list[Path]
+            The paths of the files that have changed.
+        """
+        # Note: Changed files are reread by the corpus, so only new and removed files need handling.
+        if any(
+            not p.is_file() or str(p) not in self._known_files for p in changed_paths
+        ):
+            get_source_corpus().clear_files()
+
+        self._known_files = set(self._file_stats)
+
+        # Note: Intermediates are cheap to recompute as the results for unchanged files are cached.
+        # This includes the "i18n-src-dict" intermediate that checks read the i18n-src file from when they're ran.
+        clear_intermediates()
+
+    def run_checks(self, check_names: list[str]) -> bool:
+        """
+        Run checks in the current process and report how long they took.
+
+        Parameters
+        ----------
+        check_names : list[str]
+            The names of the checks to run.
+
+        Returns
+        -------
+        bool
+            True if all checks are successful.
+        """
+        start_time = time.perf_counter()
+
+        check_results: list[bool] = []
+        for name in check_names:
+            try:
+                check_results.append(run_check(name, all_checks_enabled=True))
+
+            except ValueError:
+                check_results.append(False)
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        failed_checks_count = check_results.count(False)
+        check_or_checks = "check" if len(check_names) == 1 else "checks"
+
+        if failed_checks_count:
+            rprint(
+                f"\n[red]❌ i18n-check error: {failed_checks_count} of {len(check_names)} i18n {check_or_checks} did not pass ({elapsed_ms:.0f} ms).[/red]"
+            )
+
+        else:
+            rprint(
+                f"\n[green]✅ Success: {len(check_names)} i18n {check_or_checks} passed ({elapsed_ms:.0f} ms).[/green]"
+            )
+
+        return not failed_checks_count
+
+    def watch(self) -> None:
+        """
+        Run all active checks and then rerun the affected checks whenever files change.
+        """
+        self.run_checks(check_names=self.check_names)
+        rprint("\n[yellow]👀 Watching for changes. Press Ctrl+C to stop.[/yellow]")
+
+        try:
+            while True:
+                time.sleep(self.poll_interval)
+                if not (changed_paths := self.poll()):
+                    continue
+
+                if self.config_file in changed_paths:
+                    rprint(
+                        "\n[yellow]⚠️  The configuration file has changed. Please restart i18n-check --watch to use it.[/yellow]"
+                    )
+                    return
+
+                self.update(changed_paths=changed_paths)
+                if affected_check_names := get_affected_check_names(
+                    changed_files=changed_paths, check_names=self.check_names
+                ):
+                    self.run_checks(check_names=affected_check_names)
+
+        except KeyboardInterrupt:
+            rprint("\n[yellow]Stopped watching for changes.[/yellow]")
@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the all_checks.py.
+"""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from i18n_check.check.all_checks import (
+    CheckRun,
+    _get_pool_context,
+    _print_timings,
+    _run_check_in_worker,
+)
+from i18n_check.extraction import get_jobs, set_jobs
+from i18n_check.similarity import get_similarity_threshold
+
+
+@patch("i18n_check.check.all_checks.run_check", return_value=True)
+def test_run_check_in_worker(mock_run_check) -> None:
+    check_run = _run_check_in_worker("repeat-keys", fix=True)
+
+    mock_run_check.assert_called_once_with(
+        "repeat-keys", all_checks_enabled=True, fix=True
+    )
+    assert check_run.name == "repeat-keys"
+    assert check_run.passed
+    assert check_run.duration >= 0
+
+
+@patch("i18n_check.check.all_checks.run_check", return_value=True)
+def test_run_check_in_worker_similarity_threshold(mock_run_check) -> None:
+    _run_check_in_worker("repeat-values", fix=False, similarity_threshold=0.8)
+
+    assert get_similarity_threshold() == 0.8
+
+
+@patch("i18n_check.check.all_checks.run_check", return_value=True)
+def test_run_check_in_worker_single_job(mock_run_check) -> None:
+    set_jobs(4)
+    _run_check_in_worker("nonexistent-keys", fix=False)
+
+    # Checks don't start worker processes of their own within the pool of checks.
+    assert get_jobs() == 1
+
+
+@patch("i18n_check.check.all_checks.run_check", side_effect=ValueError("failed"))
+def test_run_check_in_worker_failure(mock_run_check) -> None:
+    assert not _run_check_in_worker("repeat-keys", fix=False).passed
+
+
+@pytest.mark.skipif(
+    sys.platform in ("darwin", "win32"), reason="fork isn't used on macOS or Windows"
+)
+def test_get_pool_context_fork() -> None:
+    assert _get_pool_context().get_start_method() == "fork"
+
+
+def test_print_timings(capsys) -> None:
+    _print_timings(
+        check_runs=[
+            CheckRun(name="repeat-keys", passed=True, started_at=1.5, duration=0.25)
+        ],
+        prepare_duration=0.1,
+        pool_started_at=1.0,
+        pickled_bytes=None,
+        pickling_duration=0.0,
+    )
+    output = capsys.readouterr().out
+
+    assert "Shared data preparation: 100 ms" in output
+    assert "Process pool startup: 500 ms" in output
+    assert "inherited via fork" in output
+    assert "repeat-keys: 250 ms" in output
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -69,7 +69,7 @@ class TestAltTexts(unittest.TestCase):
         )
         self.assertEqual(alt_text_issues, {})
 
-    @patch("i18n_check.check.alt_texts.read_json_file")
+    @patch("i18n_check.check.alt_texts.iter_locale_pairs")
     @patch("i18n_check.check.alt_texts.rprint")
     def test_report_no_issues(self, mock_rprint, mock_read_json):
         """
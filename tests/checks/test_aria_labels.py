@@ -67,7 +67,7 @@ class TestAriaLabels(unittest.TestCase):
         )
         self.assertEqual(aria_label_issues, {})
 
-    @patch("i18n_check.check.aria_labels.read_json_file")
+    @patch("i18n_check.check.aria_labels.iter_locale_pairs")
     @patch("i18n_check.check.aria_labels.rprint")
     def test_report_no_issues(self, mock_rprint, mock_read_json):
         """
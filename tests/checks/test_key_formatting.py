@@ -15,6 +15,7 @@ from i18n_check.check.key_naming import (
 from i18n_check.utils import PATH_SEPARATOR, replace_text_in_file
 
 from ..test_utils import (
+    fail_checks_src_json,
     fail_checks_src_json_path,
     fail_checks_test_file_path,
     i18n_map_fail,
@@ -35,7 +36,7 @@ invalid_format_pass = audit_invalid_i18n_key_formats(
     "i18n_map, expected_output",
     [
         (len(i18n_map_fail), 15),
-        (len(map_keys_to_files()), 15),
+        (len(map_keys_to_files(i18n_src_dict=fail_checks_src_json)), 15),
         (
             set(i18n_map_fail["i18n._global.repeat_value_hello_global"]),
             {
@@ -68,7 +69,9 @@ invalid_format_pass = audit_invalid_i18n_key_formats(
             },
         ),
         (
-            map_keys_to_files()["i18n.wrong_identifier_path.content_reference"],
+            map_keys_to_files(i18n_src_dict=fail_checks_src_json)[
+                "i18n.wrong_identifier_path.content_reference"
+            ],
             ["test_file"],
         ),
     ],
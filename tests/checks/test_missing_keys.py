@@ -11,10 +11,12 @@ import pytest
 
 from i18n_check.check.missing_keys import (
     add_missing_keys_interactively,
+    get_key_coverage,
     get_missing_keys_by_locale,
     missing_keys_check_and_fix,
     report_missing_keys,
 )
+from i18n_check.locale_store import set_stream_json
 from i18n_check.utils import read_json_file
 
 from ..test_utils import (
@@ -70,6 +72,37 @@ def test_get_missing_keys_by_locale_fail() -> None:
     assert percentage > 70  # most keys are missing
 
 
+def test_get_missing_keys_by_locale_stream_json() -> None:
+    set_stream_json(True)
+
+    assert (
+        get_missing_keys_by_locale(
+            i18n_src_dict=fail_checks_src_json,
+            i18n_directory=checks_fail_json_dir,
+            locales_to_check=[],
+        )
+        == missing_keys_fail
+    )
+
+
+@pytest.mark.parametrize("stream_json", [False, True])
+def test_get_missing_keys_by_locale_duplicate_keys(tmp_path: Path, stream_json) -> None:
+    """
+    Test that the last value of a duplicate key decides whether it's missing.
+    """
+    set_stream_json(stream_json)
+    (tmp_path / "de.json").write_text(
+        '{"key_0": "", "key_1": "Wert", "key_0": "Wert", "key_1": ""}',
+        encoding="utf-8",
+    )
+
+    assert get_missing_keys_by_locale(
+        i18n_src_dict={"key_0": "value", "key_1": "value"},
+        i18n_directory=tmp_path,
+        locales_to_check=[],
+    ) == {"de": (["key_1"], 50.0)}
+
+
 def test_get_missing_keys_by_locale_pass() -> None:
     """
     Test get_missing_keys_by_locale for the passing test case.
@@ -123,6 +156,39 @@ def test_report_missing_keys_fail(capsys) -> None:
     assert "%" in output_msg
 
 
+def test_missing_keys_check_reports_keys_missing_in_several_locales(
+    tmp_path: Path, capsys
+) -> None:
+    """
+    Test that keys missing in more than one locale are reported with the number of locales.
+    """
+    for locale, locale_dict in {
+        "de": {"key_0": "Wert", "key_1": ""},
+        "fr": {"key_0": "valeur"},
+        "es": {"key_0": "valor", "key_1": "valor", "key_2": "valor"},
+    }.items():
+        (tmp_path / f"{locale}.json").write_text(
+            json.dumps(locale_dict), encoding="utf-8"
+        )
+
+    i18n_src_dict = {"key_0": "value", "key_1": "value", "key_2": "value"}
+    key_coverage = get_key_coverage(
+        i18n_src_dict=i18n_src_dict, i18n_directory=tmp_path, locales_to_check=[]
+    )
+    assert key_coverage.get_keys_by_missing_count() == {2: ["key_1", "key_2"]}
+
+    with pytest.raises(ValueError):
+        missing_keys_check_and_fix(
+            i18n_src_dict=i18n_src_dict,
+            i18n_directory=tmp_path,
+            locales_to_check=[],
+            all_checks_enabled=True,
+        )
+
+    output_msg = capsys.readouterr().out
+    assert "Keys missing in 2 locales:\n  - key_1\n  - key_2" in output_msg
+
+
 def test_empty_string_values_detected() -> None:
     """
     Test that keys with empty string values are detected as missing.
@@ -43,7 +43,7 @@ non_source_keys_pass = get_non_source_keys(
             },
         ),
         (
-            get_non_source_keys(),
+            get_non_source_keys(i18n_src_dict=fail_checks_src_json),
             {
                 "test_i18n_locale.json": {
                     "i18n._global.not_in_i18n_src",
@@ -37,7 +37,9 @@ i18n_used_pass = get_used_i18n_keys(
     i18n_src_dict=pass_checks_src_json, src_directory=checks_pass_dir
 )
 
-all_i18n_used = get_used_i18n_keys(search_dirs=[nonexistent_keys_search_dir])
+all_i18n_used = get_used_i18n_keys(
+    i18n_src_dict=fail_checks_src_json, search_dirs=[nonexistent_keys_search_dir]
+)
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the registry.py.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from i18n_check.check.registry import CHECK_REGISTRY, run_check
+
+
+def test_check_registry_names() -> None:
+    assert list(CHECK_REGISTRY) == [
+        "key-formatting",
+        "key-naming",
+        "nonexistent-keys",
+        "unused-keys",
+        "non-source-keys",
+        "repeat-keys",
+        "repeat-values",
+        "sorted-keys",
+        "nested-files",
+        "missing-keys",
+        "aria-labels",
+        "alt-texts",
+    ]
+
+
+def test_run_check_unknown_name() -> None:
+    with pytest.raises(KeyError):
+        run_check("not-a-check")
+
+
+@patch("i18n_check.check.key_naming.map_keys_to_files")
+@patch("i18n_check.check.unused_keys.get_files_to_check_contents")
+@patch("i18n_check.check.nonexistent_keys.get_used_i18n_keys")
+def test_run_check_only_derives_selected_data(
+    mock_get_used_i18n_keys, mock_get_files_to_check_contents, mock_map_keys_to_files
+) -> None:
+    """
+    Test that running a single check doesn't derive the data of other checks.
+    """
+    with patch("i18n_check.check.repeat_keys.repeat_keys_check") as mock_check:
+        run_check("repeat-keys")
+
+    mock_check.assert_called_once()
+    mock_map_keys_to_files.assert_not_called()
+    mock_get_files_to_check_contents.assert_not_called()
+    mock_get_used_i18n_keys.assert_not_called()
+
+
+@patch("i18n_check.check.nonexistent_keys.get_used_i18n_keys", return_value=set())
+def test_run_check_derives_data_when_selected(mock_get_used_i18n_keys) -> None:
+    with patch(
+        "i18n_check.check.nonexistent_keys.nonexistent_keys_check_and_fix"
+    ) as mock_check:
+        run_check("nonexistent-keys")
+
+    mock_get_used_i18n_keys.assert_called_once()
+    assert mock_check.call_args.kwargs["all_used_i18n_keys"] == set()
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -3,21 +3,30 @@
 Tests for the repeat_values.py.
 """
 
+import json
+
 import pytest
 
 from i18n_check.check.repeat_values import (
+    LocaleValueIssues,
     analyze_and_generate_repeat_value_report,
+    generate_locale_value_report,
+    generate_similar_value_report,
+    get_locale_value_issues,
     get_repeat_value_counts,
-    i18n_src_dict,
+    get_similar_values,
+    get_value_keys,
     repeat_values_check,
 )
+from i18n_check.extraction import set_jobs
+from i18n_check.locale_store import set_stream_json
 
 from ..test_utils import (
     fail_checks_src_json,
     pass_checks_src_json,
 )
 
-json_repeat_value_counts = get_repeat_value_counts(i18n_src_dict)
+json_repeat_value_counts = get_repeat_value_counts(fail_checks_src_json)
 
 
 @pytest.mark.parametrize(
@@ -50,6 +59,110 @@ def test_get_repeat_value_counts(
     assert result == expected_output
 
 
+def test_get_value_keys() -> None:
+    value_keys = get_value_keys(
+        {"b": "Hello!", "a": "hello", "c": "Hello.", "d": {"e": "hello"}, "f": 1}
+    )
+
+    assert value_keys == {"hello!": ["b"], "hello": ["a", "c"], 1: ["f"]}
+    assert get_repeat_value_counts({}, value_keys=value_keys) == {"hello": 2}
+
+
+def test_get_value_keys_unicode_aware() -> None:
+    i18n_src_dict = {
+        "a": "こんにちは。",
+        "b": "こんにちは",
+        "c": "ＨＥＬＬＯ",
+        "d": "hello",
+    }
+
+    assert get_value_keys(i18n_src_dict) == {
+        "こんにちは。": ["a"],
+        "こんにちは": ["b"],
+        "ｈｅｌｌｏ": ["c"],
+        "hello": ["d"],
+    }
+    assert get_value_keys(i18n_src_dict, unicode_aware=True) == {
+        "こんにちは": ["a", "b"],
+        "hello": ["c", "d"],
+    }
+
+
+def test_get_similar_values() -> None:
+    value_keys = get_value_keys(
+        {
+            "a": "Sign in",
+            "b": "Sign-in now",
+            "c": "Sign-in now!",
+            "d": "signin now",
+            "e": "Cancel",
+        }
+    )
+
+    assert get_similar_values(value_keys) == {}
+    assert get_similar_values(value_keys, similarity_threshold=0.5) == {
+        "signin now": ["sign in", "signin now!"]
+    }
+
+
+def test_similar_values_are_reported_separately(capsys) -> None:
+    i18n_src_dict = {
+        "i18n.a": "Sign in",
+        "i18n.b": "Sign-in now",
+        "i18n.c": "Signin now",
+        "i18n.d": "Cancel",
+        "i18n.e": "cancel",
+    }
+    value_keys = get_value_keys(i18n_src_dict)
+    similar_values = get_similar_values(value_keys, similarity_threshold=0.5)
+    assert similar_values == {"signin now": ["sign in"]}
+
+    # Near-duplicates don't change the exact repeat values or their report.
+    repeat_value_counts = get_repeat_value_counts(i18n_src_dict, value_keys=value_keys)
+    assert repeat_value_counts == {"signin now": 2, "cancel": 2}
+
+    repeat_value_counts, repeat_value_report = analyze_and_generate_repeat_value_report(
+        i18n_src_dict, repeat_value_counts, key_file_dict={}, value_keys=value_keys
+    )
+    assert (
+        "Repeat value: 'signin now'\nNumber of instances: 2\nKeys: i18n.b, i18n.c"
+    ) in repeat_value_report
+
+    similar_value_report = generate_similar_value_report(
+        value_keys=value_keys, similar_values=similar_values
+    )
+    assert similar_value_report == (
+        "\n\nNear-duplicate values: 'signin now', 'sign in'"
+        "\n'signin now': i18n.b, i18n.c"
+        "\n'sign in': i18n.a"
+    )
+
+    with pytest.raises(ValueError):
+        repeat_values_check(
+            json_repeat_value_counts=repeat_value_counts,
+            repeat_value_error_report=repeat_value_report,
+            all_checks_enabled=True,
+            similar_values=similar_values,
+            similar_value_error_report=similar_value_report,
+        )
+
+    output = capsys.readouterr().out
+    assert "There are 2 repeat i18n values present" in output
+    assert "There is 1 group of near-duplicate i18n values present" in output
+    assert "'sign in': i18n.a" in output
+
+
+def test_report_with_value_keys_matches_without() -> None:
+    value_keys = get_value_keys(fail_checks_src_json)
+    repeat_value_counts = get_repeat_value_counts(fail_checks_src_json)
+
+    assert analyze_and_generate_repeat_value_report(
+        fail_checks_src_json, dict(repeat_value_counts), value_keys=value_keys
+    ) == analyze_and_generate_repeat_value_report(
+        fail_checks_src_json, dict(repeat_value_counts)
+    )
+
+
 def test_multiple_repeats_with_common_prefix(capsys) -> None:
     fail_result, fail_report = analyze_and_generate_repeat_value_report(
         fail_checks_src_json, get_repeat_value_counts(fail_checks_src_json)
@@ -136,5 +249,105 @@ def test_repeat_values_keys_are_sorted_in_output(capsys) -> None:
     assert "Keys: i18n.z_key, i18n.a_key, i18n.m_key" not in report
 
 
+LOCALE_VALUES_SRC_DICT = {
+    "i18n.save": "Save",
+    "i18n.save_changes": "Save!",
+    "i18n.save_button": "save",
+    "i18n.store": "Store",
+    "i18n.cancel": "Cancel",
+}
+
+
+def write_locale_files(tmp_path) -> None:
+    """
+    Write locale files with inconsistent and repeat translations of LOCALE_VALUES_SRC_DICT.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        The directory to write the locale files to.
+    """
+    locale_dicts = {
+        "de": {
+            "i18n.save": "Speichern",
+            "i18n.save_button": "Sichern",
+            "i18n.store": "Speichern.",
+            "i18n.cancel": "Abbrechen",
+        },
+        "fr": {
+            "i18n.save": "Enregistrer",
+            "i18n.save_button": "enregistrer",
+            "i18n.store": "",
+            "i18n.cancel": "Annuler",
+            "i18n.not_in_src": "Annuler",
+        },
+    }
+    for locale, locale_dict in locale_dicts.items():
+        (tmp_path / f"{locale}.json").write_text(
+            json.dumps(locale_dict), encoding="utf-8"
+        )
+
+
+EXPECTED_LOCALE_VALUE_ISSUES = {
+    "de": LocaleValueIssues(
+        inconsistent_translations={
+            "save": {"speichern": ["i18n.save"], "sichern": ["i18n.save_button"]}
+        },
+        repeat_values={"speichern": ["i18n.save", "i18n.store"]},
+    )
+}
+
+
+@pytest.mark.parametrize("stream_json", [False, True])
+def test_get_locale_value_issues(tmp_path, stream_json) -> None:
+    write_locale_files(tmp_path)
+    set_stream_json(stream_json)
+
+    assert (
+        get_locale_value_issues(
+            value_keys=get_value_keys(i18n_src_dict=LOCALE_VALUES_SRC_DICT),
+            i18n_directory=tmp_path,
+        )
+        == EXPECTED_LOCALE_VALUE_ISSUES
+    )
+
+
+def test_get_locale_value_issues_in_parallel(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("i18n_check.extraction.PARALLEL_MIN_TOTAL_SIZE", 0)
+    write_locale_files(tmp_path)
+    set_jobs(2)
+
+    assert (
+        get_locale_value_issues(
+            value_keys=get_value_keys(i18n_src_dict=LOCALE_VALUES_SRC_DICT),
+            i18n_directory=tmp_path,
+        )
+        == EXPECTED_LOCALE_VALUE_ISSUES
+    )
+
+
+def test_locale_values_check_output(capsys) -> None:
+    report = generate_locale_value_report(
+        locale_value_issues=EXPECTED_LOCALE_VALUE_ISSUES
+    )
+    assert "Inconsistent translations in de: 'save'" in report
+    assert "'sichern': i18n.save_button" in report
+    assert "Repeat value in de: 'speichern'" in report
+    assert "Keys: i18n.save, i18n.store" in report
+
+    with pytest.raises(ValueError):
+        repeat_values_check(
+            json_repeat_value_counts={},
+            repeat_value_error_report="",
+            all_checks_enabled=True,
+            locale_value_issues=EXPECTED_LOCALE_VALUE_ISSUES,
+            locale_value_error_report=report,
+        )
+
+    output = capsys.readouterr().out
+    assert "There is 1 locale with keys of the same source value" in output
+    assert "Repeat value in de" in output
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -8,15 +8,18 @@ from unittest.mock import patch
 import pytest
 
 from i18n_check.check.unused_keys import (
-    files_to_check_contents,
     find_unused_keys,
+    get_files_to_check_contents,
     unused_keys_check,
     unused_keys_check_and_delete,
 )
+from i18n_check.extraction import set_jobs
 from i18n_check.utils import read_json_file
 
 from ..test_utils import fail_checks_src_json_path, pass_checks_src_json_path
 
+files_to_check_contents = get_files_to_check_contents()
+
 UNUSED_FAIL_KEYS = find_unused_keys(
     i18n_src_dict=read_json_file(file_path=fail_checks_src_json_path),
     files_to_check_contents=files_to_check_contents,
@@ -36,6 +39,18 @@ def test_find_unused_keys_behavior() -> None:
     assert UNUSED_PASS_KEYS == []
 
 
+def test_find_unused_keys_in_parallel(monkeypatch) -> None:
+    monkeypatch.setattr("i18n_check.extraction.PARALLEL_MIN_TOTAL_SIZE", 0)
+    set_jobs(2)
+
+    assert set(
+        find_unused_keys(
+            i18n_src_dict=read_json_file(file_path=fail_checks_src_json_path),
+            files_to_check_contents=files_to_check_contents,
+        )
+    ) == set(UNUSED_FAIL_KEYS)
+
+
 def test_unused_keys_check_pass_output(capsys):
     unused_keys_check(UNUSED_PASS_KEYS)
     output = capsys.readouterr().out
@@ -8,6 +8,7 @@ from io import StringIO
 from unittest.mock import patch
 
 from i18n_check.cli.main import main
+from i18n_check.file_writer import set_dry_run
 from i18n_check.utils import read_json_file, replace_text_in_file
 
 from ..test_utils import (
@@ -65,9 +66,9 @@ class TestCliMain(unittest.TestCase):
 
         mock_generate_test_frontends.assert_called_once()
 
-    @patch("i18n_check.check.all_checks.run_all_checks")
+    @patch("i18n_check.cli.main.run_all_checks")
     @patch("sys.exit")
-    def test_main_all_checks(self, mock_all_checks, mock_sys_exit):
+    def test_main_all_checks(self, mock_sys_exit, mock_all_checks):
         """
         Test that `run_all_checks` is called for the --all flag.
         """
@@ -78,7 +79,7 @@ class TestCliMain(unittest.TestCase):
 
     @patch("i18n_check.check.key_formatting.invalid_key_formats_check_and_fix")
     @patch("sys.exit")
-    def test_main_key_formatting(self, mock_invalid_key_formats_check, mock_sys_exit):
+    def test_main_key_formatting(self, mock_sys_exit, mock_invalid_key_formats_check):
         """
         Test that `invalid_key_formats_check_and_fix` is called for the --key-formatting flag.
         """
@@ -87,18 +88,42 @@ class TestCliMain(unittest.TestCase):
 
         mock_invalid_key_formats_check.assert_called_once()
 
-    @patch("i18n_check.check.key_naming.invalid_key_names_check_and_fix")
     @patch("sys.exit")
-    def test_main_key_naming_with_fix(
-        self, mock_invalid_key_names_check_and_fix, mock_sys_exit
-    ):
+    def test_main_key_naming_with_fix_dry_run(self, mock_sys_exit):
+        """
+        Test that --dry-run prints the changes of --key-naming and --fix without writing them.
+        """
+        with open(fail_checks_src_json_path, "r", encoding="utf-8") as f:
+            fail_checks_src_json_content = f.read()
+
+        try:
+            with (
+                patch("sys.argv", ["i18n-check", "--key-naming", "--fix", "--dry-run"]),
+                patch("sys.stdout", new_callable=StringIO) as mock_stdout,
+            ):
+                main()
+
+        finally:
+            set_dry_run(False)
+
+        mock_sys_exit.assert_called_once()
+
+        with open(fail_checks_src_json_path, "r", encoding="utf-8") as f:
+            assert f.read() == fail_checks_src_json_content
+
+        output = mock_stdout.getvalue()
+        assert "Dry run" in output
+        assert '+  "i18n.test_file.content_reference"' in output
+
+    @patch("sys.exit")
+    def test_main_key_naming_with_fix(self, mock_sys_exit):
         """
-        Test that `invalid_key_names_check_and_fix` is called with fix=True for --key-naming and --fix.
+        Test that invalid key names are fixed for --key-naming and --fix.
         """
         with patch("sys.argv", ["i18n-check", "--key-naming", "--fix"]):
             main()
 
-        mock_invalid_key_names_check_and_fix.assert_called_once()
+        mock_sys_exit.assert_called_once()
 
         fail_checks_src_json = read_json_file(file_path=fail_checks_src_json_path)
 
@@ -169,7 +194,7 @@ class TestCliMain(unittest.TestCase):
     @patch("i18n_check.check.nonexistent_keys.nonexistent_keys_check_and_fix")
     @patch("sys.exit")
     def test_main_nonexistent_keys(
-        self, mock_nonexistent_keys_check_and_fix, mock_sys_exit
+        self, mock_sys_exit, mock_nonexistent_keys_check_and_fix
     ):
         """
         Test that `nonexistent_keys_check_and_fix` is called for the --nonexistent-keys flag.
@@ -181,7 +206,7 @@ class TestCliMain(unittest.TestCase):
 
     @patch("i18n_check.check.unused_keys.unused_keys_check")
     @patch("sys.exit")
-    def test_main_unused_keys(self, mock_unused_keys_check, mock_sys_exit):
+    def test_main_unused_keys(self, mock_sys_exit, mock_unused_keys_check):
         """
         Test that `unused_keys_check` is called for the --unused-keys flag.
         """
@@ -192,7 +217,7 @@ class TestCliMain(unittest.TestCase):
 
     @patch("i18n_check.check.non_source_keys.non_source_keys_check")
     @patch("sys.exit")
-    def test_main_non_source_keys(self, mock_non_source_keys_check, mock_sys_exit):
+    def test_main_non_source_keys(self, mock_sys_exit, mock_non_source_keys_check):
         """
         Test that `non_source_keys_check` is called for the --non-source-keys flag.
         """
@@ -203,7 +228,7 @@ class TestCliMain(unittest.TestCase):
 
     @patch("i18n_check.check.repeat_keys.repeat_keys_check")
     @patch("sys.exit")
-    def test_main_repeat_keys(self, mock_repeat_keys_check, mock_sys_exit):
+    def test_main_repeat_keys(self, mock_sys_exit, mock_repeat_keys_check):
         """
         Test that `repeat_keys_check` is called for the --repeat-keys flag.
         """
@@ -214,7 +239,7 @@ class TestCliMain(unittest.TestCase):
 
     @patch("i18n_check.check.repeat_values.repeat_values_check")
     @patch("sys.exit")
-    def test_main_repeat_values(self, mock_repeat_values_check, mock_sys_exit):
+    def test_main_repeat_values(self, mock_sys_exit, mock_repeat_values_check):
         """
         Test that `repeat_values_check` is called for the --repeat-values flag.
         """
@@ -250,6 +275,20 @@ class TestCliMain(unittest.TestCase):
 
         mock_get_version.assert_called_once()
 
+    @patch("i18n_check.cli.main.get_version_message")
+    @patch("i18n_check.check.repeat_keys.repeat_keys_check")
+    def test_main_check_does_not_fetch_version(
+        self, mock_repeat_keys_check, mock_get_version
+    ):
+        """
+        Test that the version message is only derived when the --version flag is passed.
+        """
+        with patch("sys.argv", ["i18n-check", "--repeat-keys"]):
+            main()
+
+        mock_repeat_keys_check.assert_called_once()
+        mock_get_version.assert_not_called()
+
     @patch("i18n_check.check.unused_keys.unused_keys_check_and_delete")
     def test_main_unused_keys_with_delete(self, mock_unused_keys_delete):
         """
@@ -270,6 +309,91 @@ class TestCliMain(unittest.TestCase):
 
         mock_non_source_keys_delete.assert_called_once()
 
+    @patch("i18n_check.cli.main.set_result_cache")
+    @patch("i18n_check.check.repeat_keys.repeat_keys_check")
+    @patch("sys.exit")
+    def test_main_no_cache(
+        self, mock_sys_exit, mock_repeat_keys_check, mock_set_result_cache
+    ):
+        """
+        Test that the result cache is disabled for the --no-cache flag.
+        """
+        with patch("sys.argv", ["i18n-check", "--repeat-keys", "--no-cache"]):
+            main()
+
+        mock_repeat_keys_check.assert_called_once()
+        self.assertFalse(mock_set_result_cache.call_args.args[0].enabled)
+
+    @patch("i18n_check.cli.main.set_jobs")
+    @patch("i18n_check.check.unused_keys.unused_keys_check")
+    @patch("sys.exit")
+    def test_main_jobs(self, mock_sys_exit, mock_unused_keys_check, mock_set_jobs):
+        """
+        Test that the number of extraction processes is set for the --jobs flag.
+        """
+        with patch("sys.argv", ["i18n-check", "--unused-keys", "--jobs", "4"]):
+            main()
+
+        mock_unused_keys_check.assert_called_once()
+        mock_set_jobs.assert_called_once_with(4)
+
+    @patch("i18n_check.cli.main.set_similarity_threshold")
+    @patch("i18n_check.check.repeat_values.repeat_values_check")
+    @patch("sys.exit")
+    def test_main_similarity_threshold(
+        self, mock_sys_exit, mock_repeat_values_check, mock_set_similarity_threshold
+    ):
+        """
+        Test that near-duplicate values are checked for with the --similarity-threshold flag.
+        """
+        with patch(
+            "sys.argv",
+            ["i18n-check", "--repeat-values", "--similarity-threshold", "0.8"],
+        ):
+            main()
+
+        mock_set_similarity_threshold.assert_called_once_with(0.8)
+        mock_repeat_values_check.assert_called_once()
+
+    @patch("sys.exit")
+    def test_main_similarity_threshold_out_of_range(self, mock_sys_exit):
+        """
+        Test that the --similarity-threshold flag needs to be greater than 0 and at most 1.
+        """
+        mock_sys_exit.side_effect = SystemExit
+
+        with patch("sys.argv", ["i18n-check", "--repeat-values", "-sim", "1.5"]):
+            with self.assertRaises(SystemExit):
+                main()
+
+        mock_sys_exit.assert_called_once_with(1)
+
+    @patch("sys.exit")
+    def test_main_staged_without_all_checks(self, mock_sys_exit):
+        """
+        Test that --staged can only be used with the --all-checks flag.
+        """
+        mock_sys_exit.side_effect = SystemExit
+
+        with patch("sys.argv", ["i18n-check", "--repeat-keys", "--staged"]):
+            with self.assertRaises(SystemExit):
+                main()
+
+        mock_sys_exit.assert_called_once_with(1)
+
+    @patch("i18n_check.cli.main.run_all_checks")
+    def test_main_staged_with_changed_since(self, mock_run_all_checks):
+        """
+        Test that --staged and --changed-since can't be passed together.
+        """
+        with patch("sys.argv", ["i18n-check", "-a", "-st", "-cs", "main"]):
+            with patch("sys.stderr"):
+                with self.assertRaises(SystemExit) as context:
+                    main()
+
+        self.assertEqual(context.exception.code, 2)
+        mock_run_all_checks.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main(argv=["first-arg-is-ignored"], exit=False)
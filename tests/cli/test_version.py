@@ -4,10 +4,16 @@ Tests for the CLI version functionality.
 """
 
 import importlib.metadata
+import json
+import tempfile
+import time
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 from i18n_check.cli.version import (
+    LATEST_VERSION_CACHE_TTL,
+    LATEST_VERSION_REQUEST_TIMEOUT,
     UNKNOWN_VERSION_NOT_FETCHED,
     UNKNOWN_VERSION_NOT_PIP,
     get_latest_version,
@@ -17,6 +23,18 @@ from i18n_check.cli.version import (
 
 
 class TestVersionFunctions(unittest.TestCase):
+    def setUp(self):
+        # Isolate the latest version cache from the user cache directory.
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = Path(temp_dir.name)
+
+        cache_dir_patcher = patch(
+            "i18n_check.cli.version.get_user_cache_dir", return_value=self.cache_dir
+        )
+        cache_dir_patcher.start()
+        self.addCleanup(cache_dir_patcher.stop)
+
     @patch("i18n_check.cli.version.importlib.metadata.version")
     def test_get_local_version_installed(self, mock_version):
         mock_version.return_value = "1.0.0"
@@ -39,6 +57,45 @@ class TestVersionFunctions(unittest.TestCase):
     def test_get_latest_version_failure(self, mock_get):
         self.assertEqual(get_latest_version(), UNKNOWN_VERSION_NOT_FETCHED)
 
+    @patch("requests.get")
+    def test_get_latest_version_uses_timeout(self, mock_get):
+        mock_get.return_value.json.return_value = {"name": "v1.0.1"}
+        get_latest_version()
+        self.assertEqual(
+            mock_get.call_args.kwargs["timeout"], LATEST_VERSION_REQUEST_TIMEOUT
+        )
+
+    @patch("requests.get")
+    def test_get_latest_version_cached(self, mock_get):
+        mock_get.return_value.json.return_value = {"name": "v1.0.1"}
+        self.assertEqual(get_latest_version(), "v1.0.1")
+        self.assertEqual(get_latest_version(), "v1.0.1")
+        mock_get.assert_called_once()
+
+        # The cache is bypassed when requested.
+        self.assertEqual(get_latest_version(use_cache=False), "v1.0.1")
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("requests.get")
+    def test_get_latest_version_expired_cache(self, mock_get):
+        (self.cache_dir / "latest_version.json").write_text(
+            json.dumps(
+                {
+                    "name": "v1.0.0",
+                    "fetched_at": time.time() - LATEST_VERSION_CACHE_TTL - 1,
+                }
+            ),
+            encoding="utf-8",
+        )
+        mock_get.return_value.json.return_value = {"name": "v1.0.1"}
+        self.assertEqual(get_latest_version(), "v1.0.1")
+        mock_get.assert_called_once()
+
+    @patch("requests.get", side_effect=Exception("Unable to fetch version"))
+    def test_get_latest_version_failure_not_cached(self, mock_get):
+        get_latest_version()
+        self.assertFalse((self.cache_dir / "latest_version.json").exists())
+
     @patch("i18n_check.cli.version.get_local_version", return_value="X.Y.Z")
     @patch("i18n_check.cli.version.get_latest_version", return_value="i18n-check X.Y.Z")
     def test_get_version_message_up_to_date(
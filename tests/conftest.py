@@ -0,0 +1,28 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Shared fixtures for the tests.
+"""
+
+import pytest
+
+from i18n_check.cache import CACHE_DIRECTORY_NAME, ResultCache, set_result_cache
+from i18n_check.extraction import set_jobs
+from i18n_check.intermediates import clear_intermediates
+from i18n_check.locale_store import set_locale_store, set_stream_json
+from i18n_check.similarity import set_similarity_threshold
+
+
+@pytest.fixture(autouse=True)
+def isolate_intermediates(tmp_path):
+    # Intermediates and parsed locale files are kept per process, so each test starts without them.
+    clear_intermediates()
+    set_locale_store(None)
+    # Results are cached in a directory of each test rather than in the repository.
+    set_result_cache(ResultCache(directory=tmp_path / CACHE_DIRECTORY_NAME))
+    yield
+    clear_intermediates()
+    set_locale_store(None)
+    set_result_cache(None)
+    set_stream_json(False)
+    set_jobs(1)
+    set_similarity_threshold(None)
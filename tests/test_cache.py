@@ -0,0 +1,275 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the cache.py.
+"""
+
+import json
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from i18n_check.cache import (
+    ResultCache,
+    get_cache_version,
+    get_package_source_hash,
+    get_result_cache,
+    hash_text,
+    set_result_cache,
+)
+
+
+@pytest.fixture
+def locale_file(tmp_path):
+    file_path = tmp_path / "en-US.json"
+    file_path.write_text('{"a": "1"}', encoding="utf-8")
+
+    return file_path
+
+
+def test_result_cache_reuses_results(tmp_path, locale_file) -> None:
+    compute = Mock(side_effect=lambda contents: json.loads(contents)["a"])
+    cache = ResultCache(directory=tmp_path / "cache", version="1")
+
+    assert cache.get("test", locale_file, compute=compute) == "1"
+    assert cache.get("test", locale_file, compute=compute) == "1"
+    compute.assert_called_once()
+
+    # A new cache for the next run reads the results that were saved.
+    cache.save()
+    warm_cache = ResultCache(directory=tmp_path / "cache", version="1")
+    assert warm_cache.get("test", locale_file, compute=compute) == "1"
+    compute.assert_called_once()
+
+
+def test_result_cache_recomputes_changed_files(tmp_path, locale_file) -> None:
+    compute = Mock(side_effect=lambda contents: json.loads(contents)["a"])
+    cache = ResultCache(directory=tmp_path / "cache", version="1")
+    cache.get("test", locale_file, compute=compute)
+
+    locale_file.write_text('{"a": "changed"}', encoding="utf-8")
+
+    assert cache.get("test", locale_file, compute=compute) == "changed"
+    assert compute.call_count == 2
+
+
+def test_result_cache_compares_hash_when_only_mtime_changed(
+    tmp_path, locale_file
+) -> None:
+    compute = Mock(return_value="result")
+    cache = ResultCache(directory=tmp_path / "cache", version="1")
+    cache.get("test", locale_file, compute=compute)
+
+    file_stat = os.stat(locale_file)
+    os.utime(locale_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10**9))
+
+    assert cache.get("test", locale_file, compute=compute) == "result"
+    compute.assert_called_once()
+
+
+def test_result_cache_reads_bytes(tmp_path, locale_file) -> None:
+    compute = Mock(return_value="result")
+    cache = ResultCache(directory=tmp_path / "cache", version="1")
+    cache.get("test", locale_file, compute=compute)
+
+    file_stat = os.stat(locale_file)
+    os.utime(locale_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10**9))
+
+    # Encoded contents have the same hash as the text, so the result is reused.
+    assert (
+        cache.get("test", locale_file, compute=compute, read=lambda f: b'{"a": "1"}')
+        == "result"
+    )
+    compute.assert_called_once()
+    assert hash_text("ü") == hash_text("ü".encode("utf-8"))
+
+
+def test_result_cache_get_many(tmp_path, locale_file) -> None:
+    other_file = tmp_path / "de.json"
+    other_file.write_text('{"a": "2"}', encoding="utf-8")
+
+    def compute_missing(missing):
+        return {
+            f: (hash_text(open(f, encoding="utf-8").read()), f"result {f}")
+            for f, _ in missing
+        }
+
+    compute = Mock(side_effect=compute_missing)
+    cache = ResultCache(directory=tmp_path / "cache", version="1")
+    file_paths = [str(other_file), str(locale_file)]
+
+    assert cache.get_many("test", file_paths, compute_missing=compute) == {
+        f: f"result {f}" for f in file_paths
+    }
+    compute.assert_called_once_with([(f, None) for f in file_paths])
+
+    # Results are shared with get, and only files with changed stats are passed with their cached hashes.
+    assert cache.get("test", locale_file, compute=Mock()) == f"result {locale_file}"
+
+    file_stat = os.stat(locale_file)
+    os.utime(locale_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10**9))
+    compute.side_effect = lambda missing: {f: (h, None) for f, h in missing}
+
+    assert cache.get_many("test", file_paths, compute_missing=compute) == {
+        f: f"result {f}" for f in file_paths
+    }
+    compute.assert_called_with([(str(locale_file), hash_text('{"a": "1"}'))])
+
+
+def test_result_cache_shared_by_threads(tmp_path) -> None:
+    file_paths = []
+    for i in range(50):
+        file_path = tmp_path / f"{i}.json"
+        file_path.write_text(f'{{"a": "{i}"}}', encoding="utf-8")
+        file_paths.append(str(file_path))
+
+    def compute_missing(missing):
+        return {
+            f: (hash_text(open(f, encoding="utf-8").read()), f"result {f}")
+            for f, _ in missing
+        }
+
+    cache = ResultCache(directory=tmp_path / "cache", version="1")
+
+    def get_namespace(namespace):
+        return cache.get_many(namespace, file_paths, compute_missing=compute_missing)
+
+    # Namespaces are loaded, filled and saved by threads at once without losing results.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(get_namespace, [f"test-{i % 4}" for i in range(16)])
+        )
+
+    assert all(r == {f: f"result {f}" for f in file_paths} for r in results)
+
+    cache.save()
+    assert sorted(p.name for p in (tmp_path / "cache").glob("*.json")) == [
+        f"test-{i}.json" for i in range(4)
+    ]
+
+
+def test_result_cache_pickle(tmp_path, locale_file) -> None:
+    cache = ResultCache(directory=tmp_path / "cache", version="1")
+    cache.get("test", locale_file, compute=lambda contents: "1")
+
+    # Caches are passed to worker processes with a lock of their own.
+    unpickled_cache = pickle.loads(pickle.dumps(cache))
+    assert unpickled_cache.get("test", locale_file, compute=Mock()) == "1"
+    assert unpickled_cache._lock is not cache._lock
+
+
+def test_result_cache_invalidated_by_fingerprint(tmp_path, locale_file) -> None:
+    compute = Mock(return_value="result")
+    cache = ResultCache(directory=tmp_path / "cache", version="1")
+    cache.get("test", locale_file, compute=compute, fingerprint="keys")
+    cache.get("test", locale_file, compute=compute, fingerprint="other keys")
+
+    assert compute.call_count == 2
+
+
+def test_result_cache_invalidated_by_version(tmp_path, locale_file) -> None:
+    compute = Mock(return_value="result")
+    cache = ResultCache(directory=tmp_path / "cache", version="1")
+    cache.get("test", locale_file, compute=compute)
+    cache.save()
+
+    new_version_cache = ResultCache(directory=tmp_path / "cache", version="2")
+    new_version_cache.get("test", locale_file, compute=compute)
+
+    assert compute.call_count == 2
+
+
+def test_result_cache_disabled(tmp_path, locale_file) -> None:
+    compute = Mock(return_value="result")
+    cache = ResultCache(directory=tmp_path / "cache", version="1", enabled=False)
+    cache.get("test", locale_file, compute=compute)
+    cache.get("test", locale_file, compute=compute)
+    cache.save()
+
+    assert compute.call_count == 2
+    assert not (tmp_path / "cache").exists()
+
+
+def test_result_cache_save(tmp_path, locale_file) -> None:
+    removed_file = tmp_path / "removed.json"
+    removed_file.write_text("{}", encoding="utf-8")
+
+    cache = ResultCache(directory=tmp_path / "cache", version="1")
+    cache.get("test", locale_file, compute=len)
+    cache.get("test", removed_file, compute=len)
+    removed_file.unlink()
+    cache.save()
+
+    saved = json.loads((tmp_path / "cache" / "test.json").read_text(encoding="utf-8"))
+
+    assert list(saved["entries"]) == [str(locale_file)]
+    assert (tmp_path / "cache" / ".gitignore").is_file()
+
+
+def test_result_cache_save_merges_parallel_processes(tmp_path, locale_file) -> None:
+    other_file = tmp_path / "de.json"
+    other_file.write_text('{"a": "2"}', encoding="utf-8")
+
+    # Note: Caches that are loaded before either saves, as in forked workers of --all.
+    cache = ResultCache(directory=tmp_path / "cache", version="1")
+    other_cache = ResultCache(directory=tmp_path / "cache", version="1")
+    cache.get("test", locale_file, compute=len)
+    other_cache.get("test", other_file, compute=len)
+    cache.save()
+    other_cache.save()
+
+    saved = json.loads((tmp_path / "cache" / "test.json").read_text(encoding="utf-8"))
+
+    assert sorted(saved["entries"]) == sorted([str(locale_file), str(other_file)])
+
+
+def test_result_cache_save_discards_other_fingerprints(tmp_path, locale_file) -> None:
+    other_file = tmp_path / "de.json"
+    other_file.write_text('{"a": "2"}', encoding="utf-8")
+
+    cache = ResultCache(directory=tmp_path / "cache", version="1")
+    cache.get("test", other_file, compute=len, fingerprint="keys")
+    cache.save()
+
+    new_keys_cache = ResultCache(directory=tmp_path / "cache", version="1")
+    new_keys_cache.get("test", locale_file, compute=len, fingerprint="other keys")
+    new_keys_cache.save()
+
+    saved = json.loads((tmp_path / "cache" / "test.json").read_text(encoding="utf-8"))
+
+    assert saved["fingerprint"] == "other keys"
+    assert list(saved["entries"]) == [str(locale_file)]
+
+
+def test_get_package_source_hash() -> None:
+    source_hash = get_package_source_hash()
+
+    assert len(source_hash) == 64
+    assert get_package_source_hash() == source_hash
+
+
+def test_get_cache_version(tmp_path) -> None:
+    config_file = tmp_path / ".i18n-check.yaml"
+    config_file.write_text("src-dir: src", encoding="utf-8")
+    version = get_cache_version(config_file_path=config_file)
+
+    assert get_cache_version(config_file_path=config_file) == version
+
+    config_file.write_text("src-dir: frontend", encoding="utf-8")
+
+    assert get_cache_version(config_file_path=config_file) != version
+
+
+def test_get_and_set_result_cache() -> None:
+    cache = ResultCache(enabled=False)
+    set_result_cache(cache)
+    assert get_result_cache() is cache
+
+    set_result_cache(None)
+    assert get_result_cache() is not cache
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the changed_files.py.
+"""
+
+import shutil
+import subprocess
+
+import pytest
+
+from i18n_check.changed_files import get_affected_check_names, get_changed_files
+from i18n_check.check.registry import CHECK_REGISTRY
+from i18n_check.utils import (
+    config_i18n_directory,
+    config_i18n_src_file,
+    config_src_directory,
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not found")
+
+
+def _git(repo, *git_args) -> None:
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=i18n-check",
+            "-c",
+            "user.email=i18n-check@example.com",
+            *git_args,
+        ],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    _git(tmp_path, "init")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "unchanged.ts").write_text("unchanged", encoding="utf-8")
+    (tmp_path / "src" / "changed.ts").write_text("changed", encoding="utf-8")
+    (tmp_path / "src" / "renamed.ts").write_text("renamed", encoding="utf-8")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-m", "Initial commit")
+
+    return tmp_path.resolve()
+
+
+def test_get_changed_files_since_ref(git_repo) -> None:
+    (git_repo / "src" / "changed.ts").write_text("new contents", encoding="utf-8")
+    (git_repo / "src" / "untracked.ts").write_text("untracked", encoding="utf-8")
+    _git(git_repo, "mv", "src/renamed.ts", "src/moved.ts")
+
+    changed_files = get_changed_files(ref="HEAD", cwd=git_repo / "src")
+
+    assert sorted(f.name for f in changed_files) == [
+        "changed.ts",
+        "moved.ts",
+        "renamed.ts",
+        "untracked.ts",
+    ]
+    assert all(f.is_absolute() for f in changed_files)
+
+
+def test_get_changed_files_staged(git_repo) -> None:
+    (git_repo / "src" / "changed.ts").write_text("new contents", encoding="utf-8")
+    (git_repo / "src" / "untracked.ts").write_text("untracked", encoding="utf-8")
+
+    assert get_changed_files(staged=True, cwd=git_repo) == []
+
+    _git(git_repo, "add", "src/changed.ts")
+
+    assert get_changed_files(staged=True, cwd=git_repo) == [
+        git_repo / "src" / "changed.ts"
+    ]
+
+
+def test_get_changed_files_errors(tmp_path_factory, git_repo) -> None:
+    with pytest.raises(ValueError):
+        get_changed_files(cwd=git_repo)
+
+    with pytest.raises(ValueError):
+        get_changed_files(ref="not-a-ref", cwd=git_repo)
+
+    not_a_repo = tmp_path_factory.mktemp("not_a_repo")
+    with pytest.raises(ValueError):
+        get_changed_files(ref="HEAD", cwd=not_a_repo)
+
+
+def test_get_affected_check_names() -> None:
+    check_names = list(CHECK_REGISTRY)
+    source_check_names = [
+        name for name, check in CHECK_REGISTRY.items() if check.uses_source_corpus
+    ]
+    locale_check_names = [
+        name for name, check in CHECK_REGISTRY.items() if check.uses_locale_files
+    ]
+
+    assert (
+        get_affected_check_names(
+            changed_files=[config_i18n_src_file], check_names=check_names
+        )
+        == check_names
+    )
+    assert (
+        get_affected_check_names(
+            changed_files=[config_src_directory / "new_file.ts"],
+            check_names=check_names,
+        )
+        == source_check_names
+    )
+    assert (
+        get_affected_check_names(
+            changed_files=[config_i18n_directory / "new-locale.json"],
+            check_names=check_names,
+        )
+        == locale_check_names
+    )
+    assert (
+        get_affected_check_names(
+            changed_files=[config_src_directory / "new_file.py"],
+            check_names=check_names,
+        )
+        == []
+    )
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,177 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the corpus.py.
+"""
+
+import mmap
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from i18n_check.corpus import (
+    SourceCorpus,
+    get_source_corpus,
+    open_file_bytes,
+    set_source_corpus,
+)
+from i18n_check.utils import collect_files_to_check
+
+
+@pytest.fixture
+def src_dir(tmp_path):
+    (tmp_path / "skip_dir").mkdir()
+    (tmp_path / "first.ts").write_text("first", encoding="utf-8")
+    (tmp_path / "second.ts").write_text("second", encoding="utf-8")
+    (tmp_path / "ignored.py").write_text("ignored", encoding="utf-8")
+    (tmp_path / "skip_dir" / "skipped.ts").write_text("skipped", encoding="utf-8")
+
+    return tmp_path
+
+
+def test_source_corpus_view(src_dir) -> None:
+    corpus = SourceCorpus(
+        file_types_to_check=[".ts"], directories_to_skip=[], files_to_skip=[]
+    )
+    view = corpus.view(directory=src_dir)
+
+    assert {Path(k).name: v for k, v in view.items()} == {
+        "first.ts": "first",
+        "second.ts": "second",
+        "skipped.ts": "skipped",
+    }
+
+
+def test_source_corpus_view_with_skips(src_dir) -> None:
+    corpus = SourceCorpus(
+        file_types_to_check=[".ts"], directories_to_skip=[], files_to_skip=[]
+    )
+    view = corpus.view(
+        directory=src_dir,
+        directories_to_skip=[src_dir / "skip_dir"],
+        files_to_skip=[src_dir / "second.ts"],
+    )
+
+    assert list(view.values()) == ["first"]
+
+
+def test_source_corpus_view_with_glob_skips(src_dir) -> None:
+    corpus = SourceCorpus(
+        file_types_to_check=[".ts"], directories_to_skip=[], files_to_skip=[]
+    )
+    view = corpus.view(
+        directory=src_dir,
+        directories_to_skip=[src_dir / "skip_*"],
+        files_to_skip=[src_dir / "**" / "sec*.ts"],
+    )
+
+    assert list(view.values()) == ["first"]
+
+
+def test_source_corpus_walks_and_reads_once(src_dir) -> None:
+    corpus = SourceCorpus(
+        file_types_to_check=[".ts"], directories_to_skip=[], files_to_skip=[]
+    )
+
+    with patch(
+        "i18n_check.corpus.collect_files_to_check", wraps=collect_files_to_check
+    ) as mock_collect:
+        corpus.view(directory=src_dir)
+        corpus.view(directory=src_dir, directories_to_skip=[src_dir / "skip_dir"])
+
+    mock_collect.assert_called_once()
+
+    with patch("builtins.open", side_effect=AssertionError("File read again.")):
+        corpus.view(directory=src_dir)
+
+
+def test_source_corpus_rereads_changed_files(src_dir) -> None:
+    corpus = SourceCorpus(
+        file_types_to_check=[".ts"], directories_to_skip=[], files_to_skip=[]
+    )
+    first_file = str((src_dir / "first.ts").resolve())
+
+    assert corpus.read(first_file) == "first"
+
+    (src_dir / "first.ts").write_text("first changed", encoding="utf-8")
+
+    assert corpus.read(first_file) == "first changed"
+
+
+def test_source_corpus_shared_by_threads(src_dir) -> None:
+    corpus = SourceCorpus(
+        file_types_to_check=[".ts"], directories_to_skip=[], files_to_skip=[]
+    )
+
+    with patch(
+        "i18n_check.corpus.collect_files_to_check", wraps=collect_files_to_check
+    ) as mock_collect:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            views = list(executor.map(lambda _: corpus.view(src_dir), range(16)))
+
+    # The directory is walked once however many threads view it at once.
+    mock_collect.assert_called_once()
+    assert all(v == views[0] for v in views)
+    assert sorted(views[0].values()) == ["first", "second", "skipped"]
+
+
+def test_source_corpus_pickle(src_dir) -> None:
+    corpus = SourceCorpus(
+        file_types_to_check=[".ts"], directories_to_skip=[], files_to_skip=[]
+    )
+    view = corpus.view(src_dir)
+
+    # Corpora are passed to worker processes with a lock of their own.
+    unpickled_corpus = pickle.loads(pickle.dumps(corpus))
+    assert unpickled_corpus.view(src_dir) == view
+    assert unpickled_corpus._lock is not corpus._lock
+
+
+def test_source_corpus_clear_files(src_dir) -> None:
+    corpus = SourceCorpus(
+        file_types_to_check=[".ts"], directories_to_skip=[], files_to_skip=[]
+    )
+    corpus.view(directory=src_dir)
+
+    (src_dir / "third.ts").write_text("third", encoding="utf-8")
+    assert len(corpus.view(directory=src_dir)) == 3
+
+    corpus.clear_files()
+    assert len(corpus.view(directory=src_dir)) == 4
+
+
+@pytest.mark.parametrize(
+    "contents, mmap_min_file_size, is_mapped",
+    [
+        (b"", 1, False),
+        (b"t('i18n.a')", 1 << 20, False),
+        (b"t('i18n.a')", 4, True),
+    ],
+)
+def test_open_file_bytes(tmp_path, contents, mmap_min_file_size, is_mapped) -> None:
+    file_path = tmp_path / "file.ts"
+    file_path.write_bytes(contents)
+
+    with open_file_bytes(
+        file_path=file_path, mmap_min_file_size=mmap_min_file_size
+    ) as file_bytes:
+        assert bytes(file_bytes) == contents
+        assert isinstance(file_bytes, mmap.mmap) == is_mapped
+
+    if is_mapped:
+        assert file_bytes.closed
+
+
+def test_get_and_set_source_corpus() -> None:
+    corpus = SourceCorpus()
+    set_source_corpus(corpus)
+    assert get_source_corpus() is corpus
+
+    set_source_corpus(None)
+    assert get_source_corpus() is not corpus
+
+
+if __name__ == "__main__":
+    pytest.main()
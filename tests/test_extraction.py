@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the extraction.py.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from unittest.mock import patch
+
+import pytest
+
+from i18n_check.cache import ResultCache, set_result_cache
+from i18n_check.extraction import (
+    FileExtractor,
+    get_file_results,
+    get_jobs,
+    map_shards,
+    set_jobs,
+    shard_items,
+)
+from i18n_check.key_matcher import (
+    KeyMatcher,
+    SourceKeyExtractor,
+    get_i18n_key_pattern,
+)
+
+source_key_extractor = SourceKeyExtractor(
+    key_matcher=KeyMatcher(keys=["i18n.file_0"]),
+    key_pattern=re.compile(get_i18n_key_pattern(key_prefixes=["i18n."])),
+)
+
+
+@pytest.fixture
+def src_files(tmp_path):
+    file_paths = []
+    for i in range(12):
+        file_path = tmp_path / f"file_{i}.ts"
+        file_path.write_text(
+            f"const a = t('i18n.file_{i}');\n" + "// padding\n" * i, encoding="utf-8"
+        )
+        file_paths.append(str(file_path))
+
+    return file_paths
+
+
+def sum_shard(shard: list[int], offset: int = 0) -> int:
+    return sum(shard) + offset
+
+
+def test_set_jobs() -> None:
+    set_jobs(4)
+    assert get_jobs() == 4
+
+    set_jobs(0)
+    assert get_jobs() == (os.cpu_count() or 1)
+
+
+@pytest.mark.parametrize("shard_count", [1, 2, 3, 20])
+def test_shard_items(shard_count) -> None:
+    items = list("abcdefgh")
+    sizes = [8, 1, 7, 2, 6, 3, 5, 4]
+    shards = shard_items(items=items, sizes=sizes, shard_count=shard_count)
+
+    assert len(shards) == min(shard_count, len(items))
+    assert sorted(i for shard in shards for i in shard) == items
+    # Items keep their order within shards, and shards are balanced and largest first.
+    assert all(shard == sorted(shard) for shard in shards)
+    shard_sizes = [sum(sizes[items.index(i)] for i in shard) for shard in shards]
+    assert shard_sizes == sorted(shard_sizes, reverse=True)
+    assert shard_sizes[0] - shard_sizes[-1] <= max(sizes)
+
+
+def test_map_shards_in_process() -> None:
+    assert map_shards(
+        function=partial(sum_shard, offset=1), items=[1, 2, 3], sizes=[1, 1, 1], jobs=4
+    ) == [7]
+
+
+def test_map_shards_in_worker_processes() -> None:
+    results = map_shards(
+        function=partial(sum_shard, offset=1),
+        items=list(range(10)),
+        sizes=[1] * 10,
+        jobs=2,
+        parallel_min_total_size=0,
+    )
+
+    assert len(results) == 8
+    assert sum(results) == sum(range(10)) + 8
+
+
+def test_file_extractor(src_files) -> None:
+    file_extractor = FileExtractor(extract=source_key_extractor)
+    results = file_extractor([(src_files[0], None), (src_files[1], None)])
+
+    assert results[src_files[0]][1] == {
+        "src-keys": ["i18n.file_0"],
+        "used-keys": ["i18n.file_0"],
+    }
+
+    # Results aren't extracted again for contents with the same hash.
+    assert file_extractor([(src_files[0], results[src_files[0]][0])]) == {
+        src_files[0]: (results[src_files[0]][0], None)
+    }
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_get_file_results(tmp_path, src_files, jobs, monkeypatch) -> None:
+    monkeypatch.setattr("i18n_check.extraction.PARALLEL_MIN_TOTAL_SIZE", 0)
+    set_result_cache(ResultCache(directory=tmp_path / "cache", version="1"))
+
+    try:
+        with patch(
+            "i18n_check.extraction.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as mock_executor:
+            results = get_file_results(
+                namespace="source-keys",
+                file_paths=src_files,
+                extract=source_key_extractor,
+                jobs=jobs,
+            )
+
+    finally:
+        set_result_cache(None)
+
+    assert mock_executor.called == (jobs > 1)
+    assert list(results) == src_files
+    assert results == {
+        f: {
+            "src-keys": ["i18n.file_0"] if f == src_files[0] else [],
+            "used-keys": [f"i18n.{os.path.basename(f).removesuffix('.ts')}"],
+        }
+        for f in src_files
+    }
@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the file_writer.py.
+"""
+
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+
+from i18n_check.file_writer import (
+    get_json_text,
+    set_dry_run,
+    write_file,
+    write_files,
+    write_json_file,
+)
+
+
+@pytest.fixture
+def dry_run():
+    set_dry_run(True)
+    yield
+    set_dry_run(False)
+
+
+def test_write_file(tmp_path) -> None:
+    file_path = tmp_path / "en-US.json"
+    file_path.write_text("old", encoding="utf-8")
+    os.chmod(file_path, 0o640)
+
+    assert write_file(file_path, content="new")
+    assert file_path.read_text(encoding="utf-8") == "new"
+    assert stat.S_IMODE(file_path.stat().st_mode) == 0o640
+
+    # Only the file itself is left after the temporary file is renamed.
+    assert os.listdir(tmp_path) == ["en-US.json"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Directories can't be opened on Windows.")
+def test_write_file_fsync(tmp_path) -> None:
+    file_path = tmp_path / "en-US.json"
+
+    with patch("i18n_check.file_writer.os.fsync", wraps=os.fsync) as mock_fsync:
+        assert write_file(file_path, content="new")
+
+    # The temporary file is flushed before the rename and the directory after it.
+    assert mock_fsync.call_count == 2
+    assert file_path.read_text(encoding="utf-8") == "new"
+
+
+def test_write_file_unchanged(tmp_path) -> None:
+    file_path = tmp_path / "en-US.json"
+    file_path.write_text("unchanged", encoding="utf-8")
+    os.utime(file_path, ns=(0, 0))
+
+    assert not write_file(file_path, content="unchanged")
+    assert file_path.stat().st_mtime_ns == 0
+
+
+def test_write_file_old_content(tmp_path) -> None:
+    file_path = tmp_path / "en-US.json"
+    file_path.write_text("on disk", encoding="utf-8")
+
+    # Contents that the caller has read are compared rather than reading the file again.
+    assert not write_file(file_path, content="old", old_content="old")
+    assert file_path.read_text(encoding="utf-8") == "on disk"
+
+    assert write_file(file_path, content="new", old_content="old")
+    assert file_path.read_text(encoding="utf-8") == "new"
+
+
+def test_write_file_dry_run(tmp_path, capsys, dry_run) -> None:
+    file_path = tmp_path / "en-US.json"
+    file_path.write_text("first\nsecond\n", encoding="utf-8")
+
+    assert write_file(file_path, content="first\nchanged\n")
+    assert file_path.read_text(encoding="utf-8") == "first\nsecond\n"
+
+    output = capsys.readouterr().out
+    assert "-second\n+changed\n" in output
+    assert f"+++ b/{file_path}" in output
+
+
+def test_write_json_file(tmp_path) -> None:
+    file_path = tmp_path / "de.json"
+    data = {"i18n.key": "Schlüssel"}
+
+    assert write_json_file(file_path, data=data)
+    assert file_path.read_text(encoding="utf-8") == (
+        '{\n  "i18n.key": "Schlüssel"\n}\n'
+    )
+    assert get_json_text(data=data) == file_path.read_text(encoding="utf-8")
+    assert not write_json_file(file_path, data=data)
+
+
+def test_write_files(tmp_path) -> None:
+    file_contents = {}
+    for i in range(10):
+        file_path = tmp_path / f"{i}.json"
+        file_path.write_text("old", encoding="utf-8")
+        file_contents[str(file_path)] = "new" if i % 2 else "old"
+
+    assert write_files(file_contents=file_contents, max_workers=4) == [
+        str(tmp_path / f"{i}.json") for i in range(1, 10, 2)
+    ]
+    assert all(
+        (tmp_path / f"{i}.json").read_text(encoding="utf-8")
+        == ("new" if i % 2 else "old")
+        for i in range(10)
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_write_files_old_contents(tmp_path, max_workers) -> None:
+    file_contents = {}
+    for i in range(4):
+        file_path = tmp_path / f"{i}.json"
+        file_path.write_text("old", encoding="utf-8")
+        file_contents[str(file_path)] = "new"
+
+    # Files are compared with the contents that are passed for them and only read otherwise.
+    assert write_files(
+        file_contents=file_contents,
+        max_workers=max_workers,
+        old_contents={str(tmp_path / "0.json"): "new"},
+    ) == [str(tmp_path / f"{i}.json") for i in range(1, 4)]
+    assert (tmp_path / "0.json").read_text(encoding="utf-8") == "old"
+
+
+if __name__ == "__main__":
+    pytest.main()
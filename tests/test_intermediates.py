@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the intermediates.py.
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from i18n_check.intermediates import (
+    INTERMEDIATES,
+    Intermediate,
+    compute_intermediates,
+    get_intermediate,
+    get_intermediates,
+    get_required_intermediates,
+    set_intermediates,
+)
+
+
+def test_get_required_intermediates() -> None:
+    assert get_required_intermediates(["key-files", "used-keys"]) == [
+        "i18n-src-dict",
+        "source-files",
+        "source-keys",
+        "key-files",
+        "used-keys",
+    ]
+
+
+def test_get_intermediate_unknown_name() -> None:
+    with pytest.raises(KeyError):
+        get_intermediate("not-an-intermediate")
+
+
+def test_get_intermediate_computes_once() -> None:
+    compute = Mock(return_value={"i18n.key": "value"})
+    with patch.dict(
+        INTERMEDIATES, {"i18n-src-dict": Intermediate("i18n-src-dict", compute)}
+    ):
+        assert get_intermediate("i18n-src-dict") == {"i18n.key": "value"}
+        assert get_intermediate("i18n-src-dict") == {"i18n.key": "value"}
+
+    compute.assert_called_once()
+
+
+def test_compute_intermediates_in_dependency_order() -> None:
+    computed: list[str] = []
+    both_started = threading.Barrier(2, timeout=5)
+
+    def compute_independent(name: str):
+        def compute() -> str:
+            # Both independent intermediates need to run at the same time to pass the barrier.
+            both_started.wait()
+            computed.append(name)
+            return name
+
+        return compute
+
+    def compute_dependent() -> str:
+        computed.append("dependent")
+        return get_intermediate("first") + get_intermediate("second")
+
+    test_intermediates = {
+        "first": Intermediate("first", compute_independent("first")),
+        "second": Intermediate("second", compute_independent("second")),
+        "dependent": Intermediate(
+            "dependent", compute_dependent, dependencies=("first", "second")
+        ),
+    }
+    with patch.dict(INTERMEDIATES, test_intermediates):
+        compute_intermediates(names=["dependent"])
+
+    assert computed[-1] == "dependent"
+    assert get_intermediates()["dependent"] == "firstsecond"
+
+
+def test_set_intermediates() -> None:
+    set_intermediates({"used-keys": {"i18n.key"}})
+
+    assert get_intermediate("used-keys") == {"i18n.key"}
+    assert get_intermediates() == {"used-keys": {"i18n.key"}}
+
+
+if __name__ == "__main__":
+    pytest.main()
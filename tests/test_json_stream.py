@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the json_stream.py.
+"""
+
+import json
+
+import pytest
+
+from i18n_check.json_stream import iter_json_pairs
+from i18n_check.utils import config_i18n_src_file
+
+
+def get_top_level_pairs(contents: str) -> list:
+    object_pairs = []
+    data = json.loads(
+        contents,
+        object_pairs_hook=lambda pairs: object_pairs.append(pairs) or dict(pairs),
+    )
+
+    return object_pairs[-1] if isinstance(data, dict) else []
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        "{}",
+        " { }\n",
+        '{"a": 1}',
+        '{"a": 1, "a": 2, "b": {"c": [1, 2, {"d": "\\u00e9\\"}"}]}}',
+        '{"n": null, "t": true, "f": false, "x": 1.5e10, "y": -0.25E-3}',
+        '{\n  "key": "Übersetzung",\n  "empty": ""\n}\n',
+        "[1, 2]",
+        '"text"',
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+def test_iter_json_pairs(tmp_path, contents, chunk_size) -> None:
+    file_path = tmp_path / "de.json"
+    file_path.write_text(contents, encoding="utf-8")
+
+    assert list(iter_json_pairs(file_path, chunk_size=chunk_size)) == (
+        get_top_level_pairs(contents)
+    )
+
+
+@pytest.mark.parametrize(
+    "contents",
+    ["", '{"a": 1,}', '{"a" 1}', '{"a": 1} x', '{"a": 12', '{"a": tru}', '{"a": 1x}'],
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_iter_json_pairs_invalid(tmp_path, contents, chunk_size) -> None:
+    file_path = tmp_path / "de.json"
+    file_path.write_text(contents, encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_pairs(file_path, chunk_size=chunk_size))
+
+
+def test_iter_json_pairs_src_file() -> None:
+    with open(config_i18n_src_file, encoding="utf-8") as f:
+        contents = f.read()
+
+    assert list(iter_json_pairs(config_i18n_src_file, chunk_size=16)) == (
+        get_top_level_pairs(contents)
+    )
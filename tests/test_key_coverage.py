@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the key_coverage.py.
+"""
+
+import random
+
+import pytest
+
+from i18n_check.key_coverage import KeyCoverage
+
+
+@pytest.fixture
+def key_coverage() -> KeyCoverage:
+    key_coverage = KeyCoverage(keys=["key_b", "key_a", "key_c", "key_d"])
+    key_coverage.add_locale(locale="de", translated_keys={"key_a", "key_b"})
+    key_coverage.add_locale(locale="fr", translated_keys={"key_a"})
+    key_coverage.add_locale(
+        locale="es",
+        translated_keys={"key_a", "key_b", "key_c", "key_d", "not_in_src"},
+    )
+
+    return key_coverage
+
+
+def test_get_missing_keys_by_locale(key_coverage) -> None:
+    assert key_coverage.get_missing_keys_by_locale() == {
+        "de": (["key_c", "key_d"], 50.0),
+        "fr": (["key_b", "key_c", "key_d"], 75.0),
+    }
+
+
+def test_get_keys_by_missing_count(key_coverage) -> None:
+    assert key_coverage.get_keys_by_missing_count() == {
+        2: ["key_c", "key_d"],
+        1: ["key_b"],
+    }
+    assert key_coverage.get_keys_by_missing_count(min_count=2) == {
+        2: ["key_c", "key_d"]
+    }
+    assert key_coverage.get_keys_by_missing_count(min_count=0)[0] == ["key_a"]
+
+
+def test_key_coverage_matches_per_key_counts() -> None:
+    rng = random.Random(0)
+    keys = [f"key_{i}" for i in range(500)]
+    locale_keys = {
+        f"locale_{i}": {k for k in keys if rng.random() < rng.random()}
+        for i in range(37)
+    }
+
+    key_coverage = KeyCoverage(keys=keys)
+    for locale, translated_keys in locale_keys.items():
+        key_coverage.add_locale(locale=locale, translated_keys=translated_keys)
+
+    assert key_coverage.get_missing_keys_by_locale() == {
+        locale: (
+            sorted(set(keys) - translated_keys),
+            len(set(keys) - translated_keys) / len(keys) * 100,
+        )
+        for locale, translated_keys in locale_keys.items()
+        if set(keys) - translated_keys
+    }
+    missing_locale_counts = {
+        k: count
+        for k in keys
+        if (count := sum(k not in t for t in locale_keys.values()))
+    }
+    assert key_coverage.get_keys_by_missing_count() == {
+        count: sorted(k for k, c in missing_locale_counts.items() if c == count)
+        for count in sorted(set(missing_locale_counts.values()), reverse=True)
+    }
+
+
+def test_key_coverage_without_keys() -> None:
+    key_coverage = KeyCoverage(keys=[])
+    key_coverage.add_locale(locale="de", translated_keys={"not_in_src"})
+
+    assert key_coverage.get_missing_keys_by_locale() == {}
+    assert key_coverage.get_keys_by_missing_count() == {}
@@ -0,0 +1,340 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the key_matcher.py.
+"""
+
+import random
+import re
+
+import pytest
+
+from i18n_check.key_matcher import (
+    KeyMatcher,
+    KeyReplacer,
+    KeySegmentIndex,
+    SourceKeyExtractor,
+    get_i18n_key_pattern,
+    get_key_run_pattern,
+    iter_i18n_keys,
+)
+from i18n_check.utils import (
+    config_nonexistent_keys_key_prefixes,
+    config_nonexistent_keys_key_quotes,
+)
+
+# Note: The patterns that keys were found with for each quote before the single pattern.
+OLD_I18N_KEY_PATTERNS = [
+    r"\'i18n\.[_\S\.]+?\'",
+    r"\"i18n\.[_\S\.]+?\"",
+    r"\`i18n\.[_\S\.]+?\`",
+]
+
+
+@pytest.mark.parametrize(
+    "keys, text, expected_output",
+    [
+        ([], "i18n.a", set()),
+        (["i18n.a"], "", set()),
+        (["i18n.a", "i18n.ab", "b"], "t('i18n.ab')", {"i18n.a", "i18n.ab", "b"}),
+        (["i18n.a_b", "a_b.c"], "i18n.a_b.c", {"i18n.a_b", "a_b.c"}),
+        (["i18n.a"], "i18n. a", set()),
+        (["i18n.a b"], "x = 'i18n.a b'", {"i18n.a b"}),
+        (["", "i18n.a"], "text", {""}),
+    ],
+)
+def test_key_matcher_find_keys(keys, text, expected_output) -> None:
+    assert KeyMatcher(keys=keys).find_keys(text=text) == expected_output
+
+
+@pytest.mark.parametrize(
+    "keys, text",
+    [
+        (["i18n.a", "i18n.ab", "b"], "t('i18n.ab')"),
+        (["i18n.ключ", "i18n.日本.語", "i18n.a"], "t('i18n.ключ'); t('i18n.日本.語')"),
+        (["i18n.a\u00a0b", "i18n.a"], "t('i18n.a\u00a0b')"),
+        (["i18n.a"], ""),
+    ],
+)
+def test_key_matcher_find_keys_in_bytes(keys, text) -> None:
+    key_matcher = KeyMatcher(keys=keys)
+
+    assert key_matcher.find_keys_in_bytes(
+        contents=text.encode("utf-8")
+    ) == key_matcher.find_keys(text=text)
+
+
+def test_key_matcher_match_run() -> None:
+    key_matcher = KeyMatcher(keys=["i18n.a", "i18n.ab", "b"])
+    run_pattern = get_key_run_pattern(keys=key_matcher.keys)
+
+    assert run_pattern is not None
+    assert run_pattern.findall("t('i18n.ab'); b.a") == ["i18n.ab", "b.a"]
+    assert key_matcher.match_run(run="i18n.ab") == {"i18n.a", "i18n.ab", "b"}
+    assert get_key_run_pattern(keys=["", ""]) is None
+
+
+def test_key_matcher_matches_substring_search() -> None:
+    """
+    Test that the matcher finds the same keys as checking each key with the `in` operator.
+    """
+    rng = random.Random(42)
+    alphabet = "ab._"
+    keys = list(
+        {
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6)))
+            for _ in range(200)
+        }
+    )
+    key_matcher = KeyMatcher(keys=keys)
+
+    for _ in range(50):
+        text = "".join(rng.choice(alphabet + " '") for _ in range(200))
+        assert key_matcher.find_keys(text=text) == {k for k in keys if k in text}
+
+
+@pytest.mark.parametrize(
+    "key, expected_output",
+    [
+        ("i18n.first.key", ["first.ts"]),
+        ("i18n.sec", []),
+        ("i18n.ke", ["first.ts", "second.ts"]),
+        ("i18n.shared", ["first.ts", "second.ts"]),
+        ("i18n.first.missing", []),
+        ("i18n", ["first.ts", "second.ts"]),
+        ("i18n.(first|second)", ["first.ts", "second.ts"]),
+    ],
+)
+def test_key_segment_index_candidate_files(key, expected_output) -> None:
+    key_segment_index = KeySegmentIndex(
+        files_to_check_contents={
+            "first.ts": "t('i18n.first.key'); i18n.shared",
+            "second.ts": "t(`i18n.${second}.key`); i18n.shared",
+        }
+    )
+    assert key_segment_index.candidate_files(key=key) == expected_output
+
+
+def test_key_segment_index_keeps_all_pattern_matches() -> None:
+    """
+    Test that no file with a match of a key search pattern is excluded from the candidates.
+    """
+    rng = random.Random(42)
+    alphabet = "ab._ "
+    files_to_check_contents = {
+        str(i): "".join(rng.choice(alphabet) for _ in range(100)) for i in range(30)
+    }
+    key_segment_index = KeySegmentIndex(files_to_check_contents=files_to_check_contents)
+
+    for _ in range(300):
+        key = "".join(rng.choice("ab._") for _ in range(rng.randint(1, 7)))
+        pattern = re.compile(r"[\S]*\.".join(key.split(".")))
+        matching_files = {
+            f
+            for f, contents in files_to_check_contents.items()
+            if pattern.search(contents)
+        }
+        assert matching_files <= set(key_segment_index.candidate_files(key=key))
+
+
+@pytest.mark.parametrize(
+    "replacements, text, expected_output",
+    [
+        ({}, "t('i18n.a')", ("t('i18n.a')", {})),
+        (
+            {"i18n.a": "i18n.b"},
+            "t('i18n.a') t('i18n.a')",
+            ("t('i18n.b') t('i18n.b')", {"i18n.a": 2}),
+        ),
+        (
+            {"i18n.a": "i18n.x", "i18n.a_b": "i18n.y"},
+            "t('i18n.a_b') t(`i18n.a.${c}`)",
+            ("t('i18n.y') t(`i18n.x.${c}`)", {"i18n.a_b": 1, "i18n.a": 1}),
+        ),
+        ({"i18n.a": "i18n.b", "i18n.b": "i18n.c"}, "i18n.a", ("i18n.b", {"i18n.a": 1})),
+        ({"": "i18n.a"}, "text", ("text", {})),
+    ],
+)
+def test_key_replacer_replace_keys(replacements, text, expected_output) -> None:
+    assert (
+        KeyReplacer(replacements=replacements).replace_keys(text=text)
+        == expected_output
+    )
+
+
+def test_key_replacer_matches_sequential_replacement() -> None:
+    random.seed(0)
+    keys = [f"i18n.{random.choice('abc')}_{i}" for i in range(50)]
+    replacements = {k: k.upper() for k in keys}
+    text = " ".join(f"t('{random.choice(keys)}')" for _ in range(500))
+
+    expected_text = text
+    # Note: Longest first as the sequential replacement would otherwise replace prefixes of keys.
+    for old in sorted(replacements, key=len, reverse=True):
+        expected_text = expected_text.replace(old, replacements[old])
+
+    assert (
+        KeyReplacer(replacements=replacements).replace_keys(text=text)[0]
+        == expected_text
+    )
+
+
+@pytest.mark.parametrize(
+    "key_prefixes, key_quotes, text, expected_output",
+    [
+        (
+            ["i18n."],
+            ["'", '"', "`"],
+            "t('i18n.a'), t(\"i18n.b\"), t(`i18n.c`), t('i18n.d\"), x.i18n.e'",
+            ["i18n.a", "i18n.b", "i18n.c"],
+        ),
+        (["i18n."], ["'"], "t('i18n.a b'), t('i18n.'), t('i18n.c\"d')", ['i18n.c"d']),
+        (["i18n.", "t:"], ["'"], "t('t:a'), t('i18n.b'), t('x:c')", ["t:a", "i18n.b"]),
+        (["i18n."], ["'"], "'i18n.a'i18n.b'i18n.c'", ["i18n.a", "i18n.c"]),
+        (["i18n.", "t:"], ["'"], "'t:a'i18n.b'i18n.c'", ["t:a", "i18n.c"]),
+        (["msg_"], ['"""', "'"], 'm("""msg_a""") m(\'msg_b\')', ["msg_a", "msg_b"]),
+        ([""], ["'"], "t('a.b'), t('c d')", ["a.b"]),
+    ],
+)
+def test_get_i18n_key_pattern(key_prefixes, key_quotes, text, expected_output) -> None:
+    key_pattern = re.compile(
+        get_i18n_key_pattern(key_prefixes=key_prefixes, key_quotes=key_quotes)
+    )
+
+    assert list(iter_i18n_keys(key_pattern=key_pattern, text=text)) == expected_output
+
+
+@pytest.mark.parametrize(
+    "text, expected_output",
+    [
+        ("'i18n.a'i18n.b'", ["i18n.a"]),
+        ("\"i18n.a'i18n.b'\"", ["i18n.b"]),
+        ("\"i18n.a\"'i18n.b'", ["i18n.a", "i18n.b"]),
+        ("'i18n.a''i18n.b'", ["i18n.a", "i18n.b"]),
+        ("`i18n.a` 'i18n.b\"", ["i18n.a"]),
+        ("'i18n.a\" \"i18n.b'", []),
+        ("t(\"i18n.a\", 'i18n.b', `i18n.c`)", ["i18n.a", "i18n.b", "i18n.c"]),
+    ],
+)
+def test_get_i18n_key_pattern_mixed_and_adjacent_quotes(text, expected_output) -> None:
+    old_pattern_keys = {
+        k[1:-1] for p in OLD_I18N_KEY_PATTERNS for k in re.findall(p, text)
+    }
+    # Keys are those of the old patterns other than keys that ran over a quote into the next one.
+    assert sorted(k for k in old_pattern_keys if not set(k) & set("'\"`")) == (
+        expected_output
+    )
+
+    # Patterns that start with the prefix and those that start with the quote find the same keys.
+    for key_prefixes in [["i18n."], ["i18n.", "x."]]:
+        key_pattern = re.compile(get_i18n_key_pattern(key_prefixes=key_prefixes))
+        assert sorted(iter_i18n_keys(key_pattern=key_pattern, text=text)) == (
+            expected_output
+        )
+
+
+def test_get_i18n_key_pattern_default_matches_quote_patterns() -> None:
+    key_pattern = re.compile(get_i18n_key_pattern())
+    rng = random.Random(0)
+    snippets = [
+        "t('i18n.a.b')",
+        't("i18n.c_d")',
+        "t(`i18n.e`)",
+        "'i18n.f g'",
+        'x = "str"',
+        "`tmpl ${a}`",
+        "'it''s'",
+        "i18n.h",
+        '"i18n."',
+        "\n",
+    ]
+    for _ in range(200):
+        text = " ".join(rng.choice(snippets) for _ in range(20))
+        quote_pattern_keys = {
+            k[1:-1] for p in OLD_I18N_KEY_PATTERNS for k in re.findall(p, text)
+        }
+
+        assert set(iter_i18n_keys(key_pattern=key_pattern, text=text)) == (
+            quote_pattern_keys
+        )
+
+
+def test_get_i18n_key_pattern_matches_left_to_right_search() -> None:
+    rng = random.Random(0)
+    snippets = ["'", '"', "`", "ab.", "cd.", "e", " "]
+    left_to_right_pattern = re.compile(r"(['\"`])((?:ab\.|cd\.)[^\s'\"`]+)\1")
+    prefix_first_pattern = re.compile(get_i18n_key_pattern(key_prefixes=["ab.", "cd."]))
+    # Note: A quote of another width that isn't in the texts makes the pattern start with the quote.
+    quote_first_pattern = re.compile(
+        get_i18n_key_pattern(
+            key_prefixes=["ab.", "cd."], key_quotes=["'", '"', "`", "<<"]
+        )
+    )
+    for _ in range(500):
+        text = "".join(rng.choice(snippets) for _ in range(30))
+        expected_keys = [k for _, k in left_to_right_pattern.findall(text)]
+
+        # Patterns that start with the prefix or the quote find keys as if the text were read from the start.
+        assert list(iter_i18n_keys(key_pattern=prefix_first_pattern, text=text)) == (
+            expected_keys
+        )
+        assert list(iter_i18n_keys(key_pattern=quote_first_pattern, text=text)) == (
+            expected_keys
+        )
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        "t('i18n.a.b'); t(\"i18n.c\"); t(`i18n.d_e`); t('i18n.a.b')",
+        "t('i18n.ключ.значение'); t('i18n.日本.語')",
+        "t('i18n.a\u00a0b'); t('i18n.c')",
+        "t('i18n.a\u00a0'i18n.b'); t('i18n.c\u2003d')",
+        "t('i18n.a b'); t('i18n.'); t(\"i18n.x'); t('i18n.y')",
+        "",
+    ],
+)
+def test_source_key_extractor(contents) -> None:
+    keys = ["i18n.a.b", "i18n.c", "i18n.ключ.значение", "i18n.a\u00a0b", "i18n.y"]
+    key_pattern = re.compile(get_i18n_key_pattern(key_prefixes=["i18n."]))
+
+    # Searching the encoded contents finds the same keys as searching the text.
+    assert SourceKeyExtractor(
+        key_matcher=KeyMatcher(keys=keys), key_pattern=key_pattern
+    )(contents=contents.encode("utf-8")) == {
+        "src-keys": sorted(KeyMatcher(keys=keys).find_keys(text=contents)),
+        "used-keys": sorted(
+            set(iter_i18n_keys(key_pattern=key_pattern, text=contents))
+        ),
+    }
+
+
+def test_source_key_extractor_with_key_pattern() -> None:
+    key_pattern = re.compile(
+        get_i18n_key_pattern(key_prefixes=["msg.", "i18n."], key_quotes=["'"])
+    )
+    source_key_extractor = SourceKeyExtractor(
+        key_matcher=KeyMatcher(keys=["msg.a", "msg.c"]), key_pattern=key_pattern
+    )
+    contents = "t('msg.a'); t('i18n.b'); t(\"msg.c\"); t('other.d')"
+
+    assert source_key_extractor(contents=contents.encode("utf-8")) == {
+        "src-keys": ["msg.a", "msg.c"],
+        "used-keys": ["i18n.b", "msg.a"],
+    }
+
+
+def test_get_i18n_key_pattern_config_defaults() -> None:
+    assert get_i18n_key_pattern() == get_i18n_key_pattern(
+        key_prefixes=config_nonexistent_keys_key_prefixes,
+        key_quotes=config_nonexistent_keys_key_quotes,
+    )
+
+
+@pytest.mark.parametrize("key_prefixes, key_quotes", [([], ["'"]), (["i18n."], [""])])
+def test_get_i18n_key_pattern_invalid(key_prefixes, key_quotes) -> None:
+    with pytest.raises(ValueError):
+        get_i18n_key_pattern(key_prefixes=key_prefixes, key_quotes=key_quotes)
+
+
+if __name__ == "__main__":
+    pytest.main()
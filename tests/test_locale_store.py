@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the locale_store.py.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from i18n_check.check.repeat_keys import find_repeat_keys
+from i18n_check.locale_store import (
+    LocaleFile,
+    LocaleScan,
+    LocaleStore,
+    get_locale_dict,
+    get_locale_scan,
+    get_locale_store,
+    is_stream_json,
+    iter_locale_pairs,
+    set_locale_store,
+    set_stream_json,
+)
+from i18n_check.utils import config_i18n_src_file, read_json_file
+
+
+@pytest.mark.parametrize(
+    "contents, first_unsorted_index",
+    [
+        ('{"b": 1, "a": 2}', 1),
+        ('{"a": 1, "a": 2, "b": {"a": 3}}', None),
+        ('{"a": {"b": 1}, "c": [{"b": 2}]}', None),
+        ('{"a.b": "x", "a_b": "y", "a": "z", "b": "w"}', 2),
+        ("[]", None),
+    ],
+)
+def test_locale_file_scan(contents, first_unsorted_index) -> None:
+    locale_file = LocaleFile(path="en-US.json", contents=contents)
+    data = json.loads(contents)
+    scan = locale_file.scan()
+
+    assert scan.repeat_keys == find_repeat_keys(contents)
+    assert scan.first_unsorted_index == first_unsorted_index
+    assert scan.is_nested == (
+        isinstance(data, dict) and any(isinstance(v, dict) for v in data.values())
+    )
+    if isinstance(data, dict):
+        assert locale_file.data == data
+        assert (scan.first_unsorted_index is None) == (list(data) == sorted(data))
+
+
+def test_get_locale_scan(tmp_path) -> None:
+    file_path = tmp_path / "en-US.json"
+    file_path.write_text('{"b": {"c": 1}, "a": 2, "a": 3}', encoding="utf-8")
+
+    scan = get_locale_scan(file_path=file_path)
+
+    assert scan == LocaleScan(
+        repeat_keys={"a": ["2", "3"]}, first_unsorted_index=1, is_nested=True
+    )
+    # The scan is reused from the result cache without parsing the file again.
+    with patch(
+        "i18n_check.locale_store.LocaleFile",
+        side_effect=AssertionError("Parsed again."),
+    ):
+        assert get_locale_scan(file_path=file_path) == scan
+
+
+def test_locale_file_pairs_and_view() -> None:
+    locale_file = LocaleFile(path="en-US.json", contents='{"b": 1, "a": 2, "b": 3}')
+
+    assert locale_file.pairs == (("b", 1), ("a", 2), ("b", 3))
+    assert dict(locale_file.data) == {"b": 3, "a": 2}
+
+    with pytest.raises(TypeError):
+        locale_file.data["c"] = 4  # type: ignore[index]
+
+
+def test_locale_store_parses_once(tmp_path) -> None:
+    file_path = tmp_path / "en-US.json"
+    file_path.write_text('{"a": 1}', encoding="utf-8")
+    store = LocaleStore()
+
+    first = store.get(file_path=file_path)
+    with patch("builtins.open", side_effect=AssertionError("File read again.")):
+        assert store.get(file_path=str(file_path)) is first
+
+    file_path.write_text('{"a": 1, "b": 2}', encoding="utf-8")
+    assert dict(store.get(file_path=file_path).data) == {"a": 1, "b": 2}
+
+
+def test_locale_store_load(tmp_path) -> None:
+    (tmp_path / "en-US.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "de.json").write_text("{}", encoding="utf-8")
+
+    assert sorted(f.path for f in LocaleStore().load(directory=tmp_path)) == [
+        str(tmp_path / "de.json"),
+        str(tmp_path / "en-US.json"),
+    ]
+
+
+def test_get_locale_dict() -> None:
+    assert get_locale_dict(file_path=config_i18n_src_file) == read_json_file(
+        file_path=config_i18n_src_file
+    )
+
+    store = LocaleStore()
+    set_locale_store(store)
+    assert get_locale_store() is store
+
+    set_locale_store(None)
+    assert get_locale_store() is not store
+
+
+if __name__ == "__main__":
+    pytest.main()
+
+
+@pytest.mark.parametrize("stream_json", [False, True])
+def test_iter_locale_pairs(tmp_path, stream_json) -> None:
+    file_path = tmp_path / "de.json"
+    file_path.write_text('{"b": "", "a": {"c": 1}, "b": "x"}', encoding="utf-8")
+    set_stream_json(stream_json)
+
+    assert list(iter_locale_pairs(file_path=file_path)) == [
+        ("b", ""),
+        ("a", {"c": 1}),
+        ("b", "x"),
+    ]
+    assert is_stream_json() == stream_json
+
+
+def test_stream_json_does_not_keep_files(tmp_path) -> None:
+    file_path = tmp_path / "de.json"
+    file_path.write_text('{"a": 1}', encoding="utf-8")
+    set_stream_json(True)
+    store = LocaleStore()
+
+    assert store.load(directory=tmp_path) == []
+    assert store.get(file_path=file_path) is not store.get(file_path=file_path)
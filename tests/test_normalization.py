@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the normalization.py.
+"""
+
+import random
+
+import pytest
+
+from i18n_check.normalization import normalize_value, normalize_values
+
+
+@pytest.mark.parametrize(
+    "value, unicode_aware, expected_output",
+    [
+        ("Hello, World!", False, "hello world!"),
+        ("Hello, World!", True, "hello world!"),
+        (1, False, 1),
+        (None, True, None),
+        ("Hello、世界。", False, "hello、世界。"),
+        ("Hello、世界。", True, "hello世界"),
+        ("مرحبا، عالم", True, "مرحبا عالم"),
+        ("«Bonjour» ¿Qué?", True, "bonjour qué"),
+        ("ＡＢＣ！", True, "abc!"),
+        ("Straße", True, "strasse"),
+        ("ﬁle", True, "file"),
+        ("$5 + 10%", True, "5  10"),
+    ],
+)
+def test_normalize_value(value, unicode_aware, expected_output) -> None:
+    assert normalize_value(value=value, unicode_aware=unicode_aware) == expected_output
+
+
+@pytest.mark.parametrize("unicode_aware", [False, True])
+def test_normalize_values_matches_normalize_value(unicode_aware) -> None:
+    """
+    Test that normalizing values at once gives the same results as normalizing each of them.
+    """
+    rng = random.Random(42)
+    alphabet = "aAΣσςΑ ÉéẞßİıＡ！!。،.,¿¡́̈ﬁ①Ǆ\x00"
+    for _ in range(500):
+        values: list[object] = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 6)))
+            for _ in range(rng.randint(0, 8))
+        ]
+        if rng.random() < 0.3:
+            values.insert(rng.randint(0, len(values)), 3)
+
+        assert normalize_values(values=iter(values), unicode_aware=unicode_aware) == [
+            normalize_value(value=v, unicode_aware=unicode_aware) for v in values
+        ]
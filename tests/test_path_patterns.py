@@ -0,0 +1,198 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the path_patterns.py.
+"""
+
+import os
+import re
+
+import pytest
+
+from i18n_check.path_patterns import (
+    GitignoreRules,
+    SkipRules,
+    get_parent_gitignore_rules,
+    glob_to_regex,
+    has_glob_magic,
+    is_gitignored,
+    is_glob,
+    resolve_glob,
+)
+
+
+@pytest.mark.parametrize(
+    "path, expected_output",
+    [
+        ("src/node_modules", False),
+        ("**/__generated__/**", True),
+        ("src/*.ts", True),
+        ("src/file?.ts", True),
+        ("src/[ab].ts", True),
+    ],
+)
+def test_has_glob_magic(path, expected_output) -> None:
+    assert has_glob_magic(path) == expected_output
+
+
+@pytest.mark.parametrize(
+    "pattern, path, expected_output",
+    [
+        ("**/*.stories.ts", "a.stories.ts", True),
+        ("**/*.stories.ts", "src/ui/a.stories.ts", True),
+        ("**/*.stories.ts", "src/ui/a.ts", False),
+        ("src/*.ts", "src/a.ts", True),
+        ("src/*.ts", "src/ui/a.ts", False),
+        ("src/**", "src/ui/a.ts", True),
+        ("src/**/a.ts", "src/a.ts", True),
+        ("file?.ts", "file1.ts", True),
+        ("file?.ts", "file/.ts", False),
+        ("file[0-9].ts", "file1.ts", True),
+        ("file[!0-9].ts", "file1.ts", False),
+        ("file[!0-9].ts", "filea.ts", True),
+        ("file[.ts", "file[.ts", True),
+        ("a.ts", "a_ts", False),
+        ("\\*.ts", "*.ts", True),
+        ("\\*.ts", "a.ts", False),
+    ],
+)
+def test_glob_to_regex(pattern, path, expected_output) -> None:
+    assert (re.fullmatch(glob_to_regex(pattern), path) is not None) == expected_output
+
+
+def test_resolve_glob(tmp_path) -> None:
+    (tmp_path / "real").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "real")
+
+    assert resolve_glob(str(tmp_path / "link" / "**" / "*.ts")) == os.path.join(
+        os.path.realpath(tmp_path / "real"), "**", "*.ts"
+    )
+
+
+def test_is_glob(tmp_path) -> None:
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "pages" / "[id].vue").write_text("", encoding="utf-8")
+
+    assert not is_glob(str(tmp_path / "pages" / "[id].vue"))
+    assert is_glob(str(tmp_path / "pages" / "[ab].vue"))
+    assert not is_glob(str(tmp_path / "pages"))
+
+
+def test_skip_rules_bracketed_route_paths(tmp_path) -> None:
+    root = os.path.realpath(tmp_path)
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "pages" / "[id].vue").write_text("", encoding="utf-8")
+    (tmp_path / "app" / "[locale]").mkdir(parents=True)
+
+    skip_rules = SkipRules(
+        directories_to_skip=[os.path.join(root, "app", "[locale]")],
+        files_to_skip=[os.path.join(root, "pages", "[id].vue")],
+    )
+
+    assert skip_rules.skips_file(os.path.join(root, "pages", "[id].vue"))
+    assert not skip_rules.skips_file(os.path.join(root, "pages", "i.vue"))
+    assert skip_rules.skips_directory(os.path.join(root, "app", "[locale]"))
+    assert not skip_rules.skips_directory(os.path.join(root, "app", "l"))
+    assert skip_rules.skips_file_or_directory(
+        os.path.join(root, "app", "[locale]", "page.vue")
+    )
+
+    # Paths that don't exist are also skipped literally if they're given as they are.
+    skip_rules = SkipRules(
+        directories_to_skip=[os.path.join(root, "missing", "[locale]")],
+        files_to_skip=[os.path.join(root, "missing", "[id].vue")],
+    )
+
+    assert skip_rules.skips_file(os.path.join(root, "missing", "[id].vue"))
+    assert skip_rules.skips_directory(os.path.join(root, "missing", "[locale]"))
+
+
+def test_skip_rules() -> None:
+    root = os.path.realpath(os.sep)
+    skip_rules = SkipRules(
+        directories_to_skip=[
+            os.path.join(root, "src", "node_modules"),
+            os.path.join(root, "src", "**", "__generated__", "**"),
+        ],
+        files_to_skip=[
+            os.path.join(root, "src", "main.ts"),
+            os.path.join(root, "src", "**", "*.stories.ts"),
+        ],
+    )
+
+    assert skip_rules.skips_directory(os.path.join(root, "src", "node_modules"))
+    assert skip_rules.skips_directory(os.path.join(root, "src", "__generated__"))
+    assert skip_rules.skips_directory(os.path.join(root, "src", "a", "__generated__"))
+    assert not skip_rules.skips_directory(os.path.join(root, "src", "generated"))
+
+    assert skip_rules.skips_file(os.path.join(root, "src", "main.ts"))
+    assert skip_rules.skips_file(os.path.join(root, "src", "ui", "a.stories.ts"))
+    assert not skip_rules.skips_file(os.path.join(root, "src", "ui", "a.ts"))
+    assert not skip_rules.skips_file(os.path.join(root, "src", "node_modules", "a.ts"))
+
+    assert skip_rules.skips_file_or_directory(
+        os.path.join(root, "src", "node_modules", "pkg", "a.ts")
+    )
+    assert skip_rules.skips_file_or_directory(
+        os.path.join(root, "src", "a", "__generated__", "b", "c.ts")
+    )
+    assert not skip_rules.skips_file_or_directory(
+        os.path.join(root, "src", "node_modules_a.ts")
+    )
+
+
+@pytest.mark.parametrize(
+    "relative_path, is_directory, expected_output",
+    [
+        ("build", True, True),
+        ("src/build", True, True),
+        ("build", False, None),
+        ("src/a.log", False, True),
+        ("src/important.log", False, False),
+        ("top.ts", False, True),
+        ("src/top.ts", False, None),
+        ("docs/api", True, True),
+        ("src/docs/api", True, None),
+        ("a.ts", False, None),
+        ("#comment", False, None),
+    ],
+)
+def test_gitignore_rules_match(relative_path, is_directory, expected_output) -> None:
+    rules = GitignoreRules(
+        directory=os.sep,
+        lines=[
+            "# Build outputs\n",
+            "build/\n",
+            "*.log  \n",
+            "!important.log\n",
+            "\n",
+            "/top.ts\n",
+            "docs/api/\n",
+        ],
+    )
+
+    assert rules.match(relative_path, is_directory) == expected_output
+
+
+def test_is_gitignored_nested_rules(tmp_path) -> None:
+    root = os.path.realpath(tmp_path)
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".gitignore").write_text("*.gen.ts\n", encoding="utf-8")
+    (tmp_path / "src").mkdir()
+
+    parent_rules = get_parent_gitignore_rules(os.path.join(root, "src"))
+    src_rules = GitignoreRules(
+        directory=os.path.join(root, "src"), lines=["!keep.gen.ts\n"]
+    )
+
+    assert len(parent_rules) == 1
+    assert is_gitignored(
+        os.path.join(root, "src", "a.gen.ts"),
+        is_directory=False,
+        gitignore_rules=parent_rules,
+    )
+    assert not is_gitignored(
+        os.path.join(root, "src", "keep.gen.ts"),
+        is_directory=False,
+        gitignore_rules=(*parent_rules, src_rules),
+    )
+    assert get_parent_gitignore_rules(root) == ()
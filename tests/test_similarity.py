@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the similarity.py.
+"""
+
+import itertools
+import random
+
+import pytest
+
+from i18n_check.similarity import (
+    cluster_similar_values,
+    find_similar_pairs,
+    get_shingles,
+    get_similarity_threshold,
+    jaccard_similarity,
+    set_similarity_threshold,
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected_output",
+    [
+        ("sign in", {"sig", "ign", "gni", "nin"}),
+        ("signin", {"sig", "ign", "gni", "nin"}),
+        ("aaaa", {"aaa"}),
+        ("ok", {"ok"}),
+        ("", {""}),
+    ],
+)
+def test_get_shingles(value, expected_output) -> None:
+    assert get_shingles(value) == expected_output
+
+
+def test_jaccard_similarity() -> None:
+    assert jaccard_similarity(get_shingles("sign in"), get_shingles("signin")) == 1
+    assert jaccard_similarity(
+        get_shingles("sign in"), get_shingles("signin now")
+    ) == pytest.approx(4 / 7)
+    assert jaccard_similarity(get_shingles("save"), get_shingles("cancel")) == 0
+
+
+@pytest.mark.parametrize("similarity_threshold", [0.3, 0.5, 0.75, 0.8, 1.0])
+def test_find_similar_pairs_matches_all_pairs(similarity_threshold) -> None:
+    rng = random.Random(0)
+    words = ["sign", "in", "now", "save", "changes", "the", "your", "account", "up"]
+    values = list(
+        dict.fromkeys(
+            " ".join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+            for _ in range(300)
+        )
+    )
+    shingles = [get_shingles(v) for v in values]
+
+    expected_pairs = [
+        (i, j, jaccard_similarity(shingles[i], shingles[j]))
+        for i, j in itertools.combinations(range(len(values)), 2)
+        if jaccard_similarity(shingles[i], shingles[j]) >= similarity_threshold
+    ]
+
+    assert (
+        find_similar_pairs(values=values, similarity_threshold=similarity_threshold)
+        == expected_pairs
+    )
+
+
+@pytest.mark.parametrize("similarity_threshold", [0, -0.5, 1.5])
+def test_find_similar_pairs_invalid_threshold(similarity_threshold) -> None:
+    with pytest.raises(ValueError):
+        find_similar_pairs(values=["a"], similarity_threshold=similarity_threshold)
+
+
+def test_cluster_similar_values() -> None:
+    values = ["sign in", "save", "signin now", "cancel", "signin", "save changes"]
+
+    assert cluster_similar_values(values=values, similarity_threshold=0.5) == [
+        ["sign in", "signin now", "signin"]
+    ]
+    assert cluster_similar_values(values=values, similarity_threshold=0.2) == [
+        ["sign in", "signin now", "signin"],
+        ["save", "save changes"],
+    ]
+    assert cluster_similar_values(values=[], similarity_threshold=0.5) == []
+
+
+def test_set_similarity_threshold() -> None:
+    assert get_similarity_threshold() is None
+
+    set_similarity_threshold(0.8)
+    assert get_similarity_threshold() == 0.8
@@ -27,6 +27,8 @@ from i18n_check.utils import (
     read_files_to_dict,
     read_json_file,
     replace_text_in_file,
+    replace_texts_in_file,
+    replace_texts_in_files,
 )
 
 # MARK: Test Variables
@@ -131,6 +133,108 @@ class TestUtils(unittest.TestCase):
             assert skipped_file not in result
             assert file_in_skip_dir not in result
 
+    def test_collect_files_to_check_walk(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = os.path.realpath(temp_dir)
+            for d in ["a/b", "node_modules/pkg", "other"]:
+                os.makedirs(os.path.join(temp_dir, d))
+
+            for f in ["z.ts", "a/y.ts", "a/b/x.ts", "a/.ts", "a/w.d.ts", "a/v.js"]:
+                with open(os.path.join(temp_dir, f), "w", encoding="utf-8") as file:
+                    file.write("test")
+
+            with open(
+                os.path.join(temp_dir, "node_modules/pkg/u.ts"), "w", encoding="utf-8"
+            ) as file:
+                file.write("test")
+
+            with open(
+                os.path.join(temp_dir, "other/t.ts"), "w", encoding="utf-8"
+            ) as file:
+                file.write("test")
+
+            os.symlink(
+                os.path.join(temp_dir, "other"), os.path.join(temp_dir, "a/link")
+            )
+            os.symlink(
+                os.path.join(temp_dir, "other/t.ts"), os.path.join(temp_dir, "a/s.ts")
+            )
+
+            with unittest.mock.patch(
+                "i18n_check.utils.os.scandir", wraps=os.scandir
+            ) as mock_scandir:
+                result = collect_files_to_check(
+                    directory=os.path.join(temp_dir, "a", ".."),
+                    file_types_to_check=["ts"],
+                    directories_to_skip=[Path(temp_dir) / "node_modules"],
+                    files_to_skip=[Path(temp_dir) / "a" / "b" / "x.ts"],
+                )
+
+            # Files of a directory come before those of its subdirectories, and symlinks are resolved.
+            assert result[0] == os.path.join(temp_dir, "z.ts")
+            assert sorted(result) == sorted(
+                os.path.join(temp_dir, f)
+                for f in ["z.ts", "a/y.ts", "a/w.d.ts", "other/t.ts", "other/t.ts"]
+            )
+            # Skipped directories and symlinks to directories aren't walked.
+            scanned_dirs = {str(c.args[0]) for c in mock_scandir.call_args_list}
+            assert os.path.join(temp_dir, "node_modules") not in scanned_dirs
+            assert os.path.join(temp_dir, "a/link") not in scanned_dirs
+
+    def test_collect_files_to_check_globs_and_gitignore(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = os.path.realpath(temp_dir)
+            for d in [".git", "src/__generated__/api", "src/ui", "src/build"]:
+                os.makedirs(os.path.join(temp_dir, d))
+
+            for f in [
+                "src/a.ts",
+                "src/__generated__/api/b.ts",
+                "src/ui/c.ts",
+                "src/ui/c.stories.ts",
+                "src/build/d.ts",
+                "src/e.log.ts",
+            ]:
+                with open(os.path.join(temp_dir, f), "w", encoding="utf-8") as file:
+                    file.write("test")
+
+            with open(
+                os.path.join(temp_dir, ".gitignore"), "w", encoding="utf-8"
+            ) as file:
+                file.write("build/\n*.log.ts\n")
+
+            with unittest.mock.patch(
+                "i18n_check.utils.os.scandir", wraps=os.scandir
+            ) as mock_scandir:
+                result = collect_files_to_check(
+                    directory=os.path.join(temp_dir, "src"),
+                    file_types_to_check=[".ts"],
+                    directories_to_skip=[
+                        Path(temp_dir) / "**" / "__generated__" / "**"
+                    ],
+                    files_to_skip=[Path(temp_dir) / "**" / "*.stories.ts"],
+                    respect_gitignore=True,
+                )
+
+            assert sorted(result) == [
+                os.path.join(temp_dir, "src/a.ts"),
+                os.path.join(temp_dir, "src/ui/c.ts"),
+            ]
+            # Skipped and ignored directories aren't walked.
+            scanned_dirs = {str(c.args[0]) for c in mock_scandir.call_args_list}
+            assert os.path.join(temp_dir, "src/__generated__") not in scanned_dirs
+            assert os.path.join(temp_dir, "src/build") not in scanned_dirs
+
+            result = collect_files_to_check(
+                directory=os.path.join(temp_dir, "src"),
+                file_types_to_check=[".ts"],
+                directories_to_skip=[],
+                files_to_skip=[],
+                respect_gitignore=False,
+            )
+
+            assert len(result) == 6
+
     def test_get_all_json_files(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             json_file_1 = os.path.join(temp_dir, "file1.json")
@@ -227,6 +331,61 @@ def test_print_output_on_no_replacement(tmp_path, capsys):
     assert output == ""
 
 
+def test_replace_texts_in_file_longest_first(tmp_path, capsys):
+    file_path = tmp_path / "sample.ts"
+    file_path.write_text(
+        't("i18n.key") t("i18n.key_suffix") t("i18n.other")', encoding="utf-8"
+    )
+
+    replacement_count = replace_texts_in_file(
+        file_path,
+        replacements={"i18n.key": "i18n.new_key", "i18n.key_suffix": "i18n.key"},
+    )
+
+    # Replacements are made in one pass so replaced text isn't replaced again.
+    assert file_path.read_text(encoding="utf-8") == (
+        't("i18n.new_key") t("i18n.key") t("i18n.other")'
+    )
+    assert replacement_count == 2
+
+    output = capsys.readouterr().out
+    assert "✨ Replaced 2 keys" in output
+    assert "replacements)" in output
+
+
+def test_replace_texts_in_files(tmp_path):
+    changed_file = tmp_path / "changed.ts"
+    changed_file.write_text("i18n.a i18n.a i18n.b", encoding="utf-8")
+    unchanged_file = tmp_path / "unchanged.ts"
+    unchanged_file.write_text("i18n.c", encoding="utf-8")
+    os.utime(unchanged_file, ns=(0, 0))
+
+    replacement_counts = replace_texts_in_files(
+        [str(changed_file), str(unchanged_file)],
+        replacements={"i18n.a": "i18n.x", "i18n.b": "i18n.y"},
+    )
+
+    assert replacement_counts == {str(changed_file): 3}
+    assert changed_file.read_text(encoding="utf-8") == "i18n.x i18n.x i18n.y"
+    assert unchanged_file.stat().st_mtime_ns == 0
+    assert replace_texts_in_files([str(changed_file)], replacements={}) == {}
+
+
+def test_replace_texts_in_files_passes_read_contents(tmp_path):
+    file_path = tmp_path / "changed.ts"
+    file_path.write_text("i18n.a", encoding="utf-8")
+
+    # Files are compared with the contents that were read for the replacements rather than being read again.
+    with unittest.mock.patch(
+        "i18n_check.utils.write_files", return_value=[str(file_path)]
+    ) as mock_write_files:
+        replace_texts_in_files([str(file_path)], replacements={"i18n.a": "i18n.b"})
+
+    assert mock_write_files.call_args.kwargs["old_contents"] == {
+        str(file_path): "i18n.a"
+    }
+
+
 @pytest.mark.parametrize(
     "input_path, expected_key",
     [
@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the watch.py.
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from i18n_check.intermediates import get_intermediate, set_intermediates
+from i18n_check.utils import config_i18n_src_file
+from i18n_check.watch import CheckWatcher, get_changed_paths, get_file_stats
+
+
+@pytest.fixture
+def src_dir(tmp_path):
+    (tmp_path / "skip_dir").mkdir()
+    (tmp_path / "first.ts").write_text("first", encoding="utf-8")
+    (tmp_path / "en-US.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "ignored.py").write_text("ignored", encoding="utf-8")
+    (tmp_path / "skip_dir" / "skipped.ts").write_text("skipped", encoding="utf-8")
+
+    return tmp_path.resolve()
+
+
+def test_get_file_stats(src_dir) -> None:
+    file_stats = get_file_stats(
+        directories=[src_dir],
+        file_types=[".ts", ".json"],
+        directories_to_skip=[src_dir / "skip_dir"],
+    )
+
+    assert sorted(Path(f).name for f in file_stats) == ["en-US.json", "first.ts"]
+
+
+def test_get_changed_paths(src_dir) -> None:
+    def get_stats() -> dict[str, tuple[int, int]]:
+        return get_file_stats(
+            directories=[src_dir], file_types=[".ts"], directories_to_skip=[]
+        )
+
+    old_stats = get_stats()
+    assert get_changed_paths(old_stats=old_stats, new_stats=get_stats()) == []
+
+    (src_dir / "first.ts").write_text("first changed", encoding="utf-8")
+    (src_dir / "second.ts").write_text("second", encoding="utf-8")
+    os.remove(src_dir / "skip_dir" / "skipped.ts")
+
+    assert get_changed_paths(old_stats=old_stats, new_stats=get_stats()) == [
+        src_dir / "first.ts",
+        src_dir / "second.ts",
+        src_dir / "skip_dir" / "skipped.ts",
+    ]
+
+
+@patch("i18n_check.watch.run_check", side_effect=[True, ValueError("failed")])
+def test_check_watcher_run_checks(mock_run_check) -> None:
+    watcher = CheckWatcher()
+
+    assert not watcher.run_checks(check_names=["repeat-keys", "sorted-keys"])
+    assert mock_run_check.call_count == 2
+    assert mock_run_check.call_args.kwargs["all_checks_enabled"]
+
+
+def test_check_watcher_updates_i18n_src_dict() -> None:
+    watcher = CheckWatcher()
+    set_intermediates({"i18n-src-dict": {"i18n.old_key": "Old"}})
+
+    with patch(
+        "i18n_check.intermediates.read_json_file",
+        return_value={"i18n.new_key": "New"},
+    ):
+        watcher.update(changed_paths=[config_i18n_src_file])
+
+        assert get_intermediate("i18n-src-dict") == {"i18n.new_key": "New"}
+
+
+if __name__ == "__main__":
+    pytest.main()